@@ -0,0 +1,86 @@
+"""Vectorised NumPy risk and return metrics for portfolio value series"""
+import numpy as np
+
+TRADING_DAYS = 252
+
+
+def simple_returns(values) -> np.ndarray:
+    """Period-over-period returns of a value series"""
+    values = np.asarray(values, dtype=np.float64)
+    if values.size < 2:
+        return np.empty(0)
+    prev = values[:-1]
+    return np.divide(values[1:] - prev, prev, out=np.zeros_like(prev), where=prev != 0)
+
+
+def drawdown(returns) -> np.ndarray:
+    """Drawdown from the running peak of the compounded returns"""
+    cum = np.cumprod(1 + np.asarray(returns, dtype=np.float64))
+    return cum / np.maximum.accumulate(cum) - 1
+
+
+def max_drawdown(returns) -> float:
+    dd = drawdown(returns)
+    return float(dd.min()) if dd.size else 0.0
+
+
+def sharpe_ratio(returns, risk_free: float = 0.0, periods: int = TRADING_DAYS) -> float:
+    """Annualised Sharpe ratio; risk_free is an annual rate"""
+    excess = np.asarray(returns, dtype=np.float64) - risk_free / periods
+    if excess.size < 2:
+        return 0.0
+    std = excess.std(ddof=1)
+    return float(excess.mean() / std * np.sqrt(periods)) if std > 0 else 0.0
+
+
+def annualized_volatility(returns, periods: int = TRADING_DAYS) -> float:
+    returns = np.asarray(returns, dtype=np.float64)
+    return float(returns.std(ddof=1) * np.sqrt(periods)) if returns.size > 1 else 0.0
+
+
+def annualized_return(returns, periods: int = TRADING_DAYS) -> float:
+    returns = np.asarray(returns, dtype=np.float64)
+    if returns.size == 0:
+        return 0.0
+    growth = np.prod(1 + returns)
+    return float(growth ** (periods / returns.size) - 1) if growth > 0 else -1.0
+
+
+def beta(returns, benchmark_returns) -> float:
+    """Sensitivity of returns to the benchmark's returns"""
+    returns = np.asarray(returns, dtype=np.float64)
+    benchmark_returns = np.asarray(benchmark_returns, dtype=np.float64)
+    if returns.size < 2 or returns.size != benchmark_returns.size:
+        return 0.0
+    var = benchmark_returns.var(ddof=1)
+    return float(np.cov(returns, benchmark_returns, ddof=1)[0, 1] / var) if var > 0 else 0.0
+
+
+def position_pl(current, open_, average, quantity):
+    """Value, P/L, P/L %, daily P/L and daily P/L % for arrays of positions; open_ <= 0 or NaN means no daily change"""
+    current, open_, average, quantity = (np.asarray(a, dtype=np.float64) for a in (current, open_, average, quantity))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        value = current * quantity
+        investment = average * quantity
+        pl = value - investment
+        pl_pct = np.where(investment > 0, pl / investment * 100, 0.0)
+        has_open = open_ > 0
+        daily_pl = np.where(has_open, (current - open_) * quantity, 0.0)
+        daily_pct = np.where(has_open, (current - open_) / open_ * 100, 0.0)
+    return value, pl, pl_pct, daily_pl, daily_pct
+
+
+def performance_metrics(values, benchmark_values=None) -> dict:
+    """All dashboard metrics for a daily value series, optionally against a benchmark series"""
+    returns = simple_returns(values)
+    metrics = {
+        'Total Return': float(np.prod(1 + returns) - 1) if returns.size else 0.0,
+        'Annualized Return': annualized_return(returns),
+        'Sharpe Ratio': sharpe_ratio(returns),
+        'Max Drawdown': max_drawdown(returns),
+        'Volatility': annualized_volatility(returns),
+        'Beta': 0.0,
+    }
+    if benchmark_values is not None:
+        metrics['Beta'] = beta(returns, simple_returns(benchmark_values))
+    return metrics
@@ -3,26 +3,68 @@ import random
 import os
 import json
 import time
+import io
+import re
+import csv
+import shutil
+import zipfile
+import hashlib
+import importlib.util
 from queue import Queue
+from collections import deque
+from itertools import islice
+from bisect import insort
+from concurrent.futures import ThreadPoolExecutor
 import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import threading
 import warnings
+from functools import lru_cache
 import matplotlib.dates as mdates
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QLabel, QPushButton, QListWidget, QStackedWidget, QLineEdit,
                             QTableWidget, QTableWidgetItem, QComboBox, QSpinBox, 
                             QDoubleSpinBox, QDateEdit, QMessageBox, QFileDialog, QDialog,
                             QTabWidget, QSizePolicy, QFrame, QHeaderView, QTextEdit,
-                            QInputDialog, QFontDialog, QLabel)  # Added QInputDialog here
-from PyQt5.QtCore import Qt, QDate, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QColor, QFont, QIcon
+                            QInputDialog, QFontDialog, QLabel, QTableView)  # Added QInputDialog here
+from PyQt5.QtCore import (Qt, QDate, QThread, pyqtSignal, QTimer, QRunnable, QThreadPool,
+                          QAbstractTableModel, QModelIndex, QObject)
+from PyQt5.QtGui import QColor, QBrush, QFont, QIcon
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
-from matplotlib.ticker import FuncFormatter
+from matplotlib.ticker import StrMethodFormatter
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, fall back to np.bincount
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
+# Faster Excel engines when installed; None lets pandas pick its default.
+# xlsxwriter's constant_memory mode is not used because pandas writes
+# cells column by column and that mode only accepts rows in order.
+EXCEL_WRITE_ENGINE = 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') else None
+EXCEL_READ_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') else None
+
+# pyarrow is optional (without it portfolios stay in JSON) and slow to
+# import, so it is only loaded the first time storage or export needs it
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+@lru_cache(maxsize=1)
+def arrow():
+    """pyarrow with its csv, feather and parquet submodules loaded"""
+    import pyarrow
+    import pyarrow.csv
+    import pyarrow.feather
+    import pyarrow.parquet
+    return pyarrow
 
 # Suppress warnings
 warnings.filterwarnings("ignore", category=FutureWarning)
@@ -31,6 +73,403 @@ warnings.filterwarnings("ignore", category=UserWarning)
 
 plt.style.use('dark_background')
 
+# Colormap samples are built once instead of on every redraw
+TAB20C_COLORS = plt.cm.tab20c(np.arange(20))
+
+def tab20c_colors(n):
+    """First n tab20c colors, repeating the palette past 20"""
+    if n <= len(TAB20C_COLORS):
+        return TAB20C_COLORS[:n]
+    return np.resize(TAB20C_COLORS, (n, 4))
+
+@lru_cache(maxsize=32)
+def viridis_colors(n):
+    """n viridis colors spread over the 0.2-0.8 band"""
+    return plt.cm.viridis(np.linspace(0.2, 0.8, n))
+
+def pie_value_labels(values, min_pct=0.0):
+    """Precomputed '₹value (pct%)' wedge labels, blank below min_pct"""
+    values = np.asarray(values, dtype=np.float64)
+    pcts = values / values.sum() * 100.0
+    return [f'₹{v:,.0f}\n({p:.1f}%)' if p >= min_pct else ''
+            for v, p in zip(values, pcts)]
+
+def add_wedge_labels(ax, wedges, labels, distance, **textprops):
+    """Place one label per wedge at its mid-angle, like autopct does"""
+    texts = []
+    for wedge, label in zip(wedges, labels):
+        theta = np.deg2rad((wedge.theta1 + wedge.theta2) / 2)
+        x = wedge.center[0] + distance * wedge.r * np.cos(theta)
+        y = wedge.center[1] + distance * wedge.r * np.sin(theta)
+        texts.append(ax.text(x, y, label, ha='center', va='center', **textprops))
+    return texts
+
+@lru_cache(maxsize=1)
+def simulated_performance(day):
+    """Placeholder 30-day performance series, stable for a given day"""
+    rng = np.random.default_rng(seed=42)
+    dates = pd.date_range(end=day, periods=30, freq='D')
+    performance = np.cumsum(rng.standard_normal(30) * 10000 + 5000)
+    return dates, performance
+
+def top_k_indices(values, k):
+    """Indices of the k largest values, largest first, via partial selection"""
+    k = min(k, values.size)
+    if k == 0:
+        return np.array([], dtype=int)
+    idx = np.argpartition(-values, k - 1)[:k]
+    return idx[np.argsort(-values[idx], kind='stable')]
+
+SCANNER_COLUMNS = ['Symbol', 'Name', 'Price', 'Change', '% Change', 'Volume']
+
+def scanner_frame(stocks):
+    """Scanner placeholder rows with volume pre-parsed to millions"""
+    df = pd.DataFrame(stocks, columns=SCANNER_COLUMNS)
+    df['Volume (M)'] = df['Volume'].str[:-1].astype(float)
+    return df
+
+SCANNER_STOCKS = {
+    'IN': scanner_frame([
+        ("RELIANCE", "Reliance Industries", 2500.50, 45.75, 1.86, "10.5M"),
+        ("TCS", "Tata Consultancy", 3200.25, -32.50, -1.01, "5.2M"),
+        ("HDFCBANK", "HDFC Bank", 1500.75, 22.25, 1.50, "8.1M"),
+        ("INFY", "Infosys", 1600.00, -15.00, -0.93, "4.3M"),
+        ("HINDUNILVR", "Hindustan Unilever", 2400.50, 12.75, 0.53, "2.7M")
+    ]),
+    'US': scanner_frame([
+        ("AAPL", "Apple Inc.", 175.50, 2.75, 1.59, "25.3M"),
+        ("MSFT", "Microsoft", 300.25, -1.50, -0.50, "18.7M"),
+        ("AMZN", "Amazon", 3200.75, 45.25, 1.43, "5.1M"),
+        ("GOOGL", "Alphabet", 2700.00, -22.00, -0.81, "3.8M"),
+        ("TSLA", "Tesla", 750.50, 15.75, 2.15, "15.2M")
+    ])
+}
+
+def prepare_sector_allocation(data):
+    """Sector totals and wedge labels for the analysis pie chart
+
+    Returns (sector_data, value_labels, message); sector_data is None and
+    message explains why when there is nothing to plot.
+    """
+    # Filter out NaN values and ensure we have data
+    if data is None or data.empty:
+        return None, None, "No data available"
+        
+    if 'Sector' not in data.columns:
+        return None, None, "No sector data available"
+        
+    # Clean the data with one combined mask over the raw arrays
+    sectors = data['Sector'].to_numpy()
+    qty = data['Quantity'].to_numpy(dtype=np.float64)
+    if 'Current Value' in data.columns:
+        values = data['Current Value'].to_numpy(dtype=np.float64)
+    else:
+        values = qty * data['Purchase Price'].to_numpy(dtype=np.float64)
+    mask = (qty > 0) & pd.notna(sectors)  # Only active holdings with a sector
+    
+    if not mask.any():
+        return None, None, "No sector data available"
+    
+    # Group by sector
+    sectors, totals = group_sum(sectors[mask], values[mask])
+    sector_data = pd.Series(totals, index=sectors)
+    sector_data = sector_data[sector_data > 0]  # Remove zero values
+    
+    if len(sector_data) == 0:
+        return None, None, "No valid sector data"
+    
+    # Sort by value
+    sector_data = sector_data.sort_values(ascending=False)
+    return sector_data, pie_value_labels(sector_data.values), None
+
+EXPORT_DPI = 150
+
+def export_bbox(fig):
+    """Tight bounding box from the figure's last on-screen draw
+
+    Passing this to savefig skips the extra full draw that
+    bbox_inches='tight' does to measure the figure.
+    """
+    renderer = fig.canvas.get_renderer()
+    return fig.get_tightbbox(renderer).padded(0.1)
+
+ANALYSIS_KEY_COLUMNS = ['Stock Name', 'Fund Name', 'Quantity', 'Purchase Price',
+                        'Current Value', 'Sector']
+
+def frame_key(data):
+    """Cheap content hash of the columns the analysis charts depend on"""
+    if data is None or data.empty:
+        return None
+    cols = [c for c in ANALYSIS_KEY_COLUMNS if c in data.columns]
+    hashed = pd.util.hash_pandas_object(data[cols], index=False)
+    return (len(data), tuple(cols), int(hashed.sum()))
+
+# Above this many rows the argsort in group_sum is replaced by a hash bucket sum
+LARGE_GROUP_ROWS = 5000
+
+if njit is not None:
+    @njit(cache=True)
+    def bucket_sum(codes, values, n):
+        out = np.zeros(n)
+        for i in range(codes.shape[0]):
+            out[codes[i]] += values[i]
+        return out
+else:
+    def bucket_sum(codes, values, n):
+        return np.bincount(codes, weights=values, minlength=n)
+
+def group_sum(names, values):
+    """Sum values per unique name with a sorted np.add.reduceat pass"""
+    names = np.asarray(names, dtype=object)
+    values = np.nan_to_num(np.asarray(values, dtype=np.float64))
+
+    # Drop missing names the same way groupby(dropna=True) would
+    mask = pd.notna(names)
+    names = names[mask].astype(str)
+    values = values[mask]
+    if names.size == 0:
+        return names, values
+
+    if names.size > LARGE_GROUP_ROWS:
+        codes, uniq = pd.factorize(names, sort=False)
+        totals = bucket_sum(codes.astype(np.int64), values, len(uniq))
+        return np.asarray(uniq, dtype=str), totals
+
+    order = np.argsort(names, kind='stable')
+    uniq, first = np.unique(names[order], return_index=True)
+    totals = np.add.reduceat(values[order], first)
+    return uniq, totals
+
+def dump_json(obj, indent=True):
+    """Encode obj as JSON bytes for a single write() call"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode('utf-8')
+
+def write_atomic(path, data):
+    """Write bytes to a temp file and swap it in, so a crash never leaves half a file"""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+PORTFOLIO_DIR = "portfolios"
+PORTFOLIO_INDEX = os.path.join(PORTFOLIO_DIR, "index.json")
+
+def portfolio_file_name(name):
+    """Parquet file name derived from the portfolio name, so it never changes between saves"""
+    return f"portfolio_{hashlib.sha1(name.encode('utf-8')).hexdigest()[:16]}.parquet"
+
+def write_portfolio_store(portfolios):
+    """Write one zstd Parquet file per portfolio plus a JSON name index
+
+    Each portfolio always lands in the same file, so a crash part way
+    through leaves every file the index names holding its own portfolio.
+    """
+    os.makedirs(PORTFOLIO_DIR, exist_ok=True)
+    index = {}
+    for name, df in portfolios.items():
+        file_name = portfolio_file_name(name)
+        path = os.path.join(PORTFOLIO_DIR, file_name)
+        df.to_parquet(path + ".tmp", compression="zstd", index=False)
+        os.replace(path + ".tmp", path)
+        index[name] = file_name
+        
+    write_atomic(PORTFOLIO_INDEX, dump_json(index, indent=False))
+        
+    # Drop files left behind by deleted portfolios
+    for file_name in os.listdir(PORTFOLIO_DIR):
+        if file_name.endswith(".parquet") and file_name not in index.values():
+            os.remove(os.path.join(PORTFOLIO_DIR, file_name))
+
+def arrow_to_frame(table):
+    """DataFrame from an Arrow table with the string columns left Arrow-backed
+
+    Numeric columns come back as plain NumPy dtypes, so the charting and
+    table code that calls to_numpy(dtype=float) keeps working unchanged.
+    """
+    return table.to_pandas(types_mapper={arrow().string(): pd.StringDtype("pyarrow")}.get)
+
+def read_portfolio_store():
+    with open(PORTFOLIO_INDEX, "r") as f:
+        index = json.load(f)
+    return {name: arrow_to_frame(arrow().parquet.read_table(os.path.join(PORTFOLIO_DIR, file_name)))
+            for name, file_name in index.items()}
+
+def write_backup_archive(portfolios, path):
+    """Deflated zip with one entry per portfolio and a JSON name index
+
+    Entries are uncompressed Feather files when pyarrow is installed and
+    columnar JSON otherwise; the zip's deflate does the compressing.
+    """
+    index = {}
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+        for i, (name, df) in enumerate(portfolios.items()):
+            if HAS_PYARROW:
+                entry = f"portfolio_{i}.feather"
+                buf = io.BytesIO()
+                arrow().feather.write_feather(df.reset_index(drop=True), buf, compression="uncompressed")
+                data = buf.getvalue()
+            else:
+                entry = f"portfolio_{i}.json"
+                data = dump_json(frame_to_json(df), indent=False)
+            archive.writestr(entry, data)
+            index[name] = entry
+        archive.writestr("index.json", dump_json(index))
+
+def read_backup_archive(path):
+    portfolios = {}
+    with zipfile.ZipFile(path) as archive:
+        index = json.loads(archive.read("index.json"))
+        for name, entry in index.items():
+            data = archive.read(entry)
+            if entry.endswith(".feather"):
+                pa = arrow()
+                portfolios[name] = arrow_to_frame(pa.feather.read_table(pa.BufferReader(data)))
+            else:
+                portfolios[name] = frame_from_json(json.loads(data))
+    return portfolios
+
+def column_values(column):
+    """List of a column's values with every missing value (NaN, pd.NA, NaT) as None"""
+    return column.astype(object).where(column.notna(), None).tolist()
+
+def frame_to_json(df):
+    """Columnar JSON layout of a DataFrame that keeps each column's dtype"""
+    return {
+        "columns": list(df.columns),
+        "dtypes": [str(dtype) for dtype in df.dtypes],
+        # Arrow-backed string columns hold pd.NA, which default=str would write as "<NA>"
+        "data": [column_values(df.iloc[:, i]) for i in range(df.shape[1])]
+    }
+
+def frame_from_json(payload):
+    """DataFrame from frame_to_json output or from the older list of records"""
+    if isinstance(payload, list):
+        return pd.DataFrame(payload)
+    columns = payload["columns"]
+    arrays = [pd.array(values, dtype=dtype)
+              for values, dtype in zip(payload["data"], payload["dtypes"])]
+    return pd.DataFrame(dict(zip(range(len(columns)), arrays))).set_axis(columns, axis=1)
+
+def read_backup(path):
+    if zipfile.is_zipfile(path):
+        return read_backup_archive(path)
+        
+    with open(path, 'r') as f:
+        backup_data = json.load(f)
+    
+    # Rebuild DataFrames with their saved dtypes
+    restored_portfolios = {}
+    for name, payload in backup_data.items():
+        restored_portfolios[name] = frame_from_json(payload)
+    return restored_portfolios
+
+# Drops ASCII characters other than letters, digits, space and underscore
+SAFE_NAME_TABLE = str.maketrans({c: None for c in map(chr, range(128))
+                                 if not (c.isalnum() or c in ' _')})
+
+def write_csv(path, df):
+    """Write df with Arrow's vectorised CSV writer, or pandas if Arrow can't convert it"""
+    if HAS_PYARROW:
+        pa = arrow()
+        try:
+            pa.csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+            return
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass  # e.g. mixed-type object columns
+    df.to_csv(path, index=False)
+
+def export_portfolios(portfolios, path):
+    if path.lower().endswith('.csv'):
+        # Export all portfolios to separate CSV files, several at a time
+        base_path = path.replace('.csv', '')
+        tasks = []
+        for name, df in portfolios.items():
+            safe_name = name.translate(SAFE_NAME_TABLE).rstrip()
+            tasks.append((f"{base_path}_{safe_name}.csv", df))
+        if tasks:
+            with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+                list(executor.map(lambda task: write_csv(*task), tasks))
+    else:
+        # Export to Excel with each portfolio as a separate sheet (ExcelWriter is not thread-safe)
+        with pd.ExcelWriter(path, engine=EXCEL_WRITE_ENGINE) as writer:
+            for name, df in portfolios.items():
+                safe_name = name[:31]  # Excel sheet name limit
+                df.to_excel(writer, sheet_name=safe_name, index=False)
+
+def read_excel_portfolios(path):
+    # Excel file - import all sheets as separate portfolios in one parse
+    try:
+        return pd.read_excel(path, sheet_name=None, engine=EXCEL_READ_ENGINE)
+    except ValueError:
+        if EXCEL_READ_ENGINE is None:
+            raise
+        # pandas too old for the calamine engine
+        return pd.read_excel(path, sheet_name=None)
+
+AUDIT_LOG_PATH = "portfolio_audit.log"
+
+# Action patterns for the audit history "Filter by" choices
+AUDIT_FILTER_PATTERNS = {
+    "Portfolio": re.compile("PORTFOLIO"),
+    "Stock": re.compile("STOCK|SHARES"),
+    "Mutual Fund": re.compile("MF"),
+    "System": re.compile("SYSTEM|DATA|BACKUP"),
+}
+
+def audit_entry_matches(entry, filter_type, filter_text):
+    """Apply the audit history type and search filters to one parsed entry"""
+    if len(entry) != 5:
+        return False
+    
+    # Filter by type
+    pattern = AUDIT_FILTER_PATTERNS.get(filter_type)
+    if pattern is not None and not pattern.search(entry[1]):
+        return False
+        
+    # Filter by search text
+    return not filter_text or any(filter_text in field.lower() for field in entry)
+
+# Auto-refresh runs are written to the audit log at most this often
+AUTO_REFRESH_LOG_SECONDS = 3600
+
+# Audit entries kept in memory for the history and activity views
+AUDIT_CACHE_SIZE = 5000
+AUDIT_TAIL_BYTES = 512 * 1024
+
+def read_audit_tail():
+    """Parsed entries from the end of the audit log and the byte offset read up to"""
+    entries = deque(maxlen=AUDIT_CACHE_SIZE)
+    size = 0
+    try:
+        with open(AUDIT_LOG_PATH, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            start = max(0, size - AUDIT_TAIL_BYTES)
+            f.seek(start)
+            if start:
+                f.readline()  # skip the partial first line
+            for line in f:
+                line = line.decode("utf-8", errors="replace").strip()
+                if line:
+                    entries.append(line.split(" | "))
+    except FileNotFoundError:
+        pass
+    return entries, size
+
+def read_audit_since(offset):
+    """Complete lines appended to the audit log after offset, and the new offset"""
+    with open(AUDIT_LOG_PATH, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    data = data[:data.rfind(b"\n") + 1]  # leave a half-written line for next time
+    entries = [line.split(" | ") for line in data.decode("utf-8", errors="replace").splitlines()
+               if line.strip()]
+    return entries, offset + len(data)
+
 class Worker(QThread):
     data_fetched = pyqtSignal(dict)
     finished_signal = pyqtSignal()
@@ -54,6 +493,87 @@ class Worker(QThread):
         self.quit()
         self.wait(1000)
 
+class IOTaskSignals(QObject):
+    done = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+class IOWorker(QRunnable):
+    """Runs a blocking file operation on the thread pool and reports back by signal"""
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = IOTaskSignals()
+        
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.done.emit(result)
+
+class PlotPrepWorker(QThread):
+    prepared = pyqtSignal(object)
+    finished_signal = pyqtSignal()
+    
+    def __init__(self, data, parent=None):
+        super().__init__(parent)
+        self.data = data
+        self._is_running = True
+        
+    def run(self):
+        try:
+            prepared = prepare_sector_allocation(self.data)
+        except Exception as e:
+            print(f"Error preparing sector allocation: {str(e)}")
+            prepared = (None, None, "Error displaying chart")
+        
+        if self._is_running:
+            self.prepared.emit(prepared)
+        self.finished_signal.emit()
+        
+    def stop(self):
+        self._is_running = False
+        self.quit()
+        self.wait(1000)
+
+class MarketTableModel(QAbstractTableModel):
+    """Read-only table model; each row is a list of (text, brush) cells"""
+    GREEN = QBrush(QColor('#4CAF50'))
+    RED = QBrush(QColor('#F44336'))
+    
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows = []
+        
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        text, brush = self._rows[index.row()][index.column()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == Qt.ForegroundRole:
+            return brush
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
 class TechnicalAnalyzer:
     def __init__(self):
         self.history_days = 90  # Default lookback period
@@ -349,10 +869,10 @@ class MarketDataFetcher:
         results = {}
         remaining = len(tickers)
         
-        def batch_callback(ticker, data):
+        def batch_callback(ticker, price):
             nonlocal remaining
-            if data is not None and not data.empty:
-                results[ticker] = data['Close'].iloc[-1]
+            if price is not None:
+                results[ticker] = price
             remaining -= 1
             if remaining == 0:
                 callback(results)
@@ -360,60 +880,61 @@ class MarketDataFetcher:
         for ticker in tickers:
             self.fetch_price(ticker, lambda t, p: batch_callback(t, p))
 
-class MarketDataWorker(QThread):
+class MarketDataSignals(QObject):
     data_fetched = pyqtSignal(dict)
     finished_signal = pyqtSignal()
-    
-    def __init__(self, indices, parent=None):
-        super().__init__(parent)
+
+# yf.download keeps its results in module globals that every call resets
+YF_DOWNLOAD_LOCK = threading.Lock()
+
+class MarketDataWorker(QRunnable):
+    """Index quote task for the shared thread pool"""
+    def __init__(self, indices):
+        super().__init__()
         self.indices = indices
+        self.signals = MarketDataSignals()
         self._is_running = True
-        self.fetcher = MarketDataFetcher()
         
     def run(self):
-        results = {}
-        remaining = len(self.indices)
-        
-        def update_results(ticker_data):
-            nonlocal remaining
-            for name, ticker in self.indices.items():
-                if ticker in ticker_data and ticker_data[ticker] is not None:
-                    try:
-                        current = ticker_data[ticker]
-                        # Get previous close from history
-                        index = yf.Ticker(ticker)
-                        hist = index.history(period="2d")
-                        if len(hist) >= 2:
-                            prev_close = hist['Close'].iloc[-2]
-                            change = current - prev_close
-                            pct_change = (change / prev_close) * 100
-                            
-                            results[name] = {
-                                'Current': current,
-                                'Change': change,
-                                '% Change': pct_change,
-                                'Previous Close': prev_close,
-                                'Market Hours': '09:15-15:30 IST' if '^NSE' in ticker else '09:30-16:00 ET',
-                                'Status': "Open" if self.is_market_open(ticker) else "Closed"
-                            }
-                    except Exception as e:
-                        print(f"Error processing {name}: {str(e)}")
-                        results[name] = None
-                else:
-                    results[name] = None
-                    
-            remaining -= 1
-            if remaining == 0 and self._is_running:
-                self.data_fetched.emit(results)
-                self.finished_signal.emit()
-                
-        # Fetch all tickers in batch
-        self.fetcher.fetch_batch(list(self.indices.values()), update_results)
+        results = dict.fromkeys(self.indices)
+        tickers = list(self.indices.values())
+        try:
+            # One batched download gives the recent closes of every index; five days so
+            # holidays and the Indian/US calendar mismatch still leave two closes per index
+            with YF_DOWNLOAD_LOCK:
+                data = yf.download(' '.join(tickers), period="5d", interval="1d", group_by='column',
+                                   progress=False, auto_adjust=False)
+            closes = data['Close'] if not data.empty else pd.DataFrame()
+            if isinstance(closes, pd.Series):  # Older yfinance returns flat columns for a single ticker
+                closes = closes.to_frame(tickers[0])
+        except Exception as e:
+            print(f"Error fetching index quotes: {str(e)}")
+            closes = pd.DataFrame()
+            
+        for name, ticker in self.indices.items():
+            if ticker not in closes.columns:
+                continue
+            history = closes[ticker].dropna()
+            if len(history) < 2:
+                continue
+            current = float(history.iat[-1])
+            prev_close = float(history.iat[-2])
+            change = current - prev_close
+            results[name] = {
+                'Current': current,
+                'Change': change,
+                '% Change': (change / prev_close) * 100,
+                'Previous Close': prev_close,
+                'Market Hours': '09:15-15:30 IST' if '^NSE' in ticker else '09:30-16:00 ET',
+                'Status': "Open" if self.is_market_open(ticker) else "Closed"
+            }
+            
+        if self._is_running:
+            self.signals.data_fetched.emit(results)
+        self.signals.finished_signal.emit()
         
     def stop(self):
         self._is_running = False
-        self.quit()
-        self.wait(1000)
         
     def is_market_open(self, ticker):
         now = datetime.now()
@@ -426,14 +947,42 @@ class MarketDataWorker(QThread):
                     9 <= (now.hour - 4) < 16)  # Adjusting for timezone
 
 class PortfolioTracker(QMainWindow):
+    INDIAN_INDICES = {
+        "NIFTY 50": "^NSEI",
+        "NIFTY BANK": "^NSEBANK",
+        "SENSEX": "^BSESN",
+        "NIFTY IT": "^CNXIT",
+        "NIFTY NEXT 50": "^NSEMDCP50"
+    }
+    
+    GLOBAL_INDICES = {
+        "S&P 500": "^GSPC",
+        "NASDAQ": "^IXIC",
+        "DOW JONES": "^DJI",
+        "FTSE 100": "^FTSE",
+        "DAX": "^GDAXI",
+        "NIKKEI 225": "^N225"
+    }
+    
+    # Audit action colors, built once rather than per table row
+    _COLOR_ADD = QColor('#4CAF50')
+    _COLOR_DEL = QColor('#F44336')
+    _COLOR_MOD = QColor('#FFC107')
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Portfolio Tracker")
         self.setGeometry(100, 100, 1400, 900)
         self.portfolios = {}
         self.workers = []
-        self.data_fetcher = MarketDataFetcher()
+        self.thread_pool = QThreadPool.globalInstance()
         self.load_data()
+        # Sorted portfolio names for the selectors, kept in step with self.portfolios
+        self._sorted_names = sorted(self.portfolios)
+        # _audit_offset is how far into the log file the cache has seen
+        self._audit_cache, self._audit_offset = read_audit_tail()
+        # Kept open for the window's lifetime; flushed by auto_refresh and on close
+        self._audit_fp = open(AUDIT_LOG_PATH, "a", buffering=65536, encoding="utf-8", newline="")
         self.init_ui()
         self.set_dark_theme()
         
@@ -441,6 +990,17 @@ class PortfolioTracker(QMainWindow):
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
         
+        # Coalesce bursts of market refreshes and analysis redraws
+        self.market_refresh_timer = QTimer(self)
+        self.market_refresh_timer.setSingleShot(True)
+        self.market_refresh_timer.setInterval(250)
+        self.market_refresh_timer.timeout.connect(self._do_refresh_market_data)
+        self._analysis_dirty = False
+        self._last_sector_key = None
+        self._sector_request_id = 0  # Latest PlotPrepWorker; results of older ones are dropped
+        self._last_company_key = None
+        self._company_ax_initialized = False
+        
         self.create_main_menu()
         self.create_portfolio_management()
         self.create_stock_operations()
@@ -455,6 +1015,8 @@ class PortfolioTracker(QMainWindow):
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.auto_refresh)
         self.refresh_timer.start(300000)  # 5 minutes
+        self._auto_refresh_count = 0
+        self._auto_refresh_logged = time.monotonic()
         
     def set_dark_theme(self):
         self.setStyleSheet("""
@@ -831,10 +1393,8 @@ class PortfolioTracker(QMainWindow):
             self.market_summary.setText(summary_text)
         
         worker = MarketDataWorker(indices)
-        worker.data_fetched.connect(update_summary)
-        worker.finished_signal.connect(lambda: self.worker_finished(worker))
-        self.workers.append(worker)
-        worker.start()
+        worker.signals.data_fetched.connect(update_summary)
+        self.thread_pool.start(worker)
 
     def refresh_portfolio_summary(self):
         if not self.portfolios:
@@ -868,17 +1428,10 @@ class PortfolioTracker(QMainWindow):
         self.portfolio_summary.setText(summary_text)
 
     def refresh_activity_log(self):
-        try:
-            with open("portfolio_audit.log", "r") as f:
-                log_entries = [line.strip() for line in f.readlines() if line.strip()]
-        except FileNotFoundError:
-            log_entries = []
+        recent_entries = list(islice(reversed(self._audit_cache), 5))
         
-        recent_entries = reversed(log_entries[-5:]) if log_entries else ["No recent activity"]
-        
-        html = ""
-        for entry in recent_entries:
-            parts = entry.split(" | ")
+        html = "" if recent_entries else '<div style="color: #CCCCCC;">No recent activity</div>'
+        for parts in recent_entries:
             if len(parts) == 5:
                 timestamp, action, portfolio, stock, details = parts
                 html += f"""
@@ -891,7 +1444,7 @@ class PortfolioTracker(QMainWindow):
                     </div>
                 """
             else:
-                html += f'<div style="color: #CCCCCC;">{entry}</div>'
+                html += f'<div style="color: #CCCCCC;">{" | ".join(parts)}</div>'
         
         self.activity_log.setHtml(html)
 
@@ -906,8 +1459,7 @@ class PortfolioTracker(QMainWindow):
         elif current_page == 3:
             self.refresh_dashboard_data()
         elif current_page == 4:
-            self.refresh_indian_market_data()
-            self.refresh_global_market_data()
+            self.refresh_market_indices()
         
         QMessageBox.information(self, "Refresh", "All data refreshed successfully!")
 
@@ -955,10 +1507,21 @@ class PortfolioTracker(QMainWindow):
         page.setLayout(layout)
         self.stacked_widget.addWidget(page)
 
+    def _set_portfolio(self, name, df):
+        if name not in self.portfolios:
+            insort(self._sorted_names, name)
+        self.portfolios[name] = df
+        
+    def _del_portfolio(self, name):
+        del self.portfolios[name]
+        self._sorted_names.remove(name)
+        
+    def _rebuild_portfolio_names(self):
+        self._sorted_names = sorted(self.portfolios)
+        
     def refresh_portfolio_list(self):
         self.portfolio_list.clear()
-        for portfolio in sorted(self.portfolios.keys()):
-            self.portfolio_list.addItem(portfolio)
+        self.portfolio_list.addItems(self._sorted_names)
 
     def show_create_portfolio_dialog(self):
         dialog = QDialog(self)
@@ -993,10 +1556,10 @@ class PortfolioTracker(QMainWindow):
         name = self.portfolio_name_input.text().strip()
         if name:
             if name not in self.portfolios:
-                self.portfolios[name] = pd.DataFrame(columns=[
+                self._set_portfolio(name, pd.DataFrame(columns=[
                     'Stock Name', 'Ticker Symbol', 'Quantity', 'Purchase Price',
                     'Purchase Date', 'Sector', 'Investment Value'
-                ])
+                ]))
                 self.log_audit("CREATED_PORTFOLIO", name)
                 self.refresh_portfolio_list()
                 dialog.accept()
@@ -1020,7 +1583,7 @@ class PortfolioTracker(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            del self.portfolios[portfolio]
+            self._del_portfolio(portfolio)
             self.log_audit("DELETED_PORTFOLIO", portfolio)
             self.refresh_portfolio_list()
             QMessageBox.information(self, "Success", f"Portfolio '{portfolio}' deleted successfully!")
@@ -1056,7 +1619,7 @@ class PortfolioTracker(QMainWindow):
         portfolio_label.setStyleSheet("font-size: 14px;")
         self.portfolio_combo = QComboBox()
         self.portfolio_combo.setStyleSheet("font-size: 14px;")
-        self.portfolio_combo.addItems(sorted(self.portfolios.keys()))
+        self.portfolio_combo.addItems(self._sorted_names)
         self.portfolio_combo.currentTextChanged.connect(self.refresh_stock_table)
         
         portfolio_layout.addWidget(portfolio_label)
@@ -1573,7 +2136,7 @@ class PortfolioTracker(QMainWindow):
         portfolio_label.setStyleSheet("font-size: 14px;")
         self.mf_portfolio_combo = QComboBox()
         self.mf_portfolio_combo.setStyleSheet("font-size: 14px;")
-        self.mf_portfolio_combo.addItems(sorted(self.portfolios.keys()))
+        self.mf_portfolio_combo.addItems(self._sorted_names)
         self.mf_portfolio_combo.currentTextChanged.connect(self.refresh_mf_table)
         
         portfolio_layout.addWidget(portfolio_label)
@@ -1777,7 +2340,7 @@ class PortfolioTracker(QMainWindow):
                 pd.DataFrame([mf_data])
             ], ignore_index=True)
         else:
-            self.portfolios[portfolio] = pd.DataFrame([mf_data])
+            self._set_portfolio(portfolio, pd.DataFrame([mf_data]))
             
         self.log_audit("ADDED_MF", portfolio, mf_data['Fund Name'], 
                       f"Units: {mf_data['Units']:.2f} @ {mf_data['Avg NAV']:.2f}")
@@ -2262,7 +2825,7 @@ class PortfolioTracker(QMainWindow):
         portfolio_label.setStyleSheet("font-size: 14px;")
         self.dashboard_portfolio_combo = QComboBox()
         self.dashboard_portfolio_combo.setStyleSheet("font-size: 14px;")
-        self.dashboard_portfolio_combo.addItems(sorted(self.portfolios.keys()))
+        self.dashboard_portfolio_combo.addItems(self._sorted_names)
         self.dashboard_portfolio_combo.currentTextChanged.connect(self.refresh_individual_dashboard)
         
         portfolio_layout.addWidget(portfolio_label)
@@ -2415,7 +2978,7 @@ class PortfolioTracker(QMainWindow):
         portfolio_label.setStyleSheet("font-size: 14px;")
         self.chart_portfolio_combo = QComboBox()
         self.chart_portfolio_combo.setStyleSheet("font-size: 14px;")
-        self.chart_portfolio_combo.addItems(sorted(self.portfolios.keys()))
+        self.chart_portfolio_combo.addItems(self._sorted_names)
         self.chart_portfolio_combo.currentTextChanged.connect(self.update_charts)
         
         portfolio_layout.addWidget(portfolio_label)
@@ -2526,16 +3089,19 @@ class PortfolioTracker(QMainWindow):
             
             # Create clean pie chart with improved styling
             colors = plt.cm.tab20c(np.linspace(0, 1, len(valid_data)))
-            wedges, texts, autotexts = ax.pie(
+            wedges, texts = ax.pie(
                 valid_data['Current Value'],
                 labels=None,  # We'll use legend instead
-                autopct=lambda p: f'₹{p * sum(valid_data["Current Value"])/100:,.0f}\n({p:.1f}%)' if p >= 5 else '',
                 startangle=90,
                 counterclock=False,
                 wedgeprops={'linewidth': 0.8, 'edgecolor': '#333'},
                 colors=colors,
-                textprops={'fontsize': 9, 'color': 'white'},
-                pctdistance=0.8
+                textprops={'fontsize': 9, 'color': 'white'}
+            )
+            autotexts = add_wedge_labels(
+                ax, wedges,
+                pie_value_labels(valid_data['Current Value'], min_pct=5),
+                0.8, fontsize=9, color='white'
             )
             
             # Create legend with stock names and values
@@ -2614,7 +3180,7 @@ class PortfolioTracker(QMainWindow):
             ax.set_ylabel("P/L (₹)", color='white')
             ax.tick_params(axis='x', rotation=45, colors='white')
             ax.tick_params(axis='y', colors='white')
-            ax.yaxis.set_major_formatter(FuncFormatter(lambda x, _: f'₹{x:,.0f}'))
+            ax.yaxis.set_major_formatter(StrMethodFormatter('₹{x:,.0f}'))
             
             for spine in ax.spines.values():
                 spine.set_color('#333')
@@ -2640,6 +3206,10 @@ class PortfolioTracker(QMainWindow):
     
     def plot_sector_chart(self, data):
         """Plot sector allocation with proper error handling"""
+        # Shares self.sector_chart with the analysis tab, so its cached key is stale
+        # and a sector allocation still being prepared must not draw over this chart
+        self._last_sector_key = None
+        self._sector_request_id += 1
         try:
             fig = self.sector_chart.figure
             fig.clear()
@@ -2668,7 +3238,8 @@ class PortfolioTracker(QMainWindow):
                 return
             
             # Group by sector and handle NaN values
-            sector_data = df.groupby('Sector', dropna=True)['Current Value'].sum()
+            sectors, totals = group_sum(df['Sector'].to_numpy(), df['Current Value'].to_numpy())
+            sector_data = pd.Series(totals, index=sectors)
             sector_data = sector_data[sector_data > 0]  # Remove zero values
             
             if len(sector_data) == 0:
@@ -2682,18 +3253,19 @@ class PortfolioTracker(QMainWindow):
             sector_data = sector_data.sort_values(ascending=False)
             
             # Create the pie chart
-            colors = plt.cm.tab20c(range(len(sector_data)))
-            wedges, texts, autotexts = ax.pie(
+            colors = tab20c_colors(len(sector_data))
+            wedges, texts = ax.pie(
                 sector_data.values,
                 labels=sector_data.index,
-                autopct=lambda p: f'₹{p * sum(sector_data)/100:,.0f}\n({p:.1f}%)',
                 startangle=90,
                 wedgeprops={'linewidth': 1, 'edgecolor': '#121212'},
                 colors=colors,
                 textprops={'fontsize': 8},
-                pctdistance=0.85,
                 labeldistance=1.05
             )
+            autotexts = add_wedge_labels(
+                ax, wedges, pie_value_labels(sector_data.values), 0.85, fontsize=8
+            )
             
             # Style the text
             for text in texts:
@@ -2752,13 +3324,13 @@ class PortfolioTracker(QMainWindow):
                 self.daily_pl_chart.draw()
                 return
                 
-            # Convert to DataFrame and sort
-            daily_pl_df = pd.DataFrame(daily_pl).sort_values('Change', ascending=True)
+            # Convert to DataFrame
+            daily_pl_df = pd.DataFrame(daily_pl)
             
             # Limit to top 15 performers (positive and negative)
             daily_pl_df = pd.concat([
-                daily_pl_df.head(8),  # Worst performers
-                daily_pl_df.tail(8)   # Best performers
+                daily_pl_df.nsmallest(8, 'Change'),  # Worst performers
+                daily_pl_df.nlargest(8, 'Change').iloc[::-1]  # Best performers
             ]).drop_duplicates()
             
             # Create horizontal bar chart
@@ -2873,6 +3445,14 @@ class PortfolioTracker(QMainWindow):
         self.update_analysis_charts()
     
     def update_analysis_charts(self):
+        # Redraw requests are flushed together once the event loop is idle
+        if not self._analysis_dirty:
+            self._analysis_dirty = True
+            QTimer.singleShot(0, self._replot_analysis_charts)
+    
+    def _replot_analysis_charts(self):
+        self._analysis_dirty = False
+        
         # Combine all portfolio data
         all_holdings = pd.DataFrame()
         for portfolio_name, portfolio_data in self.portfolios.items():
@@ -2940,7 +3520,7 @@ class PortfolioTracker(QMainWindow):
             ax.set_ylabel("Current Value (₹)", color='white')
             ax.tick_params(axis='x', rotation=45, colors='white')
             ax.tick_params(axis='y', colors='white')
-            ax.yaxis.set_major_formatter(FuncFormatter(lambda x, _: f'₹{x:,.0f}'))
+            ax.yaxis.set_major_formatter(StrMethodFormatter('₹{x:,.0f}'))
             
             for spine in ax.spines.values():
                 spine.set_color('#333')
@@ -2951,64 +3531,54 @@ class PortfolioTracker(QMainWindow):
                 ha='center', va='center', fontsize=12)
         
         fig.tight_layout()
-        self.trends_chart.draw()
+        self.trends_chart.draw_idle()
     
     def plot_sector_allocation(self, data):
+        """Prepare sector totals off the GUI thread, then draw them"""
+        key = frame_key(data)
+        if key is not None and key == self._last_sector_key:
+            self.sector_chart.draw_idle()
+            return
+        self._last_sector_key = key
+        
+        self._sector_request_id += 1
+        request_id = self._sector_request_id
+        worker = PlotPrepWorker(None if data is None else data.copy())
+        worker.prepared.connect(lambda prepared: self.draw_sector_allocation(request_id, prepared))
+        worker.finished_signal.connect(lambda: self.worker_finished(worker))
+        self.workers.append(worker)
+        worker.start()
+    
+    def draw_sector_allocation(self, request_id, prepared):
         """Plot sector allocation with proper error handling"""
+        if request_id != self._sector_request_id:
+            return  # A newer request was made while this one was being prepared
+        sector_data, value_labels, message = prepared
         try:
             fig = self.sector_chart.figure
             fig.clear()
             
             ax = fig.add_subplot(111)
             
-            # Filter out NaN values and ensure we have data
-            if data is None or data.empty:
-                ax.text(0.5, 0.5, "No data available", 
+            if sector_data is None:
+                ax.text(0.5, 0.5, message, 
                     ha='center', va='center', fontsize=12)
                 fig.tight_layout()
-                self.sector_chart.draw()
+                self.sector_chart.draw_idle()
                 return
-                
-            # Clean the data
-            df = data.copy()
-            if 'Current Value' not in df.columns:
-                df['Current Value'] = df['Quantity'] * df['Purchase Price']
-            df = df[df['Quantity'] > 0]  # Only active holdings
-            
-            if 'Sector' not in df.columns or df['Sector'].isnull().all():
-                ax.text(0.5, 0.5, "No sector data available", 
-                    ha='center', va='center', fontsize=12)
-                fig.tight_layout()
-                self.sector_chart.draw()
-                return
-            
-            # Group by sector and handle NaN values
-            sector_data = df.groupby('Sector', dropna=True)['Current Value'].sum()
-            sector_data = sector_data[sector_data > 0]  # Remove zero values
-            
-            if len(sector_data) == 0:
-                ax.text(0.5, 0.5, "No valid sector data", 
-                    ha='center', va='center', fontsize=12)
-                fig.tight_layout()
-                self.sector_chart.draw()
-                return
-            
-            # Sort by value
-            sector_data = sector_data.sort_values(ascending=False)
             
             # Create the pie chart
-            colors = plt.cm.tab20c(range(len(sector_data)))
-            wedges, texts, autotexts = ax.pie(
+            colors = tab20c_colors(len(sector_data))
+            wedges, texts = ax.pie(
                 sector_data.values,
                 labels=sector_data.index,
-                autopct=lambda p: f'₹{p * sum(sector_data)/100:,.0f}\n({p:.1f}%)',
                 startangle=90,
                 wedgeprops={'linewidth': 1, 'edgecolor': '#121212'},
                 colors=colors,
                 textprops={'fontsize': 8},
-                pctdistance=0.85,
                 labeldistance=1.05
             )
+            autotexts = add_wedge_labels(ax, wedges, value_labels, 0.85, fontsize=8)
             
             # Style the text
             for text in texts:
@@ -3030,18 +3600,66 @@ class PortfolioTracker(QMainWindow):
         
         try:
             fig.tight_layout()
-            self.sector_chart.draw()
+            self.sector_chart.draw_idle()
         except Exception as e:
             print(f"Error in tight_layout: {str(e)}")
-            self.sector_chart.draw()
+            self.sector_chart.draw_idle()
     
-    def plot_company_exposure(self, data):
+    def _init_company_ax(self):
+        """One-time styling for the company exposure axes"""
         fig = self.company_chart.figure
         fig.clear()
+        ax = fig.add_subplot(111)
+        
+        ax.set_xlabel('Current Value (₹)', color='white', fontsize=11)
+        ax.set_title('Top Holdings by Value (Combined Across Portfolios)', fontsize=14, color='white', pad=20)
+        ax.xaxis.set_major_formatter(StrMethodFormatter('₹{x:,.0f}'))
+        
+        # Add grid lines
+        ax.grid(axis='x', color='#444', linestyle=':', alpha=0.5)
+        
+        # Customize spines
+        for spine in ax.spines.values():
+            spine.set_color('#555')
+            spine.set_linewidth(0.8)
+        
+        # Set background color
+        ax.set_facecolor('#1E1E1E')
+        fig.patch.set_facecolor('#1E1E1E')
+        
+        # Add a subtle watermark
+        ax.text(
+            0.5, 0.5, 'Portfolio Tracker',
+            transform=ax.transAxes,
+            fontsize=40,
+            color='#333',
+            alpha=0.1,
+            ha='center',
+            va='center',
+            rotation=30
+        ).set_rasterized(True)
+        
+        self._company_ax = ax
+        self._company_artists = []
+        self._company_ax_initialized = True
+        return ax
+    
+    def plot_company_exposure(self, data):
+        key = frame_key(data)
+        if key is not None and key == self._last_company_key:
+            self.company_chart.draw_idle()
+            return
+        self._last_company_key = key
+        
+        fig = self.company_chart.figure
+        ax = self._company_ax if self._company_ax_initialized else self._init_company_ax()
+        
+        # Only the data artists from the previous redraw are replaced
+        for artist in self._company_artists:
+            artist.remove()
+        self._company_artists = []
         
         try:
-            ax = fig.add_subplot(111)
-            
             # Ensure we have the required columns
             if 'Current Value' not in data.columns:
                 if 'Quantity' in data.columns and 'Purchase Price' in data.columns:
@@ -3056,16 +3674,19 @@ class PortfolioTracker(QMainWindow):
                     raise ValueError("Missing stock/fund name column")
             
             # Group by company name to combine holdings across portfolios
-            combined_holdings = data.groupby('Stock Name')['Current Value'].sum().sort_values(ascending=False)
-            
+            names, totals = group_sum(data['Stock Name'].to_numpy(), data['Current Value'].to_numpy())
+
             # Limit to top 15 for readability
-            top_holdings = combined_holdings.head(15)
-            
+            idx = top_k_indices(totals, 15)
+            top_holdings = pd.Series(totals[idx], index=names[idx])
+
             if len(top_holdings) == 0:
-                ax.text(0.5, 0.5, "No holdings data available", 
-                    ha='center', va='center', fontsize=12)
+                ax.set_yticks([])
+                self._company_artists.append(ax.text(
+                    0.5, 0.5, "No holdings data available", transform=ax.transAxes,
+                    ha='center', va='center', fontsize=12))
                 fig.tight_layout()
-                self.company_chart.draw()
+                self.company_chart.draw_idle()
                 return
                 
             # Calculate percentage of total portfolio
@@ -3077,7 +3698,7 @@ class PortfolioTracker(QMainWindow):
             
             # Create horizontal bar chart
             y_pos = np.arange(len(top_holdings))
-            colors = plt.cm.viridis(np.linspace(0.2, 0.8, len(top_holdings)))
+            colors = viridis_colors(len(top_holdings))
             
             bars = ax.barh(
                 y_pos,
@@ -3085,60 +3706,37 @@ class PortfolioTracker(QMainWindow):
                 color=colors,
                 height=0.7,
                 edgecolor='#333',
-                linewidth=0.7
+                linewidth=0.7,
+                rasterized=True
             )
+            self._company_artists.append(bars)
             
             # Add value and percentage labels
-            for i, (company, row) in enumerate(top_holdings.iterrows()):
-                ax.text(
-                    row['Current Value'] * 1.01, 
-                    i,
-                    f"₹{row['Current Value']:,.0f} ({row['Percentage']:.1f}%)",
-                    va='center',
-                    fontsize=9,
-                    color='white'
-                )
+            values = top_holdings['Current Value'].to_numpy()
+            pcts = top_holdings['Percentage'].to_numpy()
+            self._company_artists.extend(ax.bar_label(
+                bars,
+                labels=[f"₹{v:,.0f} ({p:.1f}%)" for v, p in zip(values, pcts)],
+                padding=3,
+                fontsize=9,
+                color='white'
+            ))
             
             # Formatting
             ax.set_yticks(y_pos)
             ax.set_yticklabels(top_holdings.index, fontsize=10)
-            ax.set_xlabel('Current Value (₹)', color='white', fontsize=11)
-            ax.set_title('Top Holdings by Value (Combined Across Portfolios)', fontsize=14, color='white', pad=20)
-            ax.xaxis.set_major_formatter(FuncFormatter(lambda x, _: f'₹{x:,.0f}'))
-            
-            # Add grid lines
-            ax.grid(axis='x', color='#444', linestyle=':', alpha=0.5)
-            
-            # Customize spines
-            for spine in ax.spines.values():
-                spine.set_color('#555')
-                spine.set_linewidth(0.8)
-            
-            # Set background color
-            ax.set_facecolor('#1E1E1E')
-            fig.patch.set_facecolor('#1E1E1E')
-            
-            # Add a subtle watermark
-            ax.text(
-                0.5, 0.5, 'Portfolio Tracker',
-                transform=ax.transAxes,
-                fontsize=40,
-                color='#333',
-                alpha=0.1,
-                ha='center',
-                va='center',
-                rotation=30
-            )
+            ax.relim()
+            ax.autoscale_view()
             
             fig.tight_layout()
             
         except Exception as e:
             print(f"Error plotting company exposure: {str(e)}")
-            ax.text(0.5, 0.5, "Error displaying chart", 
-                ha='center', va='center', fontsize=12)
-            ax.set_facecolor('#1E1E1E')
+            self._company_artists.append(ax.text(
+                0.5, 0.5, "Error displaying chart", transform=ax.transAxes,
+                ha='center', va='center', fontsize=12))
         
-        self.company_chart.draw()
+        self.company_chart.draw_idle()
 
     def plot_historical_performance(self, data):
         fig = self.historical_chart.figure
@@ -3149,8 +3747,7 @@ class PortfolioTracker(QMainWindow):
             
             # This is a placeholder - in a real app you would fetch historical data
             # For now we'll simulate some performance data
-            dates = pd.date_range(end=datetime.today(), periods=30, freq='D')
-            performance = np.cumsum(np.random.randn(30) * 10000 + 5000)
+            dates, performance = simulated_performance(datetime.today().date())
             
             ax.plot(
                 dates, 
@@ -3165,7 +3762,7 @@ class PortfolioTracker(QMainWindow):
             # Formatting
             ax.set_title('Simulated Portfolio Performance', fontsize=14, color='white', pad=20)
             ax.set_ylabel('Portfolio Value (₹)', color='white')
-            ax.yaxis.set_major_formatter(FuncFormatter(lambda x, _: f'₹{x:,.0f}'))
+            ax.yaxis.set_major_formatter(StrMethodFormatter('₹{x:,.0f}'))
             
             # Format x-axis dates
             ax.xaxis.set_major_formatter(mdates.DateFormatter('%d-%b'))
@@ -3186,7 +3783,7 @@ class PortfolioTracker(QMainWindow):
                 ha='center', va='center', fontsize=12)
         
         fig.tight_layout()
-        self.historical_chart.draw()
+        self.historical_chart.draw_idle()
     
     def export_analysis_images(self):
         options = QFileDialog.Options()
@@ -3207,14 +3804,15 @@ class PortfolioTracker(QMainWindow):
                 with PdfPages(file_path) as pdf:
                     for fig in [self.trends_chart.figure, self.sector_chart.figure, 
                                self.company_chart.figure, self.historical_chart.figure]:
-                        fig.savefig(pdf, format='pdf', bbox_inches='tight')
+                        fig.savefig(pdf, format='pdf', dpi=EXPORT_DPI, bbox_inches=export_bbox(fig))
             else:
-                # Save as individual PNG files
+                # Save as individual PNG files; the figures belong to live canvases that the
+                # GUI thread may redraw at any moment, so they are rendered here one by one
                 base_path = file_path.replace('.png', '')
-                self.trends_chart.figure.savefig(f"{base_path}_trends.png", bbox_inches='tight')
-                self.sector_chart.figure.savefig(f"{base_path}_sector.png", bbox_inches='tight')
-                self.company_chart.figure.savefig(f"{base_path}_company.png", bbox_inches='tight')
-                self.historical_chart.figure.savefig(f"{base_path}_historical.png", bbox_inches='tight')
+                for chart, suffix in [(self.trends_chart, 'trends'), (self.sector_chart, 'sector'),
+                                      (self.company_chart, 'company'), (self.historical_chart, 'historical')]:
+                    chart.figure.savefig(f"{base_path}_{suffix}.png", dpi=EXPORT_DPI,
+                                         bbox_inches=export_bbox(chart.figure))
                 
             QMessageBox.information(self, "Success", "Analysis exported successfully!")
         except Exception as e:
@@ -3236,11 +3834,11 @@ class PortfolioTracker(QMainWindow):
         # Indian Market Tab
         indian_tab = QWidget()
         indian_layout = QVBoxLayout(indian_tab)
-        self.indian_market_table = QTableWidget()
-        self.indian_market_table.setColumnCount(6)
-        self.indian_market_table.setHorizontalHeaderLabels([
+        self.indian_market_model = MarketTableModel([
             "Index", "Current", "Change", "% Change", "Status", "Market Hours"
-        ])
+        ], self)
+        self.indian_market_table = QTableView()
+        self.indian_market_table.setModel(self.indian_market_model)
         self.indian_market_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.indian_market_table.verticalHeader().setVisible(False)
         indian_layout.addWidget(self.indian_market_table)
@@ -3249,11 +3847,11 @@ class PortfolioTracker(QMainWindow):
         # Global Market Tab
         global_tab = QWidget()
         global_layout = QVBoxLayout(global_tab)
-        self.global_market_table = QTableWidget()
-        self.global_market_table.setColumnCount(6)
-        self.global_market_table.setHorizontalHeaderLabels([
+        self.global_market_model = MarketTableModel([
             "Index", "Current", "Change", "% Change", "Status", "Market Hours"
-        ])
+        ], self)
+        self.global_market_table = QTableView()
+        self.global_market_table.setModel(self.global_market_model)
         self.global_market_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.global_market_table.verticalHeader().setVisible(False)
         global_layout.addWidget(self.global_market_table)
@@ -3281,11 +3879,11 @@ class PortfolioTracker(QMainWindow):
         
         scanner_layout.addLayout(scanner_controls)
         
-        self.scanner_table = QTableWidget()
-        self.scanner_table.setColumnCount(6)
-        self.scanner_table.setHorizontalHeaderLabels([
+        self.scanner_model = MarketTableModel([
             "Symbol", "Name", "Price", "Change", "% Change", "Volume"
-        ])
+        ], self)
+        self.scanner_table = QTableView()
+        self.scanner_table.setModel(self.scanner_model)
         self.scanner_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.scanner_table.verticalHeader().setVisible(False)
         scanner_layout.addWidget(self.scanner_table)
@@ -3306,8 +3904,7 @@ class PortfolioTracker(QMainWindow):
         self.stacked_widget.addWidget(page)
         
         # Load initial data
-        self.refresh_indian_market_data()
-        self.refresh_global_market_data()
+        self.refresh_market_indices()
         
         tech_analysis_tab = QWidget()
         tech_layout = QVBoxLayout(tech_analysis_tab)
@@ -3454,96 +4051,61 @@ class PortfolioTracker(QMainWindow):
         self.ta_chart.draw()
     
     def refresh_market_data(self):
-        self.refresh_indian_market_data()
-        self.refresh_global_market_data()
+        # Restarting the single-shot timer collapses rapid clicks into one refresh
+        self.market_refresh_timer.start()
+    
+    def _do_refresh_market_data(self):
+        self.refresh_market_indices()
         QMessageBox.information(self, "Refresh", "Market data refreshed successfully!")
     
-    def refresh_indian_market_data(self):
-        indices = {
-            "NIFTY 50": "^NSEI",
-            "NIFTY BANK": "^NSEBANK",
-            "SENSEX": "^BSESN",
-            "NIFTY IT": "^CNXIT",
-            "NIFTY NEXT 50": "^NSEMDCP50"
-        }
-        
-        worker = MarketDataWorker(indices)
-        worker.data_fetched.connect(self.update_indian_market_table)
-        worker.finished_signal.connect(lambda: self.worker_finished(worker))
-        self.workers.append(worker)
-        worker.start()
+    def refresh_market_indices(self):
+        # One pooled task fetches both markets; the slot splits the result
+        worker = MarketDataWorker({**self.INDIAN_INDICES, **self.GLOBAL_INDICES})
+        worker.signals.data_fetched.connect(self.update_market_tables)
+        self.thread_pool.start(worker)
     
-    def update_indian_market_table(self, data):
-        self.indian_market_table.setRowCount(len(data))
-        
-        for row, (name, values) in enumerate(data.items()):
+    def update_market_tables(self, data):
+        self.update_indian_market_table({name: data.get(name) for name in self.INDIAN_INDICES})
+        self.update_global_market_table({name: data.get(name) for name in self.GLOBAL_INDICES})
+    
+    def market_table_rows(self, data):
+        rows = []
+        for name, values in data.items():
             if values is None:
+                rows.append([("", None)] * 6)
                 continue
                 
             change = values['Change']
             pct_change = values['% Change']
-            color = '#4CAF50' if change >= 0 else '#F44336'
-            
-            self.indian_market_table.setItem(row, 0, QTableWidgetItem(name))
-            self.indian_market_table.setItem(row, 1, QTableWidgetItem(f"{values['Current']:,.2f}"))
-            
-            change_item = QTableWidgetItem(f"{change:+,.2f}")
-            change_item.setForeground(QColor(color))
-            self.indian_market_table.setItem(row, 2, change_item)
-            
-            pct_item = QTableWidgetItem(f"{pct_change:+,.2f}%")
-            pct_item.setForeground(QColor(color))
-            self.indian_market_table.setItem(row, 3, pct_item)
-            
-            status_item = QTableWidgetItem(values['Status'])
-            status_item.setForeground(QColor('#4CAF50' if values['Status'] == "Open" else '#F44336'))
-            self.indian_market_table.setItem(row, 4, status_item)
-            
-            self.indian_market_table.setItem(row, 5, QTableWidgetItem(values['Market Hours']))
+            color = MarketTableModel.GREEN if change >= 0 else MarketTableModel.RED
+            
+            rows.append([
+                (name, None),
+                (f"{values['Current']:,.2f}", None),
+                (f"{change:+,.2f}", color),
+                (f"{pct_change:+,.2f}%", color),
+                (values['Status'], MarketTableModel.GREEN if values['Status'] == "Open" else MarketTableModel.RED),
+                (values['Market Hours'], None)
+            ])
+        return rows
     
-    def refresh_global_market_data(self):
-        indices = {
-            "S&P 500": "^GSPC",
-            "NASDAQ": "^IXIC",
-            "DOW JONES": "^DJI",
-            "FTSE 100": "^FTSE",
-            "DAX": "^GDAXI",
-            "NIKKEI 225": "^N225"
-        }
-        
-        worker = MarketDataWorker(indices)
-        worker.data_fetched.connect(self.update_global_market_table)
-        worker.finished_signal.connect(lambda: self.worker_finished(worker))
-        self.workers.append(worker)
-        worker.start()
+    def set_table_rows(self, table, model, rows):
+        # Hold repaints and view signals until the model reset is complete
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            model.set_rows(rows)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+    
+    def update_indian_market_table(self, data):
+        self.set_table_rows(self.indian_market_table, self.indian_market_model,
+                            self.market_table_rows(data))
     
     def update_global_market_table(self, data):
-        self.global_market_table.setRowCount(len(data))
-        
-        for row, (name, values) in enumerate(data.items()):
-            if values is None:
-                continue
-                
-            change = values['Change']
-            pct_change = values['% Change']
-            color = '#4CAF50' if change >= 0 else '#F44336'
-            
-            self.global_market_table.setItem(row, 0, QTableWidgetItem(name))
-            self.global_market_table.setItem(row, 1, QTableWidgetItem(f"{values['Current']:,.2f}"))
-            
-            change_item = QTableWidgetItem(f"{change:+,.2f}")
-            change_item.setForeground(QColor(color))
-            self.global_market_table.setItem(row, 2, change_item)
-            
-            pct_item = QTableWidgetItem(f"{pct_change:+,.2f}%")
-            pct_item.setForeground(QColor(color))
-            self.global_market_table.setItem(row, 3, pct_item)
-            
-            status_item = QTableWidgetItem(values['Status'])
-            status_item.setForeground(QColor('#4CAF50' if values['Status'] == "Open" else '#F44336'))
-            self.global_market_table.setItem(row, 4, status_item)
-            
-            self.global_market_table.setItem(row, 5, QTableWidgetItem(values['Market Hours']))
+        self.set_table_rows(self.global_market_table, self.global_market_model,
+                            self.market_table_rows(data))
     
     def run_stock_scanner(self):
         category = self.scanner_category.currentText()
@@ -3551,57 +4113,35 @@ class PortfolioTracker(QMainWindow):
         
         # Placeholder for actual scanner implementation
         # In a real app, this would fetch data from an API
-        self.scanner_table.setRowCount(0)
-        
-        # Simulate data
-        if exchange in ["NSE", "BSE"]:
-            stocks = [
-                ("RELIANCE", "Reliance Industries", 2500.50, 45.75, 1.86, "10.5M"),
-                ("TCS", "Tata Consultancy", 3200.25, -32.50, -1.01, "5.2M"),
-                ("HDFCBANK", "HDFC Bank", 1500.75, 22.25, 1.50, "8.1M"),
-                ("INFY", "Infosys", 1600.00, -15.00, -0.93, "4.3M"),
-                ("HINDUNILVR", "Hindustan Unilever", 2400.50, 12.75, 0.53, "2.7M")
-            ]
-        else:
-            stocks = [
-                ("AAPL", "Apple Inc.", 175.50, 2.75, 1.59, "25.3M"),
-                ("MSFT", "Microsoft", 300.25, -1.50, -0.50, "18.7M"),
-                ("AMZN", "Amazon", 3200.75, 45.25, 1.43, "5.1M"),
-                ("GOOGL", "Alphabet", 2700.00, -22.00, -0.81, "3.8M"),
-                ("TSLA", "Tesla", 750.50, 15.75, 2.15, "15.2M")
-            ]
+        # Simulated data is parsed once at import (see SCANNER_STOCKS)
+        stocks = SCANNER_STOCKS['IN' if exchange in ["NSE", "BSE"] else 'US']
         
         # Filter based on category
         if category == "Gainers":
-            stocks = sorted(stocks, key=lambda x: x[3], reverse=True)[:5]
+            stocks = stocks.nlargest(5, 'Change')
         elif category == "Losers":
-            stocks = sorted(stocks, key=lambda x: x[3])[:5]
+            stocks = stocks.nsmallest(5, 'Change')
         elif category == "Most Active":
-            stocks = sorted(stocks, key=lambda x: float(x[5][:-1]), reverse=True)[:5]
+            stocks = stocks.nlargest(5, 'Volume (M)')
         elif category == "52 Week High":
-            stocks = [s for s in stocks if s[3] > 0][:5]
+            stocks = stocks[stocks['Change'] > 0].head(5)
         elif category == "52 Week Low":
-            stocks = [s for s in stocks if s[3] < 0][:5]
-        
-        self.scanner_table.setRowCount(len(stocks))
+            stocks = stocks[stocks['Change'] < 0].head(5)
         
-        for row, stock in enumerate(stocks):
-            self.scanner_table.setItem(row, 0, QTableWidgetItem(stock[0]))
-            self.scanner_table.setItem(row, 1, QTableWidgetItem(stock[1]))
-            self.scanner_table.setItem(row, 2, QTableWidgetItem(f"{stock[2]:.2f}"))
-            
+        rows = []
+        for stock in stocks.itertuples(index=False):
             change = stock[3]
-            color = '#4CAF50' if change >= 0 else '#F44336'
-            
-            change_item = QTableWidgetItem(f"{change:+,.2f}")
-            change_item.setForeground(QColor(color))
-            self.scanner_table.setItem(row, 3, change_item)
-            
-            pct_item = QTableWidgetItem(f"{stock[4]:+,.2f}%")
-            pct_item.setForeground(QColor(color))
-            self.scanner_table.setItem(row, 4, pct_item)
-            
-            self.scanner_table.setItem(row, 5, QTableWidgetItem(stock[5]))
+            color = MarketTableModel.GREEN if change >= 0 else MarketTableModel.RED
+            rows.append([
+                (stock[0], None),
+                (stock[1], None),
+                (f"{stock[2]:.2f}", None),
+                (f"{change:+,.2f}", color),
+                (f"{stock[4]:+,.2f}%", color),
+                (stock[5], None)
+            ])
+        
+        self.set_table_rows(self.scanner_table, self.scanner_model, rows)
 
     def create_data_operations(self):
         page = QWidget()
@@ -3678,30 +4218,40 @@ class PortfolioTracker(QMainWindow):
         page.setLayout(layout)
         self.stacked_widget.addWidget(page)
     
+    def set_combo_items(self, combo, items):
+        combo.setUpdatesEnabled(False)
+        try:
+            combo.clear()
+            combo.addItems(items)
+        finally:
+            combo.setUpdatesEnabled(True)
+    
+    def run_io_task(self, fn, *args, on_done=None, error_message="Operation failed"):
+        # File work runs on the shared pool; results and errors come back on the GUI thread
+        task = IOWorker(fn, *args)
+        if on_done is not None:
+            task.signals.done.connect(on_done)
+        task.signals.error.connect(
+            lambda msg: QMessageBox.warning(self, "Error", f"{error_message}: {msg}"))
+        self.thread_pool.start(task)
+    
     def backup_portfolios(self):
         options = QFileDialog.Options()
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save Portfolio Backup",
             "",
-            "JSON Files (*.json)",
+            "Backup Files (*.zip)",
             options=options
         )
         
         if file_path:
-            try:
-                # Convert DataFrames to dictionaries
-                backup_data = {}
-                for name, df in self.portfolios.items():
-                    backup_data[name] = df.to_dict(orient='records')
-                
-                with open(file_path, 'w') as f:
-                    json.dump(backup_data, f, indent=4)
-                    
+            def backup_done(_):
                 self.log_audit("BACKUP_CREATED", "", "", f"File: {file_path}")
                 QMessageBox.information(self, "Success", "Portfolio backup created successfully!")
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Failed to create backup: {str(e)}")
+                
+            self.run_io_task(write_backup_archive, dict(self.portfolios), file_path,
+                             on_done=backup_done, error_message="Failed to create backup")
     
     def restore_portfolios(self):
         options = QFileDialog.Options()
@@ -3709,31 +4259,24 @@ class PortfolioTracker(QMainWindow):
             self,
             "Select Backup File",
             "",
-            "JSON Files (*.json)",
+            "Backup Files (*.zip *.json)",
             options=options
         )
         
         if file_path:
-            try:
-                with open(file_path, 'r') as f:
-                    backup_data = json.load(f)
-                
-                # Convert dictionaries back to DataFrames
-                restored_portfolios = {}
-                for name, records in backup_data.items():
-                    restored_portfolios[name] = pd.DataFrame(records)
-                
+            def restore_done(restored_portfolios):
                 self.portfolios = restored_portfolios
+                self._rebuild_portfolio_names()
                 self.log_audit("BACKUP_RESTORED", "", "", f"File: {file_path}")
                 QMessageBox.information(self, "Success", "Portfolio data restored successfully!")
                 
                 # Refresh UI
                 self.refresh_portfolio_list()
                 if hasattr(self, 'portfolio_combo'):
-                    self.portfolio_combo.clear()
-                    self.portfolio_combo.addItems(sorted(self.portfolios.keys()))
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Failed to restore backup: {str(e)}")
+                    self.set_combo_items(self.portfolio_combo, self._sorted_names)
+                    
+            self.run_io_task(read_backup, file_path,
+                             on_done=restore_done, error_message="Failed to restore backup")
     
     def export_portfolio_data(self):
         options = QFileDialog.Options()
@@ -3748,24 +4291,12 @@ class PortfolioTracker(QMainWindow):
         if not file_path:
             return
             
-        try:
-            if file_path.lower().endswith('.csv'):
-                # Export all portfolios to separate CSV files
-                base_path = file_path.replace('.csv', '')
-                for name, df in self.portfolios.items():
-                    safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '_')).rstrip()
-                    df.to_csv(f"{base_path}_{safe_name}.csv", index=False)
-            else:
-                # Export to Excel with each portfolio as a separate sheet
-                with pd.ExcelWriter(file_path) as writer:
-                    for name, df in self.portfolios.items():
-                        safe_name = name[:31]  # Excel sheet name limit
-                        df.to_excel(writer, sheet_name=safe_name, index=False)
-                        
+        def export_done(_):
             self.log_audit("DATA_EXPORTED", "", "", f"File: {file_path}")
             QMessageBox.information(self, "Success", "Portfolio data exported successfully!")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to export data: {str(e)}")
+            
+        self.run_io_task(export_portfolios, dict(self.portfolios), file_path,
+                         on_done=export_done, error_message="Failed to export data")
     
     def import_portfolio_data(self):
         options = QFileDialog.Options()
@@ -3780,37 +4311,34 @@ class PortfolioTracker(QMainWindow):
         if not file_path:
             return
             
-        try:
-            if file_path.lower().endswith('.csv'):
-                # Get portfolio name from filename
-                portfolio_name, ok = QInputDialog.getText(  # This is where we use QInputDialog
-                    self,
-                    "Portfolio Name",
-                    "Enter name for the imported portfolio:"
-                )
+        if file_path.lower().endswith('.csv'):
+            # Get portfolio name from filename
+            portfolio_name, ok = QInputDialog.getText(  # This is where we use QInputDialog
+                self,
+                "Portfolio Name",
+                "Enter name for the imported portfolio:"
+            )
+            
+            if not ok or not portfolio_name:
+                return
                 
-                if not ok or not portfolio_name:
-                    return
-                    
-                df = pd.read_csv(file_path)
-                self.portfolios[portfolio_name] = df
-            else:
-                # Excel file - import all sheets as separate portfolios
-                xls = pd.ExcelFile(file_path)
-                for sheet_name in xls.sheet_names:
-                    df = pd.read_excel(xls, sheet_name=sheet_name)
-                    self.portfolios[sheet_name] = df
-                    
+            read_portfolios = lambda path: {portfolio_name: pd.read_csv(path)}
+        else:
+            read_portfolios = read_excel_portfolios
+            
+        def import_done(imported):
+            self.portfolios.update(imported)
+            self._rebuild_portfolio_names()
             self.log_audit("DATA_IMPORTED", "", "", f"File: {file_path}")
             QMessageBox.information(self, "Success", "Portfolio data imported successfully!")
             
             # Refresh UI
             self.refresh_portfolio_list()
             if hasattr(self, 'portfolio_combo'):
-                self.portfolio_combo.clear()
-                self.portfolio_combo.addItems(sorted(self.portfolios.keys()))
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to import data: {str(e)}")
+                self.set_combo_items(self.portfolio_combo, self._sorted_names)
+                
+        self.run_io_task(read_portfolios, file_path,
+                         on_done=import_done, error_message="Failed to import data")
     
     def clear_all_data(self):
         reply = QMessageBox.question(
@@ -3822,6 +4350,7 @@ class PortfolioTracker(QMainWindow):
         
         if reply == QMessageBox.Yes:
             self.portfolios = {}
+            self._rebuild_portfolio_names()
             self.log_audit("DATA_CLEARED", "", "", "All data cleared")
             
             # Refresh UI
@@ -3902,59 +4431,55 @@ class PortfolioTracker(QMainWindow):
         # Load initial data
         self.refresh_audit_log()
     
-    def refresh_audit_log(self):
+    def sync_audit_cache(self):
+        # Pick up entries appended to the log outside log_audit, reading only the new bytes
+        self._audit_fp.flush()
         try:
-            with open("portfolio_audit.log", "r") as f:
-                log_entries = [line.strip().split(" | ") for line in f.readlines() if line.strip()]
-        except FileNotFoundError:
-            log_entries = []
-            
-        # Apply filters
+            size = os.path.getsize(AUDIT_LOG_PATH)
+        except OSError:
+            return
+        if size < self._audit_offset:
+            # Truncated or replaced outside the app, start over from the tail
+            self._audit_cache, self._audit_offset = read_audit_tail()
+        elif size > self._audit_offset:
+            entries, self._audit_offset = read_audit_since(self._audit_offset)
+            self._audit_cache.extend(entries)
+    
+    def refresh_audit_log(self):
+        self.sync_audit_cache()
         filter_type = self.audit_filter_type.currentText()
         filter_text = self.audit_filter_text.text().lower()
-        
-        filtered_entries = []
-        for entry in log_entries:
-            if len(entry) != 5:
-                continue
+        filtered_entries = [entry for entry in self._audit_cache
+                            if audit_entry_matches(entry, filter_type, filter_text)]
+        
+        # Populate table with repaints, signals and sorting held until the end
+        sorting = self.audit_table.isSortingEnabled()
+        self.audit_table.setUpdatesEnabled(False)
+        self.audit_table.setSortingEnabled(False)
+        self.audit_table.blockSignals(True)
+        try:
+            self.audit_table.setRowCount(len(filtered_entries))
+            for row, entry in enumerate(filtered_entries):
+                timestamp, action, portfolio, item, details = entry
                 
-            timestamp, action, portfolio, item, details = entry
-            
-            # Filter by type
-            if filter_type == "Portfolio" and "PORTFOLIO" not in action:
-                continue
-            elif filter_type == "Stock" and "STOCK" not in action and "SHARES" not in action:
-                continue
-            elif filter_type == "Mutual Fund" and "MF" not in action:
-                continue
-            elif filter_type == "System" and "SYSTEM" not in action and "DATA" not in action and "BACKUP" not in action:
-                continue
+                self.audit_table.setItem(row, 0, QTableWidgetItem(timestamp))
                 
-            # Filter by search text
-            if filter_text and filter_text not in " | ".join(entry).lower():
-                continue
+                action_item = QTableWidgetItem(action)
+                if "ADD" in action:
+                    action_item.setForeground(self._COLOR_ADD)
+                elif "REMOVE" in action or "DELETE" in action:
+                    action_item.setForeground(self._COLOR_DEL)
+                elif "MODIFY" in action:
+                    action_item.setForeground(self._COLOR_MOD)
+                self.audit_table.setItem(row, 1, action_item)
                 
-            filtered_entries.append(entry)
-            
-        # Populate table
-        self.audit_table.setRowCount(len(filtered_entries))
-        for row, entry in enumerate(filtered_entries):
-            timestamp, action, portfolio, item, details = entry
-            
-            self.audit_table.setItem(row, 0, QTableWidgetItem(timestamp))
-            
-            action_item = QTableWidgetItem(action)
-            if "ADD" in action:
-                action_item.setForeground(QColor('#4CAF50'))
-            elif "REMOVE" in action or "DELETE" in action:
-                action_item.setForeground(QColor('#F44336'))
-            elif "MODIFY" in action:
-                action_item.setForeground(QColor('#FFC107'))
-            self.audit_table.setItem(row, 1, action_item)
-            
-            self.audit_table.setItem(row, 2, QTableWidgetItem(portfolio))
-            self.audit_table.setItem(row, 3, QTableWidgetItem(item))
-            self.audit_table.setItem(row, 4, QTableWidgetItem(details))
+                self.audit_table.setItem(row, 2, QTableWidgetItem(portfolio))
+                self.audit_table.setItem(row, 3, QTableWidgetItem(item))
+                self.audit_table.setItem(row, 4, QTableWidgetItem(details))
+        finally:
+            self.audit_table.blockSignals(False)
+            self.audit_table.setSortingEnabled(sorting)
+            self.audit_table.setUpdatesEnabled(True)
     
     def clear_audit_filter(self):
         self.audit_filter_type.setCurrentIndex(0)
@@ -3975,24 +4500,16 @@ class PortfolioTracker(QMainWindow):
             return
             
         try:
-            with open("portfolio_audit.log", "r") as f:
-                log_data = f.read()
-                
+            self._audit_fp.flush()
             if file_path.lower().endswith('.csv'):
-                # Convert to CSV format
-                rows = []
-                for line in log_data.split('\n'):
-                    if line.strip():
-                        rows.append(line.split(" | "))
-                        
-                df = pd.DataFrame(rows, columns=[
-                    "Timestamp", "Action", "Portfolio", "Item", "Details"
-                ])
-                df.to_csv(file_path, index=False)
+                # Convert to CSV format one line at a time
+                with open(AUDIT_LOG_PATH, "r") as src, open(file_path, "w", newline='') as dst:
+                    writer = csv.writer(dst)
+                    writer.writerow(["Timestamp", "Action", "Portfolio", "Item", "Details"])
+                    writer.writerows(line.rstrip('\n').split(" | ") for line in src if line.strip())
             else:
                 # Save as plain text
-                with open(file_path, 'w') as f:
-                    f.write(log_data)
+                shutil.copyfile(AUDIT_LOG_PATH, file_path)
                     
             QMessageBox.information(self, "Success", "Audit log exported successfully!")
         except Exception as e:
@@ -4008,8 +4525,11 @@ class PortfolioTracker(QMainWindow):
         
         if reply == QMessageBox.Yes:
             try:
-                with open("portfolio_audit.log", "w"):
+                self._audit_fp.flush()
+                with open(AUDIT_LOG_PATH, "w"):
                     pass
+                self._audit_cache.clear()
+                self._audit_offset = 0
                 self.refresh_audit_log()
                 QMessageBox.information(self, "Success", "Audit log cleared.")
             except Exception as e:
@@ -4020,24 +4540,38 @@ class PortfolioTracker(QMainWindow):
         log_entry = f"{timestamp} | {action} | {portfolio} | {item} | {details}\n"
         
         try:
-            with open("portfolio_audit.log", "a") as f:
-                f.write(log_entry)
+            self._audit_fp.write(log_entry)
+            self._audit_offset += len(log_entry.encode("utf-8"))
         except Exception as e:
             print(f"Error writing to audit log: {str(e)}")
+        self._audit_cache.append(log_entry.strip().split(" | "))
         
         # Update activity log on main page if it exists
         if hasattr(self, 'activity_log'):
             self.refresh_activity_log()
 
     def load_data(self):
+        # Set when the Parquet store exists but cannot be read; save_data then leaves the disk alone
+        self._store_unreadable = False
         try:
-            if os.path.exists("portfolios.json"):
+            if os.path.exists(PORTFOLIO_INDEX):
+                if not HAS_PYARROW:
+                    self._store_unreadable = True
+                    self.portfolios = {}
+                    message = ("Portfolio data is stored as Parquet but pyarrow is not installed. "
+                               "Install pyarrow to load it; changes made in this session will not be saved.")
+                    print(message)
+                    QMessageBox.critical(self, "Error", message)
+                    return
+                self.portfolios = read_portfolio_store()
+                print("Portfolio data loaded successfully.")
+            elif os.path.exists("portfolios.json"):
                 with open("portfolios.json", "r") as f:
                     data = json.load(f)
                 
                 self.portfolios = {}
-                for name, records in data.items():
-                    self.portfolios[name] = pd.DataFrame(records)
+                for name, payload in data.items():
+                    self.portfolios[name] = frame_from_json(payload)
                     
                 print("Portfolio data loaded successfully.")
         except Exception as e:
@@ -4045,20 +4579,41 @@ class PortfolioTracker(QMainWindow):
             self.portfolios = {}
 
     def save_data(self):
+        if self._store_unreadable:
+            print("Portfolio data not saved: the Parquet store could not be loaded.")
+            return
+            
+        if HAS_PYARROW:
+            try:
+                write_portfolio_store(self.portfolios)
+                if os.path.exists("portfolios.json"):
+                    os.remove("portfolios.json")  # Superseded by the store; never left to drift behind it
+                print("Portfolio data saved successfully.")
+                return
+            except Exception as e:
+                # A missing codec or a column Arrow cannot type must not lose the data; write JSON instead
+                print(f"Error writing Parquet store, saving as JSON instead: {str(e)}")
+                
         try:
-            # Convert DataFrames to dictionaries
+            # Store DataFrames column by column
             save_data = {}
             for name, df in self.portfolios.items():
-                save_data[name] = df.to_dict(orient='records')
+                save_data[name] = frame_to_json(df)
                 
-            with open("portfolios.json", "w") as f:
-                json.dump(save_data, f, indent=4)
+            write_atomic("portfolios.json", dump_json(save_data, indent=False))
+            if os.path.exists(PORTFOLIO_INDEX):
+                os.remove(PORTFOLIO_INDEX)  # Otherwise load_data would prefer the stale Parquet store
                 
             print("Portfolio data saved successfully.")
         except Exception as e:
             print(f"Error saving portfolio data: {str(e)}")
+            QMessageBox.critical(self, "Error", f"Failed to save portfolio data: {str(e)}")
 
     def auto_refresh(self):
+        # Nothing on screen to update while the window is minimised or hidden
+        if self.isMinimized() or not self.isVisible():
+            return
+            
         current_page = self.stacked_widget.currentIndex()
         if current_page == 0:  # Main menu
             self.refresh_market_summary()
@@ -4073,7 +4628,14 @@ class PortfolioTracker(QMainWindow):
         elif current_page == 7:  # Mutual funds
             self.refresh_mf_table()
             
-        self.log_audit("SYSTEM", "", "", "Auto-refresh completed")
+        # Summarise refreshes in the audit log instead of one entry per tick
+        self._auto_refresh_count += 1
+        now = time.monotonic()
+        if now - self._auto_refresh_logged >= AUTO_REFRESH_LOG_SECONDS:
+            self.log_audit("SYSTEM", "", "", f"Auto-refresh completed ({self._auto_refresh_count} runs)")
+            self._auto_refresh_count = 0
+            self._auto_refresh_logged = now
+        self._audit_fp.flush()
 
     def worker_finished(self, worker):
         if worker in self.workers:
@@ -4087,6 +4649,7 @@ class PortfolioTracker(QMainWindow):
             
         # Save data
         self.save_data()
+        self._audit_fp.close()
         
         event.accept()
 
@@ -1,21 +1,34 @@
 import sys
+import io
 import json
 import time
 import threading
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import sqlite3
+from datetime import datetime, timedelta, timezone, time as dtime
+from typing import Dict, List, Optional, Any, Tuple
 import pandas as pd
 import numpy as np
 import yfinance as yf
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QLabel, QPushButton, QTableWidget, QTableWidgetItem,
     QHeaderView, QMessageBox, QDialog, QLineEdit, QComboBox,
     QDoubleSpinBox, QDateEdit, QSpinBox, QGroupBox, QGridLayout,
     QScrollArea, QFrame, QSplitter, QFileDialog, QStackedWidget,
-    QSizePolicy, QSpacerItem, QCheckBox, QFormLayout, QRadioButton
+    QSizePolicy, QSpacerItem, QCheckBox, QFormLayout, QRadioButton, QTableView,
+    QStyledItemDelegate
+)
+from PyQt5.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QTimer, QDate, QSize,
+    QAbstractTableModel, QModelIndex, QSignalBlocker
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QDate, QSize
 from PyQt5.QtGui import QColor, QPalette, QFont, QIcon, QPixmap
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -24,54 +37,600 @@ import seaborn as sns
 from matplotlib.ticker import FuncFormatter
 import os
 import csv
+import mmap
 import shutil
+import glob
+from metrics import performance_metrics, position_pl
+import hashlib
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+APP_QSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "app.qss")
+
+def dump_json(obj, indent=True) -> bytes:
+    """Encode obj as JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode('utf-8')
+
+def load_json(data):
+    """Decode JSON bytes or str, with orjson when it is installed"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def make_session() -> requests.Session:
+    """HTTP session with a sized keep-alive pool that retries throttled and 5xx responses"""
+    session = requests.Session()
+    # Throttling (429) is absorbed by backoff and Retry-After instead of fixed sleeps between requests
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                  respect_retry_after_header=True)
+    session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry))
+    return session
+
+BENCHMARK_TICKER = "^NSEI"  # Nifty 50, used for portfolio beta
+QUOTE_BATCH_SIZE = 20  # Yahoo serves at most ~20 symbols per quote request
+
+def chunked(items: List[str], size: int = QUOTE_BATCH_SIZE):
+    """Yield successive slices of at most size items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+# yf.download keeps its results in module globals that every call resets, so two
+# concurrent downloads can return each other's frames; all calls go through yf_download
+YF_LOCK = threading.Lock()
+
+YF_RETRIES = 3  # Attempts per download; yfinance manages its own HTTP session, so retries live here
+YF_BACKOFF = 0.5  # Seconds before the first retry, doubled on each further attempt
+
+def yf_download(*args, **kwargs) -> pd.DataFrame:
+    """yf.download serialized behind YF_LOCK, retried with exponential backoff when it fails or comes back empty"""
+    for attempt in range(YF_RETRIES):
+        if attempt:
+            time.sleep(YF_BACKOFF * 2 ** (attempt - 1))  # Outside the lock so other downloads can proceed
+        try:
+            with YF_LOCK:
+                data = yf.download(*args, **kwargs)
+        except Exception:
+            if attempt == YF_RETRIES - 1:
+                raise
+            continue
+        if not data.empty or attempt == YF_RETRIES - 1:
+            return data
+
+def download_last_close(tickers: List[str]) -> Dict[str, Optional[float]]:
+    """Fetch the latest close for several tickers with a single yf.download call"""
+    data = yf_download(
+        ' '.join(tickers), period='5d', interval='1d', group_by='column',
+        threads=True, progress=False, auto_adjust=False
+    )
+    prices = dict.fromkeys(tickers)
+    if data.empty:
+        return prices
+    closes = data['Close']
+    if isinstance(closes, pd.Series):  # Older yfinance returns flat columns for a single ticker
+        closes = closes.to_frame(tickers[0])
+    # Last non-missing close of every ticker column in one vectorised pass
+    prices.update(closes.ffill().iloc[-1].dropna().astype(float).to_dict())
+    return prices
+
+def price_holdings(holdings: List[Dict], price_map: Dict[str, Optional[float]]):
+    """Set current price, value and P/L on holdings with NumPy; returns (total_value, total_cost)
+
+    Holdings without a ticker, or whose ticker has no entry in price_map
+    yet, keep their stored fields; a ticker mapped to None (a failed
+    fetch) is zeroed.
+    """
+    n = len(holdings)
+    if n == 0:
+        return 0.0, 0.0
+        
+    quantity = np.fromiter((float(h.get('quantity', 0)) for h in holdings), dtype=np.float64, count=n)
+    avg_price = np.fromiter((float(h.get('average_price', 0)) for h in holdings), dtype=np.float64, count=n)
+    stored_value = np.fromiter((float(h.get('current_value', 0)) for h in holdings), dtype=np.float64, count=n)
+    price = np.array([price_map.get(h.get('ticker')) for h in holdings], dtype=np.float64)  # None -> nan
+    # Only holdings whose ticker has an entry (possibly None) are repriced; the rest wait for their fetch
+    fetched = np.fromiter((bool(h.get('ticker')) and h.get('ticker') in price_map for h in holdings),
+                          dtype=bool, count=n)
+    priced = ~np.isnan(price)
+    price = np.nan_to_num(price)
+    
+    current_value = np.where(fetched, np.where(priced, quantity * price, 0.0), stored_value)
+    total_cost = quantity * avg_price
+    pl_amount = np.where(priced, current_value - total_cost, 0.0)
+    safe_cost = np.where(total_cost > 0, total_cost, 1.0)
+    pl_percent = np.where(priced & (total_cost > 0), pl_amount / safe_cost * 100, 0.0)
+    
+    for holding, update, p, cv, pl, pct in zip(holdings, fetched, price.tolist(), current_value.tolist(),
+                                               pl_amount.tolist(), pl_percent.tolist()):
+        if update:
+            holding.update(current_price=p, current_value=cv, pl_amount=pl, pl_percent=pct)
+            
+    return float(current_value.sum()), float(total_cost.sum())
+
+AMFI_NAV_URL = "https://www.amfiindia.com/spages/NAVAll.txt"  # Daily NAV of every scheme in one file
+NAV_CACHE_TTL = 3600  # Seconds the AMFI snapshot is reused; AMFI publishes NAVs once a day
+NAV_RETRY_DELAY = 60  # Seconds a failed AMFI download is remembered before it is tried again
+SAVE_DEBOUNCE_MS = 750  # Delay before a requested save is written to disk
+DASHBOARD_DEBOUNCE_MS = 50  # Refresh requests within this window run the dashboard refresh once
+BACKUP_KEEP = 5  # Rotating Portfolios_backup_*.json files kept by save_data
+
+AUDIT_LOG_PATH = "audit_log.jsonl"
+LEGACY_AUDIT_LOG_PATH = "audit_log.json"
+
+def migrate_audit_log():
+    """One-off conversion of the legacy JSON-array audit log into JSON lines"""
+    if not os.path.exists(LEGACY_AUDIT_LOG_PATH) or os.path.exists(AUDIT_LOG_PATH):
+        return
+    try:
+        with open(LEGACY_AUDIT_LOG_PATH, 'rb') as f:
+            entries = load_json(f.read())
+    except json.JSONDecodeError:
+        entries = []
+    with open(AUDIT_LOG_PATH, 'wb') as f:
+        f.writelines(dump_json(entry, indent=False) + b'\n' for entry in entries)
+    os.replace(LEGACY_AUDIT_LOG_PATH, LEGACY_AUDIT_LOG_PATH + ".migrated")
+
+def iter_audit_log():
+    """Yield audit entries one line at a time, skipping lines that fail to parse"""
+    try:
+        with open(AUDIT_LOG_PATH, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield load_json(line)
+                except json.JSONDecodeError:
+                    continue
+    except FileNotFoundError:
+        return
 
-class Worker(QThread):
-    """Worker thread for fetching data"""
+IST = timezone(timedelta(hours=5, minutes=30))
+
+def market_open(now: Optional[datetime] = None) -> bool:
+    """True during NSE trading hours (09:15-15:30 IST, Monday to Friday)"""
+    now = now or datetime.now(IST)
+    return now.weekday() < 5 and dtime(9, 15) <= now.time() <= dtime(15, 30)
+
+def price_cache_ttl() -> int:
+    """Seconds a cached close stays valid: 5 minutes while the market trades, else a day"""
+    return 300 if market_open() else 86400
+
+class PriceCache:
+    """Last-close cache kept in SQLite so prices survive restarts"""
+    def __init__(self, path: str = "price_cache.db"):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS prices (ticker TEXT PRIMARY KEY, close REAL, ts INTEGER)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS prices_ts ON prices (ts)")
+            
+    def get_fresh(self, tickers: List[str], max_age: int) -> Dict[str, float]:
+        """Cached closes for tickers updated within the last max_age seconds"""
+        if not tickers:
+            return {}
+        cutoff = int(time.time()) - max_age
+        placeholders = ",".join("?" * len(tickers))
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT ticker, close FROM prices WHERE ts >= ? AND ticker IN ({placeholders})",
+                [cutoff, *tickers]
+            ).fetchall()
+        return dict(rows)
+        
+    def put(self, prices: Dict[str, Optional[float]]):
+        now = int(time.time())
+        rows = [(ticker, price, now) for ticker, price in prices.items() if price is not None]
+        if not rows:
+            return
+        with self.lock, self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO prices (ticker, close, ts) VALUES (?, ?, ?)", rows)
+
+class AuditModel(QAbstractTableModel):
+    """Audit log table model that keeps only line offsets and parses rows as the view asks for them"""
+    HEADERS = ["Timestamp", "Action", "Portfolio", "Symbol/ISIN", "Details"]
+    KEYS = ['timestamp', 'action', 'portfolio', 'symbol', 'details']
+    
+    def __init__(self, path: str = AUDIT_LOG_PATH, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.offsets: List[int] = []
+        self._fp = None
+        self._cached_row = -1
+        self._cached_entry: Dict[str, Any] = {}
+        
+    def reload(self, predicate=None):
+        """Rescan the log, keeping offsets of lines accepted by predicate (newest first)"""
+        self.beginResetModel()
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+        offsets = []
+        if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            self._fp = open(self.path, 'rb')
+            with mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start, size = 0, len(mm)
+                while start < size:
+                    end = mm.find(b'\n', start)
+                    if end == -1:
+                        end = size
+                    line = mm[start:end]
+                    if line.strip():
+                        if predicate is None:
+                            offsets.append(start)
+                        else:
+                            try:
+                                if predicate(load_json(line)):
+                                    offsets.append(start)
+                            except ValueError:
+                                pass
+                    start = end + 1
+        offsets.reverse()  # Entries are appended in time order
+        self.offsets = offsets
+        self._cached_row = -1
+        self.endResetModel()
+        
+    def entry(self, row: int) -> Dict[str, Any]:
+        """Parse the audit entry for a row, reusing the last one since cells are read row by row"""
+        if row != self._cached_row:
+            self._fp.seek(self.offsets[row])
+            try:
+                self._cached_entry = load_json(self._fp.readline())
+            except ValueError:
+                self._cached_entry = {}
+            self._cached_row = row
+        return self._cached_entry
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.offsets)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return str(self.entry(index.row()).get(self.KEYS[index.column()], ''))
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignLeft | Qt.AlignVCenter
+        if role == Qt.ForegroundRole and index.column() == 1:  # Action column
+            action = str(self.entry(index.row()).get('action', '')).upper()
+            if action in ['ERROR', 'DELETE_STOCK', 'DELETE_FUND', 'DELETE_PORTFOLIO', 'CLEAR_DATA']:
+                return QColor('#f44336')  # Red
+            if action in ['WARNING', 'MODIFY_STOCK', 'MODIFY_FUND', 'MODIFY_PORTFOLIO']:
+                return QColor('#FFC107')  # Yellow
+            if action in ['INFO', 'ADD_STOCK', 'ADD_FUND', 'ADD_PORTFOLIO']:
+                return QColor('#4CAF50')  # Green
+            return QColor('#2196F3')  # Blue
+        return None
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+class HoldingsModel(QAbstractTableModel):
+    """Table model that reads stock rows straight from a portfolio's 'stocks' list"""
+    COLUMNS = [
+        ("Name", 'name', "%s"),
+        ("Ticker", 'ticker', "%s"),
+        ("Quantity", 'quantity', "%g"),
+        ("Avg Price", 'average_price', "₹%.2f"),
+        ("Current Price", 'current_price', "₹%.2f"),
+        ("P/L", 'pl_amount', "₹%.2f"),
+        ("P/L %", 'pl_percent', "%.2f%%"),
+        ("Daily P/L", 'daily_pl', "₹%.2f"),
+        ("Daily P/L %", 'daily_pl_percent', "%.2f%%"),
+    ]
+    PL_COLUMNS = (5, 6, 7, 8)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.holdings: List[Dict] = []
+        self._rows: List[tuple] = []  # Per holding: (display strings, raw values), built once per refresh
+        self._order: List[int] = []  # View row -> index into holdings, so sorting never reorders the portfolio
+        
+    def set_holdings(self, holdings: List[Dict]):
+        """Show holdings; when it is the same list with the same rows only the changed cells repaint"""
+        if holdings is self.holdings and len(holdings) == len(self._order):
+            previous = self._rows
+            self._snapshot()
+            self._emit_changed(previous)
+            return
+        self.beginResetModel()
+        self.holdings = holdings
+        self._snapshot()
+        self._order = list(range(len(holdings)))
+        self.endResetModel()
+        
+    def _snapshot(self):
+        """Format every cell once per refresh so data() is a plain lookup while painting"""
+        texts, values = [], []
+        for _, key, fmt in self.COLUMNS:
+            if fmt == "%s":
+                column = ['' if holding.get(key) is None else str(holding.get(key)) for holding in self.holdings]
+                texts.append(column)
+                values.append(column)
+            else:
+                # Numeric columns are formatted in one vectorised pass per column
+                column = np.array([self._number(holding.get(key)) for holding in self.holdings], dtype=np.float64)
+                texts.append(np.char.mod(fmt, column).tolist() if column.size else [])
+                values.append(column.tolist())
+        self._rows = list(zip(zip(*texts), zip(*values)))
+        
+    @staticmethod
+    def _number(value) -> float:
+        try:
+            return float(value or 0.0)
+        except (TypeError, ValueError):
+            return 0.0
+        
+    def _emit_changed(self, previous: List[tuple]):
+        """Emit dataChanged only for the view rows whose formatted cells differ from the previous snapshot"""
+        for row, i in enumerate(self._order):
+            old_texts, new_texts = previous[i][0], self._rows[i][0]
+            if old_texts == new_texts:
+                continue
+            changed = [col for col, (old, new) in enumerate(zip(old_texts, new_texts)) if old != new]
+            self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]))
+            
+    def holding(self, row: int) -> Dict:
+        return self.holdings[self._order[row]]
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[self._order[index.row()]][0][index.column()]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignRight | Qt.AlignVCenter
+        if role == Qt.UserRole:
+            return self._rows[self._order[index.row()]][1][index.column()]
+        return None
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][0]
+        return super().headerData(section, orientation, role)
+        
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self._order.sort(key=lambda i: self._rows[i][1][column], reverse=order == Qt.DescendingOrder)
+        self.layoutChanged.emit()
+
+class FundHoldingsModel(HoldingsModel):
+    """HoldingsModel over a portfolio's 'mutual_funds' list"""
+    COLUMNS = [
+        ("Name", 'name', "%s"),
+        ("ISIN", 'isin', "%s"),
+        ("Units", 'units', "%.4f"),
+        ("Avg NAV", 'average_nav', "₹%.4f"),
+        ("Current NAV", 'current_nav', "₹%.4f"),
+        ("Value", 'current_value', "₹%.2f"),
+        ("P/L", 'pl_amount', "₹%.2f"),
+        ("P/L %", 'pl_percent', "%.2f%%"),
+        ("Last Updated", 'last_updated', "%s"),
+    ]
+    PL_COLUMNS = (6, 7)
+
+class PLDelegate(QStyledItemDelegate):
+    """Paints P/L columns green or red by the sign of the raw value the model exposes as Qt.UserRole"""
+    GAIN_COLOR = QColor('#4CAF50')
+    LOSS_COLOR = QColor('#f44336')
+    
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        self.columns = frozenset(columns)
+        
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if index.column() in self.columns:
+            value = index.data(Qt.UserRole)
+            if value is not None:
+                option.palette.setColor(QPalette.Text, self.GAIN_COLOR if value >= 0 else self.LOSS_COLOR)
+
+class WorkerSignals(QObject):
+    """Signals emitted by Worker; QRunnable is not a QObject so it cannot own them"""
     data_fetched = pyqtSignal(dict)
     finished_signal = pyqtSignal()
     error_signal = pyqtSignal(str)
-    
+
+class Worker(QRunnable):
+    """Pooled task fetching the latest closes chunk by chunk, emitting each chunk's prices"""
     def __init__(self, tickers: List[str]):
         super().__init__()
         self.tickers = tickers
-        self._last_request_time = {}
-        self._request_count = {}
+        self.signals = WorkerSignals()
         
     def run(self):
-        prices = {}
-        for ticker in self.tickers:
+        for chunk in chunked(self.tickers):
             try:
-                # Rate limiting
-                current_time = time.time()
-                if ticker in self._last_request_time:
-                    time_since_last = current_time - self._last_request_time[ticker]
-                    if time_since_last < 2:  # Minimum 2 seconds between requests
-                        time.sleep(2 - time_since_last)
-                
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period="1d")
-                if not hist.empty:
-                    prices[ticker] = hist['Close'].iloc[-1]
-                else:
-                    prices[ticker] = None
-                    
-                self._last_request_time[ticker] = time.time()
-                self._request_count[ticker] = self._request_count.get(ticker, 0) + 1
-                
+                prices = download_last_close(chunk)
             except Exception as e:
-                self.error_signal.emit(f"Error fetching {ticker}: {str(e)}")
-                prices[ticker] = None
-                time.sleep(2)  # Additional delay after error
+                self.signals.error_signal.emit(f"Error fetching {', '.join(chunk)}: {str(e)}")
+                prices = dict.fromkeys(chunk)
+            self.signals.data_fetched.emit(prices)
+        self.signals.finished_signal.emit()
+
+class PrefetchWorker(QRunnable):
+    """Pooled task warming a MarketDataFetcher's intraday cache for several tickers"""
+    def __init__(self, tickers: List[str], data_fetcher: 'MarketDataFetcher'):
+        super().__init__()
+        self.tickers = tickers
+        self.data_fetcher = data_fetcher
+        self.signals = WorkerSignals()
+        
+    def run(self):
+        try:
+            self.data_fetcher.prefetch(self.tickers)
+        except Exception as e:
+            self.signals.error_signal.emit(f"Error prefetching market data: {str(e)}")
+        self.signals.finished_signal.emit()
+
+class RefreshSignals(QObject):
+    """Signals emitted by StockRefreshWorker"""
+    rows_ready = pyqtSignal(list)
+    error_signal = pyqtSignal(str)
+
+class StockRefreshWorker(QRunnable):
+    """Pooled task computing refreshed price and P/L fields for a snapshot of stock holdings"""
+    def __init__(self, stocks: List[Dict], data_fetcher: 'MarketDataFetcher'):
+        super().__init__()
+        # Only the inputs are copied; the holdings themselves are updated on the UI thread
+        self.stocks = [(stock.get('ticker', ''), stock.get('quantity', 0), stock.get('average_price', 0.0))
+                       for stock in stocks]
+        self.data_fetcher = data_fetcher
+        self.signals = RefreshSignals()
+        
+    def run(self):
+        # Fetch every distinct ticker in batched downloads, then compute one update (or None) per holding
+        try:
+            quotes = self.data_fetcher.get_many(sorted({ticker for ticker, _, _ in self.stocks if ticker}))
+        except Exception as e:
+            self.signals.error_signal.emit(f"Error fetching stock data: {str(e)}")
+            quotes = {}
+                
+        # Latest close and session open per ticker; NaN open means no daily change
+        prices = {}
+        for ticker, data in quotes.items():
+            if data is not None and not data.empty:
+                open_price = float(data['Open'].iat[0]) if 'Open' in data else float('nan')
+                prices[ticker] = (float(data['Close'].iat[-1]), open_price)
                 
-        self.data_fetched.emit(prices)
-        self.finished_signal.emit()
+        rows = [None] * len(self.stocks)
+        known = [i for i, (ticker, _, _) in enumerate(self.stocks) if ticker in prices]
+        if not known:
+            self.signals.rows_ready.emit(rows)
+            return
+        try:
+            # One vectorised pass computes the P/L fields of every priced holding
+            current = np.array([prices[self.stocks[i][0]][0] for i in known])
+            opens = np.array([prices[self.stocks[i][0]][1] for i in known])
+            averages = np.array([float(self.stocks[i][2] or 0.0) for i in known])
+            quantities = np.array([float(self.stocks[i][1] or 0.0) for i in known])
+            value, pl, pl_pct, daily_pl, daily_pct = position_pl(current, opens, averages, quantities)
+        except Exception as e:
+            self.signals.error_signal.emit(f"Error updating stock prices: {str(e)}")
+            self.signals.rows_ready.emit(rows)
+            return
+            
+        last_updated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        for j, i in enumerate(known):
+            rows[i] = dict(
+                current_price=float(current[j]),
+                current_value=float(value[j]),
+                pl_amount=float(pl[j]),
+                pl_percent=float(pl_pct[j]),
+                daily_pl=float(daily_pl[j]),
+                daily_pl_percent=float(daily_pct[j]),
+                last_updated=last_updated
+            )
+        self.signals.rows_ready.emit(rows)
+
+class QuoteSignals(QObject):
+    """Signals emitted by PortfolioFetchWorker"""
+    quotes_ready = pyqtSignal(dict, dict)
+    error_signal = pyqtSignal(str)
+
+class PortfolioFetchWorker(QRunnable):
+    """Pooled task looking up the latest price of each ticker and NAV of each ISIN once"""
+    def __init__(self, tickers: List[str], isins: List[str], prices_of, nav_of):
+        super().__init__()
+        self.tickers = tickers
+        self.isins = isins
+        self.prices_of = prices_of
+        self.nav_of = nav_of
+        self.signals = QuoteSignals()
+        
+    def run(self):
+        try:
+            # Tickers are fetched in batched downloads; NAVs all come from one cached AMFI snapshot
+            prices = self.prices_of(self.tickers)
+            navs = {isin: self.nav_of(isin) for isin in self.isins}
+        except Exception as e:
+            self.signals.error_signal.emit(f"Error fetching dashboard quotes: {str(e)}")
+            return
+        self.signals.quotes_ready.emit(prices, navs)
+
+class MetricsSignals(QObject):
+    """Signals emitted by PerformanceMetricsWorker; both carry the request key"""
+    metrics_ready = pyqtSignal(object, dict)
+    error_signal = pyqtSignal(object, str)
+
+class PerformanceMetricsWorker(QRunnable):
+    """Pooled task computing a year of performance metrics for (ticker, quantity) holdings"""
+    def __init__(self, key: tuple, holdings: Tuple[Tuple[str, float], ...]):
+        super().__init__()
+        self.key = key
+        self.holdings = holdings
+        self.signals = MetricsSignals()
+        
+    def run(self):
+        try:
+            tickers = [ticker for ticker, _ in self.holdings]
+            data = yf_download(
+                ' '.join(tickers + [BENCHMARK_TICKER]), period='1y', interval='1d', group_by='column',
+                threads=True, progress=False, auto_adjust=False
+            )
+            # A ticker with no history at all would otherwise make dropna() discard every row
+            closes = data['Close'].dropna(axis=1, how='all').ffill().dropna()
+            available = [ticker for ticker in tickers if ticker in closes.columns]
+            quantities = np.array([qty for ticker, qty in self.holdings if ticker in closes.columns])
+            values = closes[available].to_numpy() @ quantities
+            benchmark = closes[BENCHMARK_TICKER].to_numpy() if BENCHMARK_TICKER in closes.columns else None
+            metrics = performance_metrics(values, benchmark)
+        except Exception as e:
+            self.signals.error_signal.emit(self.key, str(e))
+            return
+        self.signals.metrics_ready.emit(self.key, metrics)
+
+class NavRefreshWorker(QRunnable):
+    """Pooled task running the AMFI NAV snapshot download"""
+    def __init__(self, refresh):
+        super().__init__()
+        self.refresh = refresh
+        self.signals = WorkerSignals()
+        
+    def run(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            self.signals.error_signal.emit(str(e))
+        self.signals.finished_signal.emit()
+
+class SaveWorker(QRunnable):
+    """Pooled task writing already-serialized portfolio data to disk"""
+    def __init__(self, write, payload: bytes):
+        super().__init__()
+        self.write = write
+        self.payload = payload
+        self.signals = WorkerSignals()
+        
+    def run(self):
+        try:
+            self.write(self.payload)
+        except Exception as e:
+            self.signals.error_signal.emit(str(e))
+            return
+        self.signals.finished_signal.emit()
 
 class MarketDataFetcher:
     """Class to handle market data fetching operations"""
-    def __init__(self):
+    def __init__(self, price_cache: Optional[PriceCache] = None):
         self.cache = {}
         self.last_update = {}
+        self.price_cache = price_cache
         
     def get_stock_data(self, ticker: str, force_refresh: bool = False) -> Optional[pd.DataFrame]:
         """Get stock data with caching"""
@@ -80,15 +639,60 @@ class MarketDataFetcher:
             return self.cache[ticker]
             
         try:
-            data = yf.download(ticker, period="1d", interval="1m")
+            data = yf_download(ticker, period="1d", interval="1m", progress=False)
             if not data.empty:
                 self.cache[ticker] = data
                 self.last_update[ticker] = current_time
+                if self.price_cache is not None:
+                    self.price_cache.put({ticker: float(data['Close'].iat[-1])})
                 return data
         except Exception as e:
             print(f"Error fetching data for {ticker}: {str(e)}")
         return None
 
+    def invalidate(self, tickers: Optional[List[str]] = None):
+        """Drop cached data so the next lookup refetches (every ticker when tickers is None)"""
+        if tickers is None:
+            self.cache.clear()
+            self.last_update.clear()
+            return
+        for ticker in tickers:
+            self.cache.pop(ticker, None)
+            self.last_update.pop(ticker, None)
+
+    def get_many(self, tickers: List[str]) -> Dict[str, Optional[pd.DataFrame]]:
+        """Intraday data for several tickers, refreshing the stale ones in batched downloads"""
+        self.prefetch(tickers)
+        return {ticker: self.cache.get(ticker) for ticker in tickers}
+
+    def prefetch(self, tickers: List[str], max_age: int = 300):
+        """Download intraday data for tickers older than max_age in batched requests"""
+        current_time = time.time()
+        stale = [t for t in tickers if current_time - self.last_update.get(t, 0) >= max_age]
+        for chunk in chunked(stale):
+            try:
+                data = yf_download(
+                    ' '.join(chunk), period="1d", interval="1m", group_by='ticker',
+                    threads=True, progress=False
+                )
+            except Exception as e:
+                print(f"Error fetching data for {', '.join(chunk)}: {str(e)}")
+                continue
+            if data.empty:
+                continue
+            for ticker in chunk:
+                if isinstance(data.columns, pd.MultiIndex):
+                    if ticker not in data.columns.get_level_values(0):
+                        continue
+                    frame = data[ticker].dropna(how='all')
+                else:
+                    frame = data
+                if not frame.empty:
+                    self.cache[ticker] = frame
+                    self.last_update[ticker] = current_time
+                    if self.price_cache is not None:
+                        self.price_cache.put({ticker: float(frame['Close'].iat[-1])})
+
 class PortfolioTracker(QMainWindow):
     """Main application window for portfolio tracking and management.
     
@@ -110,86 +714,67 @@ class PortfolioTracker(QMainWindow):
         
         # Initialize core data structures
         self.portfolios = {}  # Dict[str, Dict]: Portfolio name -> Portfolio data
-        self.workers = []     # List[Worker]: Active background workers
-        self.data_fetcher = MarketDataFetcher()
+        self._sorted_portfolio_names: List[str] = []  # Kept in step with portfolios for the combo boxes
+        self.pool = QThreadPool.globalInstance()  # Shared pool for background fetches
+        self.pool.setMaxThreadCount(8)
+        self.session = make_session()  # Keep-alive connections for the AMFI NAV download
+        self.price_cache = PriceCache()
+        self.data_fetcher = MarketDataFetcher(self.price_cache)
+        self.data_file = "Portfolios.json"
+        self._last_backup_hash = None  # md5 of the data file when it was last backed up
+        self._save_pool = QThreadPool(self)  # Single writer, so saves land in the order they were queued
+        self._save_pool.setMaxThreadCount(1)
+        self._dirty_portfolios = set()  # Portfolio names whose cached totals are stale
+        self._metrics_cache = {}  # (portfolio, holdings, date) -> performance metrics
+        self._metrics_pending = set()  # Metric keys with a PerformanceMetricsWorker in flight
+        self._metrics_key = None  # Key of the metrics the Performance tab should show
+        self._nav_table: Dict[str, float] = {}  # ISIN -> NAV from the AMFI snapshot
+        self._nav_fetched_at = 0.0
+        self._nav_failed_at = 0.0  # Last failed AMFI download; lookups skip the network until NAV_RETRY_DELAY passes
+        self._nav_lock = threading.Lock()  # One AMFI download at a time across pool threads
+        self._nav_refresh_pending = False  # A NavRefreshWorker is in flight
+        self._stock_refresh_id = 0  # Latest StockRefreshWorker; older results are discarded
+        self._dashboard_refresh_id = 0  # Latest PortfolioFetchWorker, likewise
+        self._last_stock_portfolio = None  # Portfolio the stock/fund tables were last refreshed for
+        self._last_fund_portfolio = None
+        self._save_timer = QTimer(self)  # Coalesces bursts of save_data calls into one write
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._do_save)
+        self._dashboard_timer = QTimer(self)  # Coalesces bursts of refresh_dashboard calls
+        self._dashboard_timer.setSingleShot(True)
+        self._dashboard_timer.timeout.connect(self._do_refresh_dashboard)
+        
+        # One application-wide stylesheet; widgets opt in through their 'role' property
+        try:
+            with open(APP_QSS_PATH, 'r', encoding='utf-8') as f:
+                QApplication.instance().setStyleSheet(f.read())
+        except OSError as e:
+            print(f"Error loading stylesheet: {str(e)}")
         
         # Load data and initialize UI
-        self.load_data()
+        migrate_audit_log()
+        self._load_from_disk()
         self.init_ui()
         self.setup_refresh_timer()
+        # Show the window first; prices arrive once the background fetch completes
+        QTimer.singleShot(0, self._refresh_prices_async)
         
         # Set up status bar
         self.statusBar().showMessage("Ready")
-        self.statusBar().setStyleSheet("color: white;")
         
     def load_data(self):
-        """Load portfolio data from JSON file and update current prices."""
+        """Load portfolio data from disk and refresh prices in the background."""
+        self._load_from_disk()
+        self._refresh_prices_async()
+
+    def _load_from_disk(self):
+        """Read portfolio data from the JSON file without touching the network."""
         try:
+            self._price_map = {}
             if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    self.portfolios = json.load(f)
-                
-                # Update current prices for all stocks
-                for portfolio_name, portfolio in self.portfolios.items():
-                    if 'stocks' in portfolio:
-                        for stock in portfolio['stocks']:
-                            try:
-                                ticker = stock.get('ticker')
-                                if ticker:
-                                    # Fetch current price using yfinance
-                                    stock_data = yf.Ticker(ticker)
-                                    current_price = stock_data.history(period='1d')['Close'].iloc[-1]
-                                    stock['current_price'] = current_price
-                                    
-                                    # Calculate current value and P/L
-                                    quantity = float(stock.get('quantity', 0))
-                                    avg_price = float(stock.get('average_price', 0))
-                                    current_value = quantity * current_price
-                                    total_cost = quantity * avg_price
-                                    pl_amount = current_value - total_cost
-                                    pl_percent = (pl_amount / total_cost * 100) if total_cost > 0 else 0
-                                    
-                                    stock['current_value'] = current_value
-                                    stock['pl_amount'] = pl_amount
-                                    stock['pl_percent'] = pl_percent
-                            except Exception as e:
-                                self.log_audit_entry("ERROR", ticker, "", f"Error fetching price: {str(e)}")
-                                stock['current_price'] = 0
-                                stock['current_value'] = 0
-                                stock['pl_amount'] = 0
-                                stock['pl_percent'] = 0
-                    
-                    # Update mutual funds similarly if needed
-                    if 'mutual_funds' in portfolio:
-                        for fund in portfolio['mutual_funds']:
-                            try:
-                                ticker = fund.get('ticker')
-                                if ticker:
-                                    fund_data = yf.Ticker(ticker)
-                                    current_price = fund_data.history(period='1d')['Close'].iloc[-1]
-                                    fund['current_price'] = current_price
-                                    
-                                    quantity = float(fund.get('quantity', 0))
-                                    avg_price = float(fund.get('average_price', 0))
-                                    current_value = quantity * current_price
-                                    total_cost = quantity * avg_price
-                                    pl_amount = current_value - total_cost
-                                    pl_percent = (pl_amount / total_cost * 100) if total_cost > 0 else 0
-                                    
-                                    fund['current_value'] = current_value
-                                    fund['pl_amount'] = pl_amount
-                                    fund['pl_percent'] = pl_percent
-                            except Exception as e:
-                                self.log_audit_entry("ERROR", ticker, "", f"Error fetching fund price: {str(e)}")
-                                fund['current_price'] = 0
-                                fund['current_value'] = 0
-                                fund['pl_amount'] = 0
-                                fund['pl_percent'] = 0
-                
-                # Update portfolio totals
-                self.update_portfolio_totals()
-                # Refresh the view
-                self.refresh_portfolio_view()
+                with open(self.data_file, 'rb') as f:
+                    self.portfolios = load_json(f.read())
+                self.mark_portfolios_dirty()
                 self.log_audit_entry("INFO", "", "", "Data loaded successfully")
             else:
                 self.portfolios = {}
@@ -197,50 +782,132 @@ class PortfolioTracker(QMainWindow):
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error loading data: {str(e)}")
             self.portfolios = {}
+        self._reset_portfolio_names()
 
-    def update_portfolio_totals(self):
-        """Update total values for all portfolios."""
-        for portfolio_name, portfolio in self.portfolios.items():
-            total_value = 0
-            total_cost = 0
-            
-            # Calculate totals for stocks
-            if 'stocks' in portfolio:
-                for stock in portfolio['stocks']:
-                    total_value += float(stock.get('current_value', 0))
-                    total_cost += float(stock.get('quantity', 0)) * float(stock.get('average_price', 0))
+    def _reset_portfolio_names(self):
+        """Re-sort the portfolio names after self.portfolios was replaced wholesale."""
+        self._sorted_portfolio_names = sorted(self.portfolios)
+
+    def _refresh_prices_async(self):
+        """Apply cached closes right away and fetch the stale ones on the thread pool."""
+        try:
+            all_tickers = sorted({
+                holding['ticker']
+                for portfolio in self.portfolios.values() if isinstance(portfolio, dict)
+                for holding in portfolio.get('stocks', []) + portfolio.get('mutual_funds', [])
+                if holding.get('ticker')
+            })
+            # Reuse closes cached by an earlier run and only download the stale ones
+            fresh = self.price_cache.get_fresh(all_tickers, price_cache_ttl())
+            if fresh:
+                self._apply_prices(fresh)
+            stale = [ticker for ticker in all_tickers if ticker not in fresh]
+            if stale:
+                self.fetch_prices_async(stale, self._apply_prices)
+        except Exception as e:
+            self.log_audit_entry("ERROR", "", "", f"Error refreshing prices: {str(e)}")
+
+    def _apply_prices(self, price_map: Dict[str, Optional[float]]):
+        """Slot receiving fetched closes; updates holdings, totals and the view."""
+        try:
+            self.price_cache.put(price_map)
+            for ticker, price in price_map.items():
+                if price is None:
+                    self.log_audit_entry("ERROR", ticker, "", "Error fetching price: no data returned")
+            
+            # Only portfolios holding a ticker whose price moved need new totals
+            changed = {
+                ticker for ticker, price in price_map.items()
+                if ticker not in self._price_map or self._price_map[ticker] != price
+            }
+            self._price_map.update(price_map)
+            self.mark_portfolios_dirty([
+                name for name, portfolio in self.portfolios.items() if isinstance(portfolio, dict)
+                and any(h.get('ticker') in changed
+                        for h in portfolio.get('stocks', []) + portfolio.get('mutual_funds', []))
+            ])
             
-            # Calculate totals for mutual funds
-            if 'mutual_funds' in portfolio:
-                for fund in portfolio['mutual_funds']:
-                    total_value += float(fund.get('current_value', 0))
-                    total_cost += float(fund.get('quantity', 0)) * float(fund.get('average_price', 0))
+            # Update holding values, P/L and portfolio totals in one vectorised pass
+            self.update_portfolio_totals(self._price_map)
+            self.refresh_portfolio_view()
+        except Exception as e:
+            self.log_audit_entry("ERROR", "", "", f"Error applying prices: {str(e)}")
+
+    def mark_portfolios_dirty(self, names: Optional[List[str]] = None):
+        """Flag portfolios whose cached totals must be recomputed (all when names is None)."""
+        self._dirty_portfolios.update(self.portfolios if names is None else names)
+
+    def update_portfolio_totals(self, price_map: Dict[str, Optional[float]]):
+        """Price holdings and update cached totals for portfolios flagged dirty."""
+        for portfolio_name, portfolio in self.portfolios.items():
+            if not isinstance(portfolio, dict):
+                continue
+            if portfolio_name not in self._dirty_portfolios and 'total_value' in portfolio:
+                continue
+            holdings = portfolio.get('stocks', []) + portfolio.get('mutual_funds', [])
+            total_value, total_cost = price_holdings(holdings, price_map)
             
             # Update portfolio totals
             portfolio['total_value'] = total_value
             portfolio['total_cost'] = total_cost
             portfolio['total_pl'] = total_value - total_cost
             portfolio['total_pl_percent'] = (portfolio['total_pl'] / total_cost * 100) if total_cost > 0 else 0
+            self._dirty_portfolios.discard(portfolio_name)
 
     def save_data(self):
-        """Save portfolio data to JSON file with proper error handling."""
+        """Schedule a save; edits made within SAVE_DEBOUNCE_MS are written together."""
+        self._save_timer.start(SAVE_DEBOUNCE_MS)
+
+    def _do_save(self):
+        """Serialize the portfolios and queue the write on the single-threaded save pool."""
+        self._save_timer.stop()
         try:
-            # Create backup of current file
-            if os.path.exists("Portfolios.json"):
+            # Encode on the UI thread so the worker never reads dicts that are being edited
+            payload = dump_json(self.portfolios)
+        except Exception as e:
+            self._on_save_error(str(e))
+            return
+        worker = SaveWorker(self._write_data_file, payload)
+        worker.signals.finished_signal.connect(
+            lambda: self.log_audit_entry("INFO", "", "", "Portfolio data saved successfully")
+        )
+        worker.signals.error_signal.connect(self._on_save_error)
+        self._save_pool.start(worker)
+
+    def _on_save_error(self, message: str):
+        self.log_audit_entry("ERROR", "", "", f"Error saving data: {message}")
+        QMessageBox.critical(self, "Error", f"Failed to save data: {message}")
+
+    def _write_data_file(self, payload: bytes):
+        """Back up the data file if it changed, then atomically replace it with payload; runs on the save pool."""
+        # Back up the current file only when it changed since the last backup
+        if os.path.exists(self.data_file):
+            with open(self.data_file, 'rb') as f:
+                digest = hashlib.md5(f.read()).hexdigest()
+            if digest != self._last_backup_hash:
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                backup_path = f"Portfolios_backup_{timestamp}.json"
-                shutil.copy2("Portfolios.json", backup_path)
+                shutil.copy2(self.data_file, f"Portfolios_backup_{timestamp}.json")
+                self._last_backup_hash = digest
+                for old_backup in sorted(glob.glob("Portfolios_backup_*.json"))[:-BACKUP_KEEP]:
+                    os.unlink(old_backup)
 
-            # Save portfolios
-            with open("Portfolios.json", 'w') as f:
-                json.dump(self.portfolios, f, indent=4)
+        # Write to a temp file and swap it in so a crash never leaves a partial file
+        tmp_path = self.data_file + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, self.data_file)
 
-            # Log successful save
-            self.log_audit_entry("INFO", "", "", "Portfolio data saved successfully")
+    def flush_saves(self):
+        """Write a pending debounced save now and block until every queued write is on disk."""
+        if self._save_timer.isActive():
+            self._do_save()
+        self._save_pool.waitForDone()
 
-        except Exception as e:
-            self.log_audit_entry("ERROR", "", "", f"Error saving data: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Failed to save data: {str(e)}")
+    def closeEvent(self, event):
+        """Flush a pending debounced save before the window closes."""
+        # Only the queued writes are waited for; network fetches are abandoned
+        self.flush_saves()
+        super().closeEvent(event)
 
     def log_audit_entry(self, action: str, portfolio: str, symbol: str, details: str):
         """Log an audit entry with proper error handling."""
@@ -254,19 +921,9 @@ class PortfolioTracker(QMainWindow):
                 'details': details
             }
 
-            # Load existing audit log
-            try:
-                with open("audit_log.json", 'r') as f:
-                    audit_log = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                audit_log = []
-
-            # Add new entry
-            audit_log.append(entry)
-
-            # Save audit log
-            with open("audit_log.json", 'w') as f:
-                json.dump(audit_log, f, indent=4)
+            # Append one line instead of rewriting the whole log
+            with open(AUDIT_LOG_PATH, 'ab') as f:
+                f.write(dump_json(entry, indent=False) + b'\n')
 
         except Exception as e:
             print(f"Error logging audit entry: {str(e)}")
@@ -275,12 +932,122 @@ class PortfolioTracker(QMainWindow):
         """Set up timer for periodic data refresh."""
         try:
             self.refresh_timer = QTimer()
-            self.refresh_timer.timeout.connect(self.refresh_all_tables)
+            self.refresh_timer.timeout.connect(self._on_refresh_timer)
             self.refresh_timer.start(300000)  # Refresh every 5 minutes
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error setting up refresh timer: {str(e)}")
             print(f"Error setting up refresh timer: {str(e)}")
-        
+
+    def _on_refresh_timer(self):
+        """Periodic refresh; does nothing while NSE is closed and only refetches stale tickers."""
+        try:
+            if not market_open():
+                return
+            tickers = sorted({
+                stock['ticker']
+                for portfolio in self.portfolios.values() if isinstance(portfolio, dict)
+                for stock in portfolio.get('stocks', []) if stock.get('ticker')
+            })
+            # Download on the pool; the tables refresh from the warmed cache once it is done
+            worker = PrefetchWorker(tickers, self.data_fetcher)
+            worker.signals.finished_signal.connect(self._on_prefetch_done)
+            worker.signals.error_signal.connect(
+                lambda message: self.log_audit_entry("ERROR", "", "", message)
+            )
+            self.pool.start(worker)
+        except Exception as e:
+            self.log_audit_entry("ERROR", "", "", f"Error in scheduled refresh: {str(e)}")
+
+    def _on_prefetch_done(self):
+        """Slot run after the scheduled prefetch; redraws prices and tables from the cache."""
+        try:
+            self._refresh_prices_async()
+            self.refresh_all_tables()
+        except Exception as e:
+            self.log_audit_entry("ERROR", "", "", f"Error in scheduled refresh: {str(e)}")
+
+    def _nav_table_current(self) -> bool:
+        """True while the AMFI snapshot is fresh or a recent download failed and should not be retried yet."""
+        now = time.monotonic()
+        if self._nav_fetched_at and now - self._nav_fetched_at < NAV_CACHE_TTL:
+            return True
+        return bool(self._nav_failed_at) and now - self._nav_failed_at < NAV_RETRY_DELAY
+
+    def _refresh_nav_table(self):
+        """Download AMFI's NAVAll snapshot at most every NAV_CACHE_TTL seconds and index it by ISIN."""
+        if self._nav_table_current():
+            return
+        with self._nav_lock:
+            if self._nav_table_current():  # Another thread finished the download while we waited
+                return
+            try:
+                response = self.session.get(AMFI_NAV_URL, timeout=10)
+                response.raise_for_status()
+                # Scheme Code;ISIN Div Payout/Growth;ISIN Div Reinvestment;Scheme Name;Net Asset Value;Date
+                frame = pd.read_csv(
+                    io.StringIO(response.text), sep=';', header=None, usecols=[1, 2, 4],
+                    names=['code', 'isin', 'isin_reinvest', 'name', 'nav', 'date'],
+                    dtype=str, on_bad_lines='skip'
+                )
+            except Exception:
+                self._nav_failed_at = time.monotonic()
+                raise
+            frame['nav'] = pd.to_numeric(frame['nav'], errors='coerce')
+            navs = pd.concat([
+                frame[['isin', 'nav']],
+                frame[['isin_reinvest', 'nav']].rename(columns={'isin_reinvest': 'isin'})
+            ]).dropna()
+            navs = navs[navs['isin'].str.len() == 12]  # Drops the '-' placeholders for missing ISINs
+            self._nav_table = navs.drop_duplicates('isin').set_index('isin')['nav'].to_dict()
+            self._nav_fetched_at = time.monotonic()
+            self._nav_failed_at = 0.0
+
+    def _start_nav_refresh(self):
+        """Download the AMFI snapshot on the pool and refresh the fund table once it lands."""
+        if self._nav_refresh_pending:
+            return
+        self._nav_refresh_pending = True
+        worker = NavRefreshWorker(self._refresh_nav_table)
+        worker.signals.error_signal.connect(
+            lambda message: self.log_audit_entry("ERROR", "", "", f"Error fetching AMFI NAVs: {message}")
+        )
+        worker.signals.finished_signal.connect(self._on_nav_refresh_done)
+        self.pool.start(worker)
+
+    def _on_nav_refresh_done(self):
+        self._nav_refresh_pending = False
+        self.refresh_fund_table()
+
+    def get_stock_prices(self, tickers: List[str]) -> Dict[str, Optional[float]]:
+        """Latest closes for several tickers, refreshing stale ones in batched downloads"""
+        return {
+            ticker: float(data['Close'].iat[-1]) if data is not None and not data.empty else None
+            for ticker, data in self.data_fetcher.get_many(tickers).items()
+        }
+
+    def get_mutual_fund_nav(self, isin: str) -> Optional[float]:
+        """Latest NAV for an ISIN from the cached AMFI snapshot."""
+        try:
+            self._refresh_nav_table()
+        except Exception as e:
+            self.log_audit_entry("ERROR", "", isin, f"Error fetching AMFI NAVs: {str(e)}")
+        return self._nav_table.get(isin)
+
+    def invalidate_quotes(self):
+        """Force the next refresh to refetch quotes and NAVs after holdings were replaced."""
+        self.data_fetcher.invalidate()
+        self._nav_fetched_at = 0.0
+        self._nav_failed_at = 0.0
+
+    def fetch_prices_async(self, tickers: List[str], on_prices):
+        """Fetch tickers chunk by chunk on one pooled Worker; on_prices receives each chunk's price dict"""
+        worker = Worker(tickers)
+        worker.signals.data_fetched.connect(on_prices)
+        worker.signals.error_signal.connect(
+            lambda message: self.log_audit_entry("ERROR", "", "", message)
+        )
+        self.pool.start(worker)
+
     def init_ui(self):
         """Initialize the user interface with proper styling and error handling."""
         try:
@@ -295,28 +1062,24 @@ class PortfolioTracker(QMainWindow):
             self.stacked_widget = QStackedWidget()
             main_layout.addWidget(self.stacked_widget)
             
-            # Create all pages
+            # Build the main menu now; every other page is created on its first visit
             self.create_main_menu()
-            self.create_portfolio_management()
-            self.create_stock_operations()
-            self.create_mutual_fund_operations()
-            self.create_dashboard_views()
-            self.create_market_analysis()
-            self.create_data_operations()
-            self.create_audit_history()
+            self._page_indices = {'main_menu': 0}  # Page name -> stacked widget index
+            self._page_builders = {
+                'portfolio_management': self.create_portfolio_management,
+                'stock_operations': self.create_stock_operations,
+                'mutual_fund_operations': self.create_mutual_fund_operations,
+                'dashboard': self.create_dashboard_views,
+                'market_analysis': self.create_market_analysis,
+                'data_operations': self.create_data_operations,
+                'audit_history': self.create_audit_history,
+            }
             
             # Show main menu by default
             self.stacked_widget.setCurrentIndex(0)
             
             # Set up status bar
             self.statusBar().showMessage("Ready")
-            self.statusBar().setStyleSheet("""
-                QStatusBar {
-                    background-color: #2b2b2b;
-                    color: white;
-                    padding: 5px;
-                }
-            """)
             
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error initializing UI: {str(e)}")
@@ -333,37 +1096,10 @@ class PortfolioTracker(QMainWindow):
             
             # Add title
             title_label = QLabel("Portfolio Tracker")
-            title_label.setStyleSheet("""
-                QLabel {
-                    color: #ffffff;
-                    font-size: 32px;
-                    font-weight: bold;
-                    padding: 20px;
-                }
-            """)
+            title_label.setProperty('role', 'menu-title')
             title_label.setAlignment(Qt.AlignCenter)
             layout.addWidget(title_label)
             
-            # Create menu buttons with consistent styling
-            button_style = """
-                QPushButton {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 15px;
-                    font-size: 16px;
-                    min-height: 50px;
-                }
-                QPushButton:hover {
-                    background-color: #3daee9;
-                    color: white;
-                }
-                QPushButton:pressed {
-                    background-color: #2980b9;
-                }
-            """
-            
             # Create buttons for each section
             sections = [
                 ("Portfolio Management", self.show_portfolio_management),
@@ -377,7 +1113,7 @@ class PortfolioTracker(QMainWindow):
             
             for text, slot in sections:
                 button = QPushButton(text)
-                button.setStyleSheet(button_style)
+                button.setProperty('role', 'menu')
                 button.clicked.connect(slot)
                 layout.addWidget(button)
                 
@@ -386,7 +1122,7 @@ class PortfolioTracker(QMainWindow):
             
             # Add version info
             version_label = QLabel("Version 1.0.0")
-            version_label.setStyleSheet("color: #666666;")
+            version_label.setProperty('role', 'version')
             version_label.setAlignment(Qt.AlignRight)
             layout.addWidget(version_label)
             
@@ -410,30 +1146,12 @@ class PortfolioTracker(QMainWindow):
             header_layout = QHBoxLayout()
             
             back_button = QPushButton("← Back to Menu")
-            back_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #3daee9;
-                }
-            """)
+            back_button.setProperty('role', 'back')
             back_button.clicked.connect(self.show_main_menu)
             header_layout.addWidget(back_button)
             
             title_label = QLabel("Portfolio Management")
-            title_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 24px;
-                    font-weight: bold;
-                }
-            """)
+            title_label.setProperty('role', 'title')
             title_label.setAlignment(Qt.AlignCenter)
             header_layout.addWidget(title_label)
             
@@ -446,65 +1164,19 @@ class PortfolioTracker(QMainWindow):
             
             # Portfolio combo box
             self.portfolio_combo = QComboBox()
-            self.portfolio_combo.setStyleSheet("""
-                QComboBox {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 5px;
-                    min-width: 200px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                }
-                QComboBox::down-arrow {
-                    image: url(down_arrow.png);
-                    width: 12px;
-                    height: 12px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #2b2b2b;
-                    color: white;
-                    selection-background-color: #3daee9;
-                }
-            """)
+            self.portfolio_combo.setProperty('role', 'portfolio')
             self.portfolio_combo.currentIndexChanged.connect(self.on_portfolio_selected)
             selection_layout.addWidget(self.portfolio_combo)
             
             # Add portfolio button
             add_button = QPushButton("Add Portfolio")
-            add_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #27ae60;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #219a52;
-                }
-            """)
+            add_button.setProperty('role', 'add')
             add_button.clicked.connect(self.show_add_portfolio_dialog)
             selection_layout.addWidget(add_button)
             
             # Delete portfolio button
             delete_button = QPushButton("Delete Portfolio")
-            delete_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #c0392b;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #a93226;
-                }
-            """)
+            delete_button.setProperty('role', 'delete')
             delete_button.clicked.connect(self.delete_portfolio)
             selection_layout.addWidget(delete_button)
             
@@ -512,70 +1184,44 @@ class PortfolioTracker(QMainWindow):
             
             # Create portfolio info section
             info_group = QGroupBox("Portfolio Information")
-            info_group.setStyleSheet("""
-                QGroupBox {
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    margin-top: 10px;
-                    padding-top: 15px;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px;
-                }
-            """)
+            info_group.setProperty('role', 'group')
             info_layout = QGridLayout(info_group)
             
             # Add portfolio info labels
             self.total_value_label = QLabel("Total Value: $0.00")
-            self.total_value_label.setStyleSheet("color: white; font-size: 16px;")
+            self.total_value_label.setProperty('role', 'caption')
             info_layout.addWidget(self.total_value_label, 0, 0)
             
             self.total_gain_label = QLabel("Total Gain/Loss: $0.00 (0.00%)")
-            self.total_gain_label.setStyleSheet("color: white; font-size: 16px;")
+            self.total_gain_label.setProperty('role', 'caption')
             info_layout.addWidget(self.total_gain_label, 0, 1)
             
             self.stock_count_label = QLabel("Stocks: 0")
-            self.stock_count_label.setStyleSheet("color: white; font-size: 16px;")
+            self.stock_count_label.setProperty('role', 'caption')
             info_layout.addWidget(self.stock_count_label, 1, 0)
             
             self.fund_count_label = QLabel("Mutual Funds: 0")
-            self.fund_count_label.setStyleSheet("color: white; font-size: 16px;")
+            self.fund_count_label.setProperty('role', 'caption')
             info_layout.addWidget(self.fund_count_label, 1, 1)
             
             layout.addWidget(info_group)
             
             # Create risk analysis section
             risk_group = QGroupBox("Risk Analysis")
-            risk_group.setStyleSheet("""
-                QGroupBox {
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    margin-top: 10px;
-                    padding-top: 15px;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px;
-                }
-            """)
+            risk_group.setProperty('role', 'group')
             risk_layout = QVBoxLayout(risk_group)
             
             # Add risk analysis labels
             self.risk_score_label = QLabel("Risk Score: N/A")
-            self.risk_score_label.setStyleSheet("color: white; font-size: 16px;")
+            self.risk_score_label.setProperty('role', 'caption')
             risk_layout.addWidget(self.risk_score_label)
             
             self.risk_level_label = QLabel("Risk Level: N/A")
-            self.risk_level_label.setStyleSheet("color: white; font-size: 16px;")
+            self.risk_level_label.setProperty('role', 'caption')
             risk_layout.addWidget(self.risk_level_label)
             
             self.diversification_label = QLabel("Diversification: N/A")
-            self.diversification_label.setStyleSheet("color: white; font-size: 16px;")
+            self.diversification_label.setProperty('role', 'caption')
             risk_layout.addWidget(self.diversification_label)
             
             layout.addWidget(risk_group)
@@ -593,14 +1239,31 @@ class PortfolioTracker(QMainWindow):
             self.log_audit_entry("ERROR", "", "", f"Error creating portfolio management: {str(e)}")
             raise
             
+    def sync_combo_items(self, combo: QComboBox, names: List[str]):
+        """Bring a combo box in line with sorted names by removing and inserting only the differences."""
+        current = [combo.itemText(i) for i in range(combo.count())]
+        if current == names:
+            return
+        selected = combo.currentText()
+        wanted = set(names)
+        for index in reversed(range(len(current))):
+            if current[index] not in wanted:
+                combo.removeItem(index)
+        present = set(current)
+        for name in names:
+            if name not in present:
+                combo.insertItem(bisect_left(names, name), name)
+        if selected in wanted:
+            combo.setCurrentText(selected)
+
     def refresh_portfolio_view(self):
         """Refresh the portfolio management view with current data."""
         try:
+            if 'portfolio_management' not in self._page_indices:
+                return  # Not built yet; show_portfolio_management refreshes it on first visit
             # Update portfolio combo box safely to avoid recursion
-            self.portfolio_combo.blockSignals(True)
-            self.portfolio_combo.clear()
-            self.portfolio_combo.addItems(sorted(self.portfolios.keys()))
-            self.portfolio_combo.blockSignals(False)
+            with QSignalBlocker(self.portfolio_combo):
+                self.sync_combo_items(self.portfolio_combo, self._sorted_portfolio_names)
             portfolio_name = self.portfolio_combo.currentText()
             if not portfolio_name or portfolio_name not in self.portfolios:
                 self.total_value_label.setText("Total Value: $0.00")
@@ -613,14 +1276,17 @@ class PortfolioTracker(QMainWindow):
                 return
 
             portfolio = self.portfolios[portfolio_name]
-            # Calculate values (dummy values for now)
-            total_value = 0.0
-            total_gain = 0.0
+            # Read the totals cached by update_portfolio_totals
+            if portfolio_name in self._dirty_portfolios or 'total_value' not in portfolio:
+                self.update_portfolio_totals(self._price_map)
+            total_value = portfolio.get('total_value', 0.0)
+            total_gain = portfolio.get('total_pl', 0.0)
+            total_gain_percent = portfolio.get('total_pl_percent', 0.0)
             stock_count = len(portfolio.get('stocks', []))
             fund_count = len(portfolio.get('mutual_funds', []))
             # Update labels
             self.total_value_label.setText(f"Total Value: ${total_value:.2f}")
-            self.total_gain_label.setText(f"Total Gain/Loss: ${total_gain:.2f} (0.00%)")
+            self.total_gain_label.setText(f"Total Gain/Loss: ${total_gain:.2f} ({total_gain_percent:.2f}%)")
             self.stock_count_label.setText(f"Stocks: {stock_count}")
             self.fund_count_label.setText(f"Mutual Funds: {fund_count}")
             self.risk_score_label.setText("Risk Score: N/A")
@@ -629,6 +1295,28 @@ class PortfolioTracker(QMainWindow):
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error refreshing portfolio view: {str(e)}")
             
+    def restyle(self, widget: QWidget, **properties):
+        """Set dynamic style properties and re-polish so the app stylesheet picks them up."""
+        for name, value in properties.items():
+            widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
+    def show_page(self, name: str) -> bool:
+        """Switch to a page, building it on first use; False if the builder failed."""
+        if name not in self._page_indices:
+            index = self.stacked_widget.count()
+            self._page_builders[name]()
+            if self.stacked_widget.count() == index:
+                return False  # The builder has already logged and reported its error
+            self._page_indices[name] = index
+        self.stacked_widget.setCurrentIndex(self._page_indices[name])
+        return True
+
+    def page_visible(self, name: str) -> bool:
+        """Whether the named page has been built and is the one currently shown."""
+        return self._page_indices.get(name) == self.stacked_widget.currentIndex()
+
     def show_main_menu(self):
         """Show the main menu page."""
         try:
@@ -640,8 +1328,8 @@ class PortfolioTracker(QMainWindow):
     def show_portfolio_management(self):
         """Show the portfolio management page."""
         try:
-            self.stacked_widget.setCurrentIndex(1)
-            self.refresh_portfolio_view()
+            if self.show_page('portfolio_management'):
+                self.refresh_portfolio_view()
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error showing portfolio management: {str(e)}")
             QMessageBox.warning(self, "Error", f"Failed to show portfolio management: {str(e)}")
@@ -678,6 +1366,7 @@ class PortfolioTracker(QMainWindow):
                 
                 # Remove the portfolio
                 del self.portfolios[portfolio_name]
+                del self._sorted_portfolio_names[bisect_left(self._sorted_portfolio_names, portfolio_name)]
                 self.save_data()
                 
                 # Update UI
@@ -698,26 +1387,7 @@ class PortfolioTracker(QMainWindow):
         dialog = QDialog(self)
         dialog.setWindowTitle("Add Portfolio")
         dialog.setModal(True)
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #1E1E1E;
-            }
-            QLabel {
-                color: white;
-            }
-            QLineEdit {
-                background-color: #2D2D2D;
-                color: white;
-                border: 1px solid #333;
-                border-radius: 3px;
-                padding: 5px;
-            }
-            QPushButton {
-                padding: 8px 20px;
-                border-radius: 3px;
-                font-size: 14px;
-            }
-        """)
+        dialog.setProperty('role', 'form')
         
         layout = QVBoxLayout()
         
@@ -734,28 +1404,10 @@ class PortfolioTracker(QMainWindow):
         button_layout = QHBoxLayout()
         
         add_btn = QPushButton("Add Portfolio")
-        add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        add_btn.setProperty('role', 'confirm')
         
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #757575;
-                color: white;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #616161;
-            }
-        """)
+        cancel_btn.setProperty('role', 'cancel')
         
         button_layout.addWidget(add_btn)
         button_layout.addWidget(cancel_btn)
@@ -794,8 +1446,10 @@ class PortfolioTracker(QMainWindow):
                     'stocks': [],
                     'mutual_funds': []
                 }
+                insort(self._sorted_portfolio_names, name)
+                self.mark_portfolios_dirty([name])
                 
-                self.save_portfolios()
+                self.save_data()
                 self.refresh_portfolio_view()
                 self.log_audit_entry("ADD_PORTFOLIO", name, "", f"Created portfolio: {description}")
                 dialog.accept()
@@ -813,193 +1467,81 @@ class PortfolioTracker(QMainWindow):
         
         dialog.exec_()
         
+    def _make_op_page(self, title: str, combo: QComboBox, buttons, model: HoldingsModel, widths: List[int]) -> QTableView:
+        """Build an operations page (header, portfolio combo, action buttons, holdings table) and add it to the stack.
+        
+        buttons is a sequence of (text, role, slot); returns the page's table view.
+        """
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(15)
+        
+        # Add header with back button
+        header_layout = QHBoxLayout()
+        
+        back_button = QPushButton("← Back to Menu")
+        back_button.setProperty('role', 'back')
+        back_button.clicked.connect(self.show_main_menu)
+        header_layout.addWidget(back_button)
+        
+        title_label = QLabel(title)
+        title_label.setProperty('role', 'title')
+        title_label.setAlignment(Qt.AlignCenter)
+        header_layout.addWidget(title_label)
+        
+        # Add stretch to push title to center
+        header_layout.addStretch()
+        layout.addLayout(header_layout)
+        
+        # Portfolio selection and action buttons
+        selection_layout = QHBoxLayout()
+        combo.setProperty('role', 'portfolio')
+        combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        selection_layout.addWidget(combo)
+        for text, role, slot in buttons:
+            button = QPushButton(text)
+            button.setProperty('role', role)
+            button.clicked.connect(slot)
+            selection_layout.addWidget(button)
+        layout.addLayout(selection_layout)
+        
+        # Model-backed view reading the selected portfolio's holdings directly
+        table = QTableView()
+        table.setModel(model)
+        table.setItemDelegate(PLDelegate(model.PL_COLUMNS, table))
+        table.setProperty('role', 'table')
+        for column, width in enumerate(widths):
+            table.setColumnWidth(column, width)
+        table.setSortingEnabled(True)
+        table.setSelectionBehavior(QTableView.SelectRows)
+        table.setSelectionMode(QTableView.SingleSelection)
+        # Only visible rows are queried; fixed row heights spare the view from measuring every row
+        table.setVerticalScrollMode(QTableView.ScrollPerPixel)
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        layout.addWidget(table)
+        
+        self.stacked_widget.addWidget(page)
+        return table
+        
     def create_stock_operations(self):
         """Create the stock operations page with proper error handling."""
         try:
-            # Create stock operations page
-            stock_page = QWidget()
-            layout = QVBoxLayout(stock_page)
-            layout.setContentsMargins(20, 20, 20, 20)
-            layout.setSpacing(15)
-            
-            # Add header with back button
-            header_layout = QHBoxLayout()
-            
-            back_button = QPushButton("← Back to Menu")
-            back_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #3daee9;
-                }
-            """)
-            back_button.clicked.connect(self.show_main_menu)
-            header_layout.addWidget(back_button)
-            
-            title_label = QLabel("Stock Operations")
-            title_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 24px;
-                    font-weight: bold;
-                }
-            """)
-            title_label.setAlignment(Qt.AlignCenter)
-            header_layout.addWidget(title_label)
-            
-            # Add stretch to push title to center
-            header_layout.addStretch()
-            layout.addLayout(header_layout)
-            
-            # Create portfolio selection section
-            selection_layout = QHBoxLayout()
-            
-            # Portfolio combo box
             self.stock_ops_portfolio_combo = QComboBox()
-            self.stock_ops_portfolio_combo.setStyleSheet("""
-                QComboBox {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 5px;
-                    min-width: 200px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                }
-                QComboBox::down-arrow {
-                    image: url(down_arrow.png);
-                    width: 12px;
-                    height: 12px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #2b2b2b;
-                    color: white;
-                    selection-background-color: #3daee9;
-                }
-            """)
             self.stock_ops_portfolio_combo.currentIndexChanged.connect(self.on_stock_portfolio_selected)
-            selection_layout.addWidget(self.stock_ops_portfolio_combo)
-            
-            # Add stock button
-            add_button = QPushButton("Add Stock")
-            add_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #27ae60;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #219a52;
-                }
-            """)
-            add_button.clicked.connect(self.show_add_stock_dialog)
-            selection_layout.addWidget(add_button)
-            
-            # Modify stock button
-            modify_button = QPushButton("Modify Stock")
-            modify_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2980b9;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #2471a3;
-                }
-            """)
-            modify_button.clicked.connect(self.show_modify_stock_dialog)
-            selection_layout.addWidget(modify_button)
-            
-            # Manage shares button
-            manage_button = QPushButton("Manage Shares")
-            manage_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #8e44ad;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #7d3c98;
-                }
-            """)
-            manage_button.clicked.connect(self.show_manage_shares_dialog)
-            selection_layout.addWidget(manage_button)
-            
-            layout.addLayout(selection_layout)
-            
-            # Create stock table
-            self.stock_table = QTableWidget()
-            self.stock_table.setStyleSheet("""
-                QTableWidget {
-                    background-color: #2b2b2b;
-                    color: white;
-                    gridline-color: #3daee9;
-                    border: none;
-                }
-                QTableWidget::item {
-                    padding: 5px;
-                }
-                QTableWidget::item:selected {
-                    background-color: #3daee9;
-                }
-                QHeaderView::section {
-                    background-color: #2b2b2b;
-                    color: white;
-                    padding: 5px;
-                    border: 1px solid #3daee9;
-                }
-            """)
-            
-            # Set up table columns
-            columns = [
-                "Name", "Ticker", "Quantity", "Avg Price", "Current Price",
-                "P/L", "P/L %", "Daily P/L", "Daily P/L %"
-            ]
-            self.stock_table.setColumnCount(len(columns))
-            self.stock_table.setHorizontalHeaderLabels(columns)
-            
-            # Set column widths
-            self.stock_table.setColumnWidth(0, 150)  # Name
-            self.stock_table.setColumnWidth(1, 100)  # Ticker
-            self.stock_table.setColumnWidth(2, 100)  # Quantity
-            self.stock_table.setColumnWidth(3, 100)  # Avg Price
-            self.stock_table.setColumnWidth(4, 100)  # Current Price
-            self.stock_table.setColumnWidth(5, 100)  # P/L
-            self.stock_table.setColumnWidth(6, 100)  # P/L %
-            self.stock_table.setColumnWidth(7, 100)  # Daily P/L
-            self.stock_table.setColumnWidth(8, 100)  # Daily P/L %
-            
-            # Enable sorting
-            self.stock_table.setSortingEnabled(True)
-            
-            # Enable selection
-            self.stock_table.setSelectionBehavior(QTableWidget.SelectRows)
-            self.stock_table.setSelectionMode(QTableWidget.SingleSelection)
-            
-            layout.addWidget(self.stock_table)
-            
-            # Add page to stacked widget
-            self.stacked_widget.addWidget(stock_page)
-            
-            # Initial refresh
-            self.refresh_stock_table()
+            self.stock_model = HoldingsModel(self)
+            # Name, Ticker, Quantity, Avg Price, Current Price, P/L, P/L %, Daily P/L, Daily P/L %
+            self.stock_table = self._make_op_page(
+                "Stock Operations",
+                self.stock_ops_portfolio_combo,
+                [
+                    ("Add Stock", 'add', self.show_add_stock_dialog),
+                    ("Modify Stock", 'modify', self.show_modify_stock_dialog),
+                    ("Manage Shares", 'manage', self.show_manage_shares_dialog),
+                ],
+                self.stock_model,
+                [150, 100, 100, 100, 100, 100, 100, 100, 100],
+            )
             
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error creating stock operations: {str(e)}")
@@ -1008,8 +1550,8 @@ class PortfolioTracker(QMainWindow):
     def show_stock_operations(self):
         """Show the stock operations page."""
         try:
-            self.stacked_widget.setCurrentIndex(2)
-            self.refresh_stock_table()
+            if self.show_page('stock_operations'):
+                self.refresh_stock_table()
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error showing stock operations: {str(e)}")
             QMessageBox.warning(self, "Error", f"Failed to show stock operations: {str(e)}")
@@ -1017,22 +1559,44 @@ class PortfolioTracker(QMainWindow):
     def on_stock_portfolio_selected(self, index):
         """Handle stock portfolio selection change."""
         try:
-            if index >= 0:
+            # Repopulating or re-selecting the same portfolio must not trigger another network refresh
+            if index >= 0 and self.stock_ops_portfolio_combo.currentText() != self._last_stock_portfolio:
                 self.refresh_stock_table()
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error handling stock portfolio selection: {str(e)}")
             QMessageBox.warning(self, "Error", f"Failed to handle stock portfolio selection: {str(e)}")
             
+    def load_holdings_table(self, view: QTableView, model: HoldingsModel, holdings: List[Dict]):
+        """Load holdings into a table with painting suspended, then reapply the header sort once."""
+        view.setUpdatesEnabled(False)
+        try:
+            model.set_holdings(holdings)
+            if view.isSortingEnabled():
+                header = view.horizontalHeader()
+                column = header.sortIndicatorSection()
+                if 0 <= column < model.columnCount():
+                    model.sort(column, header.sortIndicatorOrder())
+        finally:
+            view.setUpdatesEnabled(True)
+            view.viewport().update()
+
     def refresh_stock_table(self):
         """Refresh the stock operations table with proper error handling."""
         try:
-            portfolio_name = self.stock_ops_portfolio_combo.currentText()
+            # A hidden page is refreshed by show_stock_operations when it is next opened
+            if not self.page_visible('stock_operations'):
+                return
+                
+            # Update portfolio combo box without re-entering on_stock_portfolio_selected
+            combo = self.stock_ops_portfolio_combo
+            with QSignalBlocker(combo):
+                self.sync_combo_items(combo, self._sorted_portfolio_names)
+            portfolio_name = self._last_stock_portfolio = combo.currentText()
             if not portfolio_name or portfolio_name not in self.portfolios:
-                self.stock_table.setRowCount(0)
+                self.stock_model.set_holdings([])
                 return
                 
             portfolio = self.portfolios[portfolio_name]
-            self.stock_table.setRowCount(0)
             
             # Handle both list and dictionary portfolio structures
             stocks = []
@@ -1044,265 +1608,58 @@ class PortfolioTracker(QMainWindow):
                 self.log_audit_entry("WARNING", portfolio_name, "", f"Unexpected portfolio type: {type(portfolio)}")
                 return
                 
-            for stock in stocks:
-                try:
-                    # Get current stock data
-                    data = self.data_fetcher.get_stock_data(stock.get('ticker', ''))
-                    if data is not None and not data.empty:
-                        current_price = data['Close'].iloc[-1]
-                        stock['current_price'] = current_price
-                        stock['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        
-                        # Calculate metrics
-                        quantity = stock.get('quantity', 0)
-                        avg_price = stock.get('average_price', 0.0)
-                        
-                        value = current_price * quantity
-                        investment = avg_price * quantity
-                        pl = value - investment
-                        pl_pct = (pl / investment * 100) if investment > 0 else 0
-                        
-                        # Calculate daily change
-                        daily_pl = 0
-                        daily_return_pct = 0
-                        if 'Open' in data:
-                            daily_pl = (current_price - data['Open'].iloc[0]) * quantity
-                            daily_return_pct = ((current_price - data['Open'].iloc[0]) / data['Open'].iloc[0] * 100)
-                        
-                        # Add row to table
-                        row = self.stock_table.rowCount()
-                        self.stock_table.insertRow(row)
-                        
-                        # Add items to the table
-                        items = [
-                            stock.get('name', ''),
-                            stock.get('ticker', ''),
-                            str(quantity),
-                            f"₹{avg_price:.2f}",
-                            f"₹{current_price:.2f}",
-                            f"₹{pl:.2f}",
-                            f"{pl_pct:.2f}%",
-                            f"₹{daily_pl:.2f}",
-                            f"{daily_return_pct:.2f}%"
-                        ]
-                        
-                        for col, text in enumerate(items):
-                            item = QTableWidgetItem(text)
-                            item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                            
-                            # Color P/L values
-                            if col in [5, 6, 7, 8]:  # P/L columns
-                                value = float(text.replace('₹', '').replace('%', ''))
-                                item.setForeground(QColor('#4CAF50' if value >= 0 else '#f44336'))
-                                
-                            self.stock_table.setItem(row, col, item)
-                            
-                except Exception as e:
-                    self.log_audit_entry(
-                        "ERROR",
-                        portfolio_name,
-                        stock.get('ticker', 'unknown'),
-                        f"Error updating stock: {str(e)}"
-                    )
-                    print(f"Error updating stock {stock.get('ticker', 'unknown')}: {str(e)}")
-                    
-            # Update portfolio combo box
-            self.stock_ops_portfolio_combo.clear()
-            self.stock_ops_portfolio_combo.addItems(sorted(self.portfolios.keys()))
-            if portfolio_name:
-                self.stock_ops_portfolio_combo.setCurrentText(portfolio_name)
+            # Show the stored values now; the worker recomputes prices off the UI thread
+            self.load_holdings_table(self.stock_table, self.stock_model, stocks)
+            self._stock_refresh_id += 1
+            refresh_id = self._stock_refresh_id
+            worker = StockRefreshWorker(stocks, self.data_fetcher)
+            worker.signals.rows_ready.connect(
+                lambda rows: self._apply_stock_rows(refresh_id, portfolio_name, stocks, rows)
+            )
+            worker.signals.error_signal.connect(
+                lambda message: self.log_audit_entry("ERROR", portfolio_name, "", message)
+            )
+            self.statusBar().showMessage(f"Refreshing {portfolio_name}...")
+            self.pool.start(worker)
                 
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error refreshing stock table: {str(e)}")
             QMessageBox.warning(self, "Error", f"Failed to refresh stock table: {str(e)}")
 
+    def _apply_stock_rows(self, refresh_id: int, portfolio_name: str, stocks: List[Dict], rows: List[Optional[Dict]]):
+        """Store a StockRefreshWorker's results on the holdings and repaint the table in one pass"""
+        try:
+            # Drop results overtaken by a newer refresh or by edits to the holdings list
+            if refresh_id != self._stock_refresh_id or len(rows) != len(stocks):
+                return
+            self.statusBar().showMessage("Ready")
+            for stock, update in zip(stocks, rows):
+                if update is not None:
+                    stock.update(update)
+            self.mark_portfolios_dirty([portfolio_name])
+            if self.stock_ops_portfolio_combo.currentText() == portfolio_name:
+                self.load_holdings_table(self.stock_table, self.stock_model, stocks)
+        except Exception as e:
+            self.log_audit_entry("ERROR", portfolio_name, "", f"Error applying stock prices: {str(e)}")
+            
     def create_mutual_fund_operations(self):
         """Create the mutual fund operations page with proper error handling."""
         try:
-            # Create mutual fund operations page
-            fund_page = QWidget()
-            layout = QVBoxLayout(fund_page)
-            layout.setContentsMargins(20, 20, 20, 20)
-            layout.setSpacing(15)
-            
-            # Add header with back button
-            header_layout = QHBoxLayout()
-            
-            back_button = QPushButton("← Back to Menu")
-            back_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #3daee9;
-                }
-            """)
-            back_button.clicked.connect(self.show_main_menu)
-            header_layout.addWidget(back_button)
-            
-            title_label = QLabel("Mutual Fund Operations")
-            title_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 24px;
-                    font-weight: bold;
-                }
-            """)
-            title_label.setAlignment(Qt.AlignCenter)
-            header_layout.addWidget(title_label)
-            
-            # Add stretch to push title to center
-            header_layout.addStretch()
-            layout.addLayout(header_layout)
-            
-            # Create portfolio selection section
-            selection_layout = QHBoxLayout()
-            
-            # Portfolio combo box
             self.fund_ops_portfolio_combo = QComboBox()
-            self.fund_ops_portfolio_combo.setStyleSheet("""
-                QComboBox {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 5px;
-                    min-width: 200px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                }
-                QComboBox::down-arrow {
-                    image: url(down_arrow.png);
-                    width: 12px;
-                    height: 12px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #2b2b2b;
-                    color: white;
-                    selection-background-color: #3daee9;
-                }
-            """)
             self.fund_ops_portfolio_combo.currentIndexChanged.connect(self.on_fund_portfolio_selected)
-            selection_layout.addWidget(self.fund_ops_portfolio_combo)
-            
-            # Add fund button
-            add_button = QPushButton("Add Fund")
-            add_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #27ae60;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #219a52;
-                }
-            """)
-            add_button.clicked.connect(self.show_add_fund_dialog)
-            selection_layout.addWidget(add_button)
-            
-            # Modify fund button
-            modify_button = QPushButton("Modify Fund")
-            modify_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2980b9;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #2471a3;
-                }
-            """)
-            modify_button.clicked.connect(self.show_modify_fund_dialog)
-            selection_layout.addWidget(modify_button)
-            
-            # Manage units button
-            manage_button = QPushButton("Manage Units")
-            manage_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #8e44ad;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #7d3c98;
-                }
-            """)
-            manage_button.clicked.connect(self.show_manage_units_dialog)
-            selection_layout.addWidget(manage_button)
-            
-            layout.addLayout(selection_layout)
-            
-            # Create fund table
-            self.fund_table = QTableWidget()
-            self.fund_table.setStyleSheet("""
-                QTableWidget {
-                    background-color: #2b2b2b;
-                    color: white;
-                    gridline-color: #3daee9;
-                    border: none;
-                }
-                QTableWidget::item {
-                    padding: 5px;
-                }
-                QTableWidget::item:selected {
-                    background-color: #3daee9;
-                }
-                QHeaderView::section {
-                    background-color: #2b2b2b;
-                    color: white;
-                    padding: 5px;
-                    border: 1px solid #3daee9;
-                }
-            """)
-            
-            # Set up table columns
-            columns = [
-                "Name", "ISIN", "Units", "Avg NAV", "Current NAV",
-                "Value", "P/L", "P/L %", "Last Updated"
-            ]
-            self.fund_table.setColumnCount(len(columns))
-            self.fund_table.setHorizontalHeaderLabels(columns)
-            
-            # Set column widths
-            self.fund_table.setColumnWidth(0, 200)  # Name
-            self.fund_table.setColumnWidth(1, 150)  # ISIN
-            self.fund_table.setColumnWidth(2, 100)  # Units
-            self.fund_table.setColumnWidth(3, 100)  # Avg NAV
-            self.fund_table.setColumnWidth(4, 100)  # Current NAV
-            self.fund_table.setColumnWidth(5, 100)  # Value
-            self.fund_table.setColumnWidth(6, 100)  # P/L
-            self.fund_table.setColumnWidth(7, 100)  # P/L %
-            self.fund_table.setColumnWidth(8, 150)  # Last Updated
-            
-            # Enable sorting
-            self.fund_table.setSortingEnabled(True)
-            
-            # Enable selection
-            self.fund_table.setSelectionBehavior(QTableWidget.SelectRows)
-            self.fund_table.setSelectionMode(QTableWidget.SingleSelection)
-            
-            layout.addWidget(self.fund_table)
-            
-            # Add page to stacked widget
-            self.stacked_widget.addWidget(fund_page)
-            
-            # Initial refresh
-            self.refresh_fund_table()
+            self.fund_model = FundHoldingsModel(self)
+            # Name, ISIN, Units, Avg NAV, Current NAV, Value, P/L, P/L %, Last Updated
+            self.fund_table = self._make_op_page(
+                "Mutual Fund Operations",
+                self.fund_ops_portfolio_combo,
+                [
+                    ("Add Fund", 'add', self.show_add_fund_dialog),
+                    ("Modify Fund", 'modify', self.show_modify_fund_dialog),
+                    ("Manage Units", 'manage', self.show_manage_units_dialog),
+                ],
+                self.fund_model,
+                [200, 150, 100, 100, 100, 100, 100, 100, 150],
+            )
             
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error creating mutual fund operations: {str(e)}")
@@ -1311,8 +1668,8 @@ class PortfolioTracker(QMainWindow):
     def show_mutual_fund_operations(self):
         """Show the mutual fund operations page."""
         try:
-            self.stacked_widget.setCurrentIndex(7)
-            self.refresh_fund_table()
+            if self.show_page('mutual_fund_operations'):
+                self.refresh_fund_table()
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error showing mutual fund operations: {str(e)}")
             QMessageBox.warning(self, "Error", f"Failed to show mutual fund operations: {str(e)}")
@@ -1320,7 +1677,8 @@ class PortfolioTracker(QMainWindow):
     def on_fund_portfolio_selected(self, index):
         """Handle mutual fund portfolio selection change."""
         try:
-            if index >= 0:
+            # Repopulating or re-selecting the same portfolio must not trigger another network refresh
+            if index >= 0 and self.fund_ops_portfolio_combo.currentText() != self._last_fund_portfolio:
                 self.refresh_fund_table()
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error handling mutual fund portfolio selection: {str(e)}")
@@ -1329,13 +1687,20 @@ class PortfolioTracker(QMainWindow):
     def refresh_fund_table(self):
         """Refresh the mutual fund operations table with proper error handling."""
         try:
-            portfolio_name = self.fund_ops_portfolio_combo.currentText()
+            # A hidden page is refreshed by show_mutual_fund_operations when it is next opened
+            if not self.page_visible('mutual_fund_operations'):
+                return
+                
+            # Update portfolio combo box without re-entering on_fund_portfolio_selected
+            combo = self.fund_ops_portfolio_combo
+            with QSignalBlocker(combo):
+                self.sync_combo_items(combo, self._sorted_portfolio_names)
+            portfolio_name = self._last_fund_portfolio = combo.currentText()
             if not portfolio_name or portfolio_name not in self.portfolios:
-                self.fund_table.setRowCount(0)
+                self.fund_model.set_holdings([])
                 return
                 
             portfolio = self.portfolios[portfolio_name]
-            self.fund_table.setRowCount(0)
             
             # Handle both list and dictionary portfolio structures
             funds = []
@@ -1347,14 +1712,17 @@ class PortfolioTracker(QMainWindow):
                 self.log_audit_entry("WARNING", portfolio_name, "", f"Unexpected portfolio type: {type(portfolio)}")
                 return
                 
+            # One AMFI download covers every fund; it runs on the pool and the table is
+            # redrawn when it lands, meanwhile each NAV is a lookup in the previous snapshot
+            if not self._nav_table_current():
+                self._start_nav_refresh()
+                
+            last_updated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             for fund in funds:
                 try:
                     # Get current NAV
-                    nav = self.get_mutual_fund_nav(fund.get('isin', ''))
+                    nav = self._nav_table.get(fund.get('isin', ''))
                     if nav is not None:
-                        fund['current_nav'] = nav
-                        fund['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        
                         # Calculate metrics
                         units = fund.get('units', 0.0)
                         avg_nav = fund.get('average_nav', 0.0)
@@ -1364,33 +1732,14 @@ class PortfolioTracker(QMainWindow):
                         pl = value - investment
                         pl_pct = (pl / investment * 100) if investment > 0 else 0
                         
-                        # Add row to table
-                        row = self.fund_table.rowCount()
-                        self.fund_table.insertRow(row)
-                        
-                        # Add items to the table
-                        items = [
-                            fund.get('name', ''),
-                            fund.get('isin', ''),
-                            f"{units:.4f}",
-                            f"₹{avg_nav:.4f}",
-                            f"₹{nav:.4f}",
-                            f"₹{value:.2f}",
-                            f"₹{pl:.2f}",
-                            f"{pl_pct:.2f}%",
-                            fund.get('last_updated', '')
-                        ]
-                        
-                        for col, text in enumerate(items):
-                            item = QTableWidgetItem(text)
-                            item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                            
-                            # Color P/L values
-                            if col in [6, 7]:  # P/L columns
-                                value = float(text.replace('₹', '').replace('%', ''))
-                                item.setForeground(QColor('#4CAF50' if value >= 0 else '#f44336'))
-                                
-                            self.fund_table.setItem(row, col, item)
+                        # Store on the holding; the model reads these fields when rows are painted
+                        fund.update(
+                            current_nav=nav,
+                            current_value=value,
+                            pl_amount=pl,
+                            pl_percent=pl_pct,
+                            last_updated=last_updated
+                        )
                             
                 except Exception as e:
                     self.log_audit_entry(
@@ -1401,11 +1750,8 @@ class PortfolioTracker(QMainWindow):
                     )
                     print(f"Error updating fund {fund.get('isin', 'unknown')}: {str(e)}")
                     
-            # Update portfolio combo box
-            self.fund_ops_portfolio_combo.clear()
-            self.fund_ops_portfolio_combo.addItems(sorted(self.portfolios.keys()))
-            if portfolio_name:
-                self.fund_ops_portfolio_combo.setCurrentText(portfolio_name)
+            self.mark_portfolios_dirty([portfolio_name])
+            self.load_holdings_table(self.fund_table, self.fund_model, funds)
                 
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error refreshing fund table: {str(e)}")
@@ -1424,30 +1770,12 @@ class PortfolioTracker(QMainWindow):
             header_layout = QHBoxLayout()
             
             back_button = QPushButton("← Back to Menu")
-            back_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #3daee9;
-                }
-            """)
+            back_button.setProperty('role', 'back')
             back_button.clicked.connect(self.show_main_menu)
             header_layout.addWidget(back_button)
             
             title_label = QLabel("Portfolio Dashboard")
-            title_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 24px;
-                    font-weight: bold;
-                }
-            """)
+            title_label.setProperty('role', 'title')
             title_label.setAlignment(Qt.AlignCenter)
             header_layout.addWidget(title_label)
             
@@ -1459,48 +1787,16 @@ class PortfolioTracker(QMainWindow):
             selection_layout = QHBoxLayout()
             
             # Portfolio combo box
-            self.dashboard_portfolio_combo = QComboBox()
-            self.dashboard_portfolio_combo.setStyleSheet("""
-                QComboBox {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 5px;
-                    min-width: 200px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                }
-                QComboBox::down-arrow {
-                    image: url(down_arrow.png);
-                    width: 12px;
-                    height: 12px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #2b2b2b;
-                    color: white;
-                    selection-background-color: #3daee9;
-                }
-            """)
+            self.dashboard_portfolio_combo = QComboBox()
+            self.dashboard_portfolio_combo.setProperty('role', 'portfolio')
+            # Size from min-width rather than measuring every portfolio name
+            self.dashboard_portfolio_combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
             self.dashboard_portfolio_combo.currentIndexChanged.connect(self.on_dashboard_portfolio_selected)
             selection_layout.addWidget(self.dashboard_portfolio_combo)
             
             # Add refresh button
             refresh_button = QPushButton("Refresh")
-            refresh_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2980b9;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #2471a3;
-                }
-            """)
+            refresh_button.setProperty('role', 'modify')
             refresh_button.clicked.connect(self.refresh_dashboard)
             selection_layout.addWidget(refresh_button)
             
@@ -1508,27 +1804,7 @@ class PortfolioTracker(QMainWindow):
             
             # Create tab widget for different views
             self.dashboard_tabs = QTabWidget()
-            self.dashboard_tabs.setStyleSheet("""
-                QTabWidget::pane {
-                    border: 1px solid #3daee9;
-                    background-color: #2b2b2b;
-                }
-                QTabBar::tab {
-                    background-color: #2b2b2b;
-                    color: white;
-                    padding: 8px 15px;
-                    border: 1px solid #3daee9;
-                    border-bottom: none;
-                    border-top-left-radius: 5px;
-                    border-top-right-radius: 5px;
-                }
-                QTabBar::tab:selected {
-                    background-color: #3daee9;
-                }
-                QTabBar::tab:hover {
-                    background-color: #2980b9;
-                }
-            """)
+            self.dashboard_tabs.setProperty('role', 'dashboard')
             
             # Create overview tab
             overview_tab = QWidget()
@@ -1537,239 +1813,168 @@ class PortfolioTracker(QMainWindow):
             # Add summary cards
             cards_layout = QHBoxLayout()
             
-            # Total value card
-            self.total_value_card = QFrame()
-            self.total_value_card.setStyleSheet("""
-                QFrame {
-                    background-color: #2b2b2b;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 15px;
-                }
-            """)
-            total_value_layout = QVBoxLayout(self.total_value_card)
-            
-            total_value_label = QLabel("Total Portfolio Value")
-            total_value_label.setStyleSheet("color: white; font-size: 16px;")
-            total_value_layout.addWidget(total_value_label)
-            
-            self.total_value_amount = QLabel("₹0.00")
-            self.total_value_amount.setStyleSheet("color: #4CAF50; font-size: 24px; font-weight: bold;")
-            total_value_layout.addWidget(self.total_value_amount)
-            
+            # Total value and total P/L cards
+            self.total_value_card, self.total_value_amount = self.metric_card(
+                "Total Portfolio Value", "₹0.00", label_role='caption', value_role='amount'
+            )
             cards_layout.addWidget(self.total_value_card)
             
-            # Total P/L card
-            self.total_pl_card = QFrame()
-            self.total_pl_card.setStyleSheet("""
-                QFrame {
-                    background-color: #2b2b2b;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 15px;
-                }
-            """)
-            total_pl_layout = QVBoxLayout(self.total_pl_card)
-            
-            total_pl_label = QLabel("Total Profit/Loss")
-            total_pl_label.setStyleSheet("color: white; font-size: 16px;")
-            total_pl_layout.addWidget(total_pl_label)
-            
-            self.total_pl_amount = QLabel("₹0.00 (0.00%)")
-            self.total_pl_amount.setStyleSheet("color: #4CAF50; font-size: 24px; font-weight: bold;")
-            total_pl_layout.addWidget(self.total_pl_amount)
-            
+            self.total_pl_card, self.total_pl_amount = self.metric_card(
+                "Total Profit/Loss", "₹0.00 (0.00%)", label_role='caption', value_role='amount'
+            )
             cards_layout.addWidget(self.total_pl_card)
             
             # Asset allocation card
             self.allocation_card = QFrame()
-            self.allocation_card.setStyleSheet("""
-                QFrame {
-                    background-color: #2b2b2b;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 15px;
-                }
-            """)
+            self.allocation_card.setProperty('role', 'card')
             allocation_layout = QVBoxLayout(self.allocation_card)
             
             allocation_label = QLabel("Asset Allocation")
-            allocation_label.setStyleSheet("color: white; font-size: 16px;")
+            allocation_label.setProperty('role', 'caption')
             allocation_layout.addWidget(allocation_label)
             
-            self.allocation_chart = QLabel("Chart will be displayed here")
-            self.allocation_chart.setStyleSheet("color: white; font-size: 14px;")
-            self.allocation_chart.setAlignment(Qt.AlignCenter)
-            allocation_layout.addWidget(self.allocation_chart)
+            # One reusable row per asset type; refreshes only retext rows whose share changed
+            self.allocation_rows = []
+            for _ in range(2):
+                row = QLabel()
+                row.setProperty('role', 'field')
+                row.setAlignment(Qt.AlignCenter)
+                allocation_layout.addWidget(row)
+                self.allocation_rows.append(row)
+            self.set_row_texts(self.allocation_rows, ["No data available"])
             
             cards_layout.addWidget(self.allocation_card)
             
             overview_layout.addLayout(cards_layout)
             
             # Add performance chart
-            self.performance_chart = QLabel("Performance chart will be displayed here")
-            self.performance_chart.setStyleSheet("""
-                QLabel {
-                    background-color: #2b2b2b;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 15px;
-                    color: white;
-                    font-size: 14px;
-                }
-            """)
-            self.performance_chart.setAlignment(Qt.AlignCenter)
-            self.performance_chart.setMinimumHeight(300)
-            overview_layout.addWidget(self.performance_chart)
+            self.dashboard_performance_chart = QLabel("Performance chart will be displayed here")
+            self.dashboard_performance_chart.setProperty('role', 'chart')
+            self.dashboard_performance_chart.setAlignment(Qt.AlignCenter)
+            self.dashboard_performance_chart.setMinimumHeight(300)
+            overview_layout.addWidget(self.dashboard_performance_chart)
             
             # Add tab to tab widget
             self.dashboard_tabs.addTab(overview_tab, "Overview")
             
-            # Create performance tab
-            performance_tab = QWidget()
-            performance_layout = QVBoxLayout(performance_tab)
-            
-            # Add performance metrics
-            metrics_layout = QGridLayout()
-            
-            # Add metric cards
-            metrics = [
-                ("Total Return", "0.00%"),
-                ("Annualized Return", "0.00%"),
-                ("Sharpe Ratio", "0.00"),
-                ("Max Drawdown", "0.00%"),
-                ("Volatility", "0.00%"),
-                ("Beta", "0.00")
-            ]
-            
-            for i, (label, value) in enumerate(metrics):
-                card = QFrame()
-                card.setStyleSheet("""
-                    QFrame {
-                        background-color: #2b2b2b;
-                        border: 2px solid #3daee9;
-                        border-radius: 5px;
-                        padding: 15px;
-                    }
-                """)
-                card_layout = QVBoxLayout(card)
-                
-                metric_label = QLabel(label)
-                metric_label.setStyleSheet("color: white; font-size: 14px;")
-                card_layout.addWidget(metric_label)
-                
-                metric_value = QLabel(value)
-                metric_value.setStyleSheet("color: #4CAF50; font-size: 18px; font-weight: bold;")
-                card_layout.addWidget(metric_value)
-                
-                metrics_layout.addWidget(card, i // 3, i % 3)
-                
-            performance_layout.addLayout(metrics_layout)
-            
-            # Add detailed performance chart
-            self.detailed_performance_chart = QLabel("Detailed performance chart will be displayed here")
-            self.detailed_performance_chart.setStyleSheet("""
-                QLabel {
-                    background-color: #2b2b2b;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 15px;
-                    color: white;
-                    font-size: 14px;
-                }
-            """)
-            self.detailed_performance_chart.setAlignment(Qt.AlignCenter)
-            self.detailed_performance_chart.setMinimumHeight(300)
-            performance_layout.addWidget(self.detailed_performance_chart)
-            
-            # Add tab to tab widget
-            self.dashboard_tabs.addTab(performance_tab, "Performance")
-            
-            # Create allocation tab
-            allocation_tab = QWidget()
-            allocation_layout = QVBoxLayout(allocation_tab)
-            
-            # Add allocation charts
-            charts_layout = QHBoxLayout()
-            
-            # Asset type allocation
-            self.asset_type_chart = QLabel("Asset type allocation chart will be displayed here")
-            self.asset_type_chart.setStyleSheet("""
-                QLabel {
-                    background-color: #2b2b2b;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 15px;
-                    color: white;
-                    font-size: 14px;
-                }
-            """)
-            self.asset_type_chart.setAlignment(Qt.AlignCenter)
-            self.asset_type_chart.setMinimumHeight(300)
-            charts_layout.addWidget(self.asset_type_chart)
-            
-            # Sector allocation
-            self.sector_chart = QLabel("Sector allocation chart will be displayed here")
-            self.sector_chart.setStyleSheet("""
-                QLabel {
-                    background-color: #2b2b2b;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 15px;
-                    color: white;
-                    font-size: 14px;
-                }
-            """)
-            self.sector_chart.setAlignment(Qt.AlignCenter)
-            self.sector_chart.setMinimumHeight(300)
-            charts_layout.addWidget(self.sector_chart)
-            
-            allocation_layout.addLayout(charts_layout)
-            
-            # Add tab to tab widget
-            self.dashboard_tabs.addTab(allocation_tab, "Allocation")
+            # Performance and Allocation are filled in on their first visit
+            self.performance_metric_labels = {}  # Metric name -> value label
+            self.detailed_performance_chart = None
+            self.asset_type_chart = None
+            self.sector_chart = None
+            self._dashboard_allocation = None  # (asset, sector) allocation from the last refresh
+            self._allocation_bars = {}  # Allocation canvas -> (category labels, bar artists)
+            self._dashboard_tab_builders = {
+                self.dashboard_tabs.addTab(QWidget(), "Performance"): self._build_performance_tab,
+                self.dashboard_tabs.addTab(QWidget(), "Allocation"): self._build_allocation_tab,
+            }
+            self.dashboard_tabs.currentChanged.connect(self._on_dashboard_tab_changed)
             
             layout.addWidget(self.dashboard_tabs)
             
             # Add page to stacked widget
             self.stacked_widget.addWidget(dashboard_page)
             
-            # Initial refresh
-            self.refresh_dashboard()
-            
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error creating dashboard views: {str(e)}")
             raise
             
+    def metric_card(self, label: str, value: str, label_role: str = 'field',
+                    value_role: str = 'metric') -> Tuple[QFrame, QLabel]:
+        """A dashboard card with a caption over a value; returns the card and its value label."""
+        card = QFrame()
+        card.setProperty('role', 'card')
+        card_layout = QVBoxLayout(card)
+        
+        caption = QLabel(label)
+        caption.setProperty('role', label_role)
+        card_layout.addWidget(caption)
+        
+        value_label = QLabel(value)
+        value_label.setProperty('role', value_role)
+        card_layout.addWidget(value_label)
+        return card, value_label
+        
+    def _build_performance_tab(self, performance_tab: QWidget):
+        """Build the Performance tab's metric cards and chart into its placeholder."""
+        performance_layout = QVBoxLayout(performance_tab)
+        
+        # Add performance metrics
+        metrics_layout = QGridLayout()
+        
+        # Add metric cards
+        metrics = [
+            ("Total Return", "0.00%"),
+            ("Annualized Return", "0.00%"),
+            ("Sharpe Ratio", "0.00"),
+            ("Max Drawdown", "0.00%"),
+            ("Volatility", "0.00%"),
+            ("Beta", "0.00")
+        ]
+        
+        for i, (label, value) in enumerate(metrics):
+            card, self.performance_metric_labels[label] = self.metric_card(label, value)
+            metrics_layout.addWidget(card, i // 3, i % 3)
+            
+        performance_layout.addLayout(metrics_layout)
+        
+        # Add detailed performance chart
+        self.detailed_performance_chart = QLabel("Detailed performance chart will be displayed here")
+        self.detailed_performance_chart.setProperty('role', 'chart')
+        self.detailed_performance_chart.setAlignment(Qt.AlignCenter)
+        self.detailed_performance_chart.setMinimumHeight(300)
+        performance_layout.addWidget(self.detailed_performance_chart)
+        
+        portfolio_name = self.dashboard_portfolio_combo.currentText()
+        if portfolio_name in self.portfolios:
+            self.update_dashboard_performance_chart(portfolio_name)
+            self.update_performance_metrics(portfolio_name)
+            
+    def _build_allocation_tab(self, allocation_tab: QWidget):
+        """Build the Allocation tab's charts into its placeholder."""
+        allocation_layout = QVBoxLayout(allocation_tab)
+        
+        # Add allocation charts
+        charts_layout = QHBoxLayout()
+        
+        # Asset type and sector allocation bar charts
+        self.asset_type_chart = FigureCanvas(Figure(figsize=(4, 4)))
+        self.asset_type_chart.figure.patch.set_facecolor('#2D2D2D')
+        self.asset_type_chart.setMinimumHeight(300)
+        charts_layout.addWidget(self.asset_type_chart)
+        
+        self.sector_chart = FigureCanvas(Figure(figsize=(4, 4)))
+        self.sector_chart.figure.patch.set_facecolor('#2D2D2D')
+        self.sector_chart.setMinimumHeight(300)
+        charts_layout.addWidget(self.sector_chart)
+        
+        allocation_layout.addLayout(charts_layout)
+        
+        if self._dashboard_allocation is not None:
+            self.update_dashboard_allocation_charts(*self._dashboard_allocation)
+            
+    def _on_dashboard_tab_changed(self, index: int):
+        """Build a dashboard tab the first time it is shown."""
+        builder = self._dashboard_tab_builders.pop(index, None)
+        if builder is None:
+            return
+        try:
+            builder(self.dashboard_tabs.widget(index))
+        except Exception as e:
+            self.log_audit_entry("ERROR", "", "", f"Error building dashboard tab: {str(e)}")
+            
     def show_dashboard_views(self):
         """Show the dashboard views page."""
         try:
-            # Find the index of the dashboard page in the stacked widget
-            for i in range(self.stacked_widget.count()):
-                if isinstance(self.stacked_widget.widget(i), QWidget) and hasattr(self.stacked_widget.widget(i), 'layout'):
-                    if self.stacked_widget.widget(i).layout().itemAt(0) and isinstance(self.stacked_widget.widget(i).layout().itemAt(0).widget(), QHBoxLayout):
-                        if isinstance(self.stacked_widget.widget(i).layout().itemAt(0).widget().itemAt(1).widget(), QLabel):
-                            if self.stacked_widget.widget(i).layout().itemAt(0).widget().itemAt(1).widget().text() == "Portfolio Dashboard":
-                                self.stacked_widget.setCurrentIndex(i)
-                                self.refresh_dashboard()
-                                return
-            
-            # If we get here, we couldn't find the dashboard page
-            self.log_audit_entry("ERROR", "", "", "Dashboard page not found in stacked widget")
-            QMessageBox.warning(self, "Error", "Failed to show dashboard views: Dashboard page not found")
-            
+            if self.show_page('dashboard'):
+                self.refresh_dashboard()
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error showing dashboard views: {str(e)}")
             QMessageBox.warning(self, "Error", f"Failed to show dashboard views: {str(e)}")
 
     def show_dashboard(self):
-        """Show the dashboard page."""
-        try:
-            self.stacked_widget.setCurrentIndex(8)
-            self.refresh_dashboard()
-        except Exception as e:
-            self.log_audit_entry("ERROR", "", "", f"Error showing dashboard: {str(e)}")
-            QMessageBox.warning(self, "Error", f"Failed to show dashboard: {str(e)}")
+        """Show the dashboard page; same as show_dashboard_views."""
+        self.show_dashboard_views()
             
     def on_dashboard_portfolio_selected(self, index):
         """Handle dashboard portfolio selection change."""
@@ -1781,24 +1986,27 @@ class PortfolioTracker(QMainWindow):
             QMessageBox.warning(self, "Error", f"Failed to handle dashboard portfolio selection: {str(e)}")
             
     def refresh_dashboard(self):
+        """Schedule a dashboard refresh; requests within DASHBOARD_DEBOUNCE_MS run it once."""
+        self._dashboard_timer.start(DASHBOARD_DEBOUNCE_MS)
+        
+    def _do_refresh_dashboard(self):
         """Refresh the dashboard with proper error handling."""
         try:
-            portfolio_name = self.dashboard_portfolio_combo.currentText()
+            # A hidden dashboard is refreshed by show_dashboard_views when it is next opened
+            if not self.page_visible('dashboard'):
+                return
+                
+            # Update portfolio combo box without re-entering on_dashboard_portfolio_selected
+            combo = self.dashboard_portfolio_combo
+            with QSignalBlocker(combo):
+                self.sync_combo_items(combo, self._sorted_portfolio_names)
+            portfolio_name = combo.currentText()
             if not portfolio_name or portfolio_name not in self.portfolios:
                 self.clear_dashboard()
                 return
                 
             portfolio = self.portfolios[portfolio_name]
             
-            # Calculate portfolio metrics
-            total_value = 0.0
-            total_investment = 0.0
-            asset_allocation = {
-                'stocks': 0.0,
-                'mutual_funds': 0.0
-            }
-            sector_allocation = {}
-            
             # Handle both list and dictionary portfolio structures
             stocks = []
             funds = []
@@ -1811,67 +2019,75 @@ class PortfolioTracker(QMainWindow):
                 self.log_audit_entry("WARNING", portfolio_name, "", f"Unexpected portfolio type: {type(portfolio)}")
                 return
                 
-            # Process stocks
+            # Look up each distinct ticker and ISIN once, off the UI thread
+            self._dashboard_refresh_id += 1
+            refresh_id = self._dashboard_refresh_id
+            worker = PortfolioFetchWorker(
+                list({stock.get('ticker', '') for stock in stocks}),
+                list({fund.get('isin', '') for fund in funds}),
+                self.get_stock_prices, self.get_mutual_fund_nav
+            )
+            worker.signals.quotes_ready.connect(
+                lambda prices, navs: self._apply_dashboard_quotes(refresh_id, portfolio_name, stocks, funds, prices, navs)
+            )
+            worker.signals.error_signal.connect(
+                lambda message: self.log_audit_entry("ERROR", portfolio_name, "", message)
+            )
+            self.pool.start(worker)
+            
+        except Exception as e:
+            self.log_audit_entry("ERROR", "", "", f"Error refreshing dashboard: {str(e)}")
+            QMessageBox.warning(self, "Error", f"Failed to refresh dashboard: {str(e)}")
+            
+    def _apply_dashboard_quotes(self, refresh_id: int, portfolio_name: str, stocks: List[Dict], funds: List[Dict],
+                                prices: Dict[str, Optional[float]], navs: Dict[str, Optional[float]]):
+        """Store a PortfolioFetchWorker's quotes on the holdings and update the dashboard totals and charts."""
+        try:
+            # Drop results overtaken by a newer refresh
+            if refresh_id != self._dashboard_refresh_id:
+                return
+                
+            # Record the fetched quotes on the holdings
+            now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             for stock in stocks:
-                try:
-                    # Get current price
-                    price = self.get_stock_price(stock.get('ticker', ''))
-                    if price is not None:
-                        stock['current_price'] = price
-                        stock['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        
-                        # Calculate metrics
-                        quantity = stock.get('quantity', 0)
-                        avg_price = stock.get('average_price', 0.0)
-                        
-                        value = price * quantity
-                        investment = avg_price * quantity
-                        
-                        total_value += value
-                        total_investment += investment
-                        asset_allocation['stocks'] += value
-                        
-                        # Update sector allocation
-                        sector = stock.get('sector', 'Unknown')
-                        sector_allocation[sector] = sector_allocation.get(sector, 0.0) + value
-                        
-                except Exception as e:
-                    self.log_audit_entry(
-                        "ERROR",
-                        portfolio_name,
-                        stock.get('ticker', 'unknown'),
-                        f"Error updating stock: {str(e)}"
-                    )
-                    print(f"Error updating stock {stock.get('ticker', 'unknown')}: {str(e)}")
-                    
-            # Process mutual funds
+                price = prices.get(stock.get('ticker', ''))
+                if price is not None:
+                    stock['current_price'] = price
+                    stock['last_updated'] = now
             for fund in funds:
-                try:
-                    # Get current NAV
-                    nav = self.get_mutual_fund_nav(fund.get('isin', ''))
-                    if nav is not None:
-                        fund['current_nav'] = nav
-                        fund['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        
-                        # Calculate metrics
-                        units = fund.get('units', 0.0)
-                        avg_nav = fund.get('average_nav', 0.0)
-                        
-                        value = nav * units
-                        investment = avg_nav * units
-                        
-                        total_value += value
-                        total_investment += investment
-                        asset_allocation['mutual_funds'] += value
-                        
-                except Exception as e:
-                    self.log_audit_entry(
-                        "ERROR",
-                        portfolio_name,
-                        fund.get('isin', 'unknown'),
-                        f"Error updating fund: {str(e)}"
-                    )
-                    print(f"Error updating fund {fund.get('isin', 'unknown')}: {str(e)}")
+                nav = navs.get(fund.get('isin', ''))
+                if nav is not None:
+                    fund['current_nav'] = nav
+                    fund['last_updated'] = now
+                    
+            # Value and cost of every holding in one vectorised pass; holdings without a quote are left out
+            # (None becomes NaN in a float64 array)
+            stock_px = np.array([prices.get(stock.get('ticker', '')) for stock in stocks], dtype=np.float64)
+            stock_qty = np.array([stock.get('quantity', 0) or 0 for stock in stocks], dtype=np.float64)
+            stock_avg = np.array([stock.get('average_price', 0.0) or 0 for stock in stocks], dtype=np.float64)
+            fund_nav = np.array([navs.get(fund.get('isin', '')) for fund in funds], dtype=np.float64)
+            fund_units = np.array([fund.get('units', 0.0) or 0 for fund in funds], dtype=np.float64)
+            fund_avg = np.array([fund.get('average_nav', 0.0) or 0 for fund in funds], dtype=np.float64)
+            
+            stock_priced = ~np.isnan(stock_px)
+            fund_priced = ~np.isnan(fund_nav)
+            stock_values = stock_px * stock_qty
+            fund_values = fund_nav * fund_units
+            asset_allocation = {
+                'stocks': float(np.nansum(stock_values)),
+                'mutual_funds': float(np.nansum(fund_values))
+            }
+            total_value = asset_allocation['stocks'] + asset_allocation['mutual_funds']
+            total_investment = float((stock_avg * stock_qty)[stock_priced].sum() + (fund_avg * fund_units)[fund_priced].sum())
+            
+            sectors = [stock.get('sector', 'Unknown') for stock in stocks]
+            sector_allocation = (
+                pd.Series(stock_values[stock_priced])
+                .groupby(np.asarray(sectors, dtype=object)[stock_priced])
+                .sum()
+                .to_dict()
+                if stock_priced.any() else {}
+            )
                     
             # Update UI
             self.total_value_amount.setText(f"₹{total_value:.2f}")
@@ -1882,21 +2098,22 @@ class PortfolioTracker(QMainWindow):
             self.total_pl_amount.setText(
                 f"₹{total_pl:.2f} ({total_pl_pct:.2f}%)"
             )
-            self.total_pl_amount.setStyleSheet(
-                f"color: {'#4CAF50' if total_pl >= 0 else '#f44336'}; "
-                "font-size: 24px; font-weight: bold;"
-            )
+            self.restyle(self.total_pl_amount, sign='gain' if total_pl >= 0 else 'loss')
+            
+            if total_value > 0:
+                self.set_row_texts(self.allocation_rows, [
+                    f"{asset_type.replace('_', ' ').title()}: {value / total_value * 100:.1f}%"
+                    for asset_type, value in asset_allocation.items()
+                ])
+            else:
+                self.set_row_texts(self.allocation_rows, ["No data available"])
             
             # Update charts
-            self.update_allocation_charts(asset_allocation, sector_allocation)
-            self.update_performance_chart(portfolio_name)
+            self._dashboard_allocation = (asset_allocation, sector_allocation)
+            self.update_dashboard_allocation_charts(asset_allocation, sector_allocation)
+            self.update_dashboard_performance_chart(portfolio_name)
+            self.update_performance_metrics(portfolio_name)
             
-            # Update portfolio combo box
-            self.dashboard_portfolio_combo.clear()
-            self.dashboard_portfolio_combo.addItems(sorted(self.portfolios.keys()))
-            if portfolio_name:
-                self.dashboard_portfolio_combo.setCurrentText(portfolio_name)
-                
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error refreshing dashboard: {str(e)}")
             QMessageBox.warning(self, "Error", f"Failed to refresh dashboard: {str(e)}")
@@ -1906,21 +2123,27 @@ class PortfolioTracker(QMainWindow):
         try:
             self.total_value_amount.setText("₹0.00")
             self.total_pl_amount.setText("₹0.00 (0.00%)")
-            self.total_pl_amount.setStyleSheet("color: #4CAF50; font-size: 24px; font-weight: bold;")
-            
-            self.allocation_chart.setText("No data available")
-            self.performance_chart.setText("No data available")
-            self.detailed_performance_chart.setText("No data available")
-            self.asset_type_chart.setText("No data available")
-            self.sector_chart.setText("No data available")
+            self.restyle(self.total_pl_amount, sign='gain')
+            
+            self._dashboard_allocation = None
+            self.set_row_texts(self.allocation_rows, ["No data available"])
+            self.dashboard_performance_chart.setText("No data available")
+            # Charts on tabs that have not been opened yet are still None
+            if self.detailed_performance_chart is not None:
+                self.detailed_performance_chart.setText("No data available")
+            if self.asset_type_chart is not None:
+                self.draw_allocation_bars(self.asset_type_chart, "Asset Allocation", [], [], [])
+                self.draw_allocation_bars(self.sector_chart, "Sector Allocation", [], [], [])
             
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error clearing dashboard: {str(e)}")
             print(f"Error clearing dashboard: {str(e)}")
             
-    def update_allocation_charts(self, asset_allocation, sector_allocation):
-        """Update the allocation charts with proper error handling."""
+    def update_dashboard_allocation_charts(self, asset_allocation, sector_allocation):
+        """Update the dashboard allocation charts with proper error handling."""
         try:
+            if self.asset_type_chart is None:
+                return  # Allocation tab not built yet
             # Update asset type allocation
             total = sum(asset_allocation.values())
             if total > 0:
@@ -1933,13 +2156,9 @@ class PortfolioTracker(QMainWindow):
                         asset_labels.append(asset_type.replace('_', ' ').title())
                         asset_values.append(value / total * 100)
                         
-                # TODO: Create and display pie chart for asset allocation
-                self.asset_type_chart.setText(
-                    "Asset Allocation:\n" +
-                    "\n".join(f"{label}: {value:.1f}%" for label, value in zip(asset_labels, asset_values))
-                )
+                self.draw_allocation_bars(self.asset_type_chart, "Asset Allocation", asset_labels, asset_values, asset_colors)
             else:
-                self.asset_type_chart.setText("No asset allocation data available")
+                self.draw_allocation_bars(self.asset_type_chart, "Asset Allocation", [], [], [])
                 
             # Update sector allocation
             total = sum(sector_allocation.values())
@@ -1963,29 +2182,108 @@ class PortfolioTracker(QMainWindow):
                         sector_labels.append(sector)
                         sector_values.append(value / total * 100)
                         
-                # TODO: Create and display pie chart for sector allocation
-                self.sector_chart.setText(
-                    "Sector Allocation:\n" +
-                    "\n".join(f"{label}: {value:.1f}%" for label, value in zip(sector_labels, sector_values))
-                )
+                self.draw_allocation_bars(self.sector_chart, "Sector Allocation", sector_labels, sector_values, sector_colors)
             else:
-                self.sector_chart.setText("No sector allocation data available")
+                self.draw_allocation_bars(self.sector_chart, "Sector Allocation", [], [], [])
                 
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error updating allocation charts: {str(e)}")
             print(f"Error updating allocation charts: {str(e)}")
             
-    def update_performance_chart(self, portfolio_name):
-        """Update the performance chart with proper error handling."""
+    def set_row_texts(self, rows: List[QLabel], texts: List[str]):
+        """Show texts in a fixed pool of label rows, touching only rows whose text changes and hiding the rest."""
+        for i, row in enumerate(rows):
+            text = texts[i] if i < len(texts) else ""
+            if row.text() != text:
+                row.setText(text)
+            row.setVisible(bool(text))
+
+    def draw_allocation_bars(self, canvas: FigureCanvas, title: str, labels: List[str], values: List[float],
+                             colors: List[str]):
+        """Plot allocation percentages as horizontal bars; with unchanged categories only the bar lengths are updated."""
+        labels = tuple(labels)
+        previous = self._allocation_bars.get(canvas)
+        if previous is not None and previous[0] == labels:
+            for bar, value in zip(previous[1], values):
+                bar.set_width(value)
+        else:
+            canvas.figure.clear()
+            ax = canvas.figure.add_subplot(111)
+            ax.set_facecolor('#2D2D2D')
+            ax.set_title(title, color='white')
+            if labels:
+                bars = ax.barh(labels, values, color=[colors[i % len(colors)] for i in range(len(labels))])
+                ax.set_xlim(0, 100)
+                ax.invert_yaxis()  # Largest category first
+                ax.tick_params(colors='white')
+                ax.set_xlabel('% of value', color='white')
+            else:
+                bars = []
+                ax.text(0.5, 0.5, 'No Data', ha='center', va='center', color='white', transform=ax.transAxes)
+                ax.set_axis_off()
+            canvas.figure.tight_layout()
+            self._allocation_bars[canvas] = (labels, bars)
+        canvas.draw_idle()
+
+    def update_dashboard_performance_chart(self, portfolio_name):
+        """Update the dashboard performance chart with proper error handling."""
         try:
             # TODO: Implement performance chart using historical data
-            self.performance_chart.setText("Performance chart will be implemented")
-            self.detailed_performance_chart.setText("Detailed performance chart will be implemented")
+            self.dashboard_performance_chart.setText("Performance chart will be implemented")
+            if self.detailed_performance_chart is not None:
+                self.detailed_performance_chart.setText("Detailed performance chart will be implemented")
             
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error updating performance chart: {str(e)}")
             print(f"Error updating performance chart: {str(e)}")
 
+    def update_performance_metrics(self, portfolio_name: str):
+        """Fill the dashboard metric cards from a year of daily closes for the portfolio's stocks."""
+        try:
+            if not self.performance_metric_labels:
+                return  # Performance tab not built yet; skip the year-long download
+            holdings = tuple(sorted(
+                (stock['ticker'], float(stock.get('quantity', 0)))
+                for stock in self.portfolios[portfolio_name].get('stocks', []) if stock.get('ticker')
+            ))
+            if not holdings:
+                return
+            key = (portfolio_name, holdings, datetime.now().date())
+            self._metrics_key = key
+            if key in self._metrics_cache:
+                self._show_performance_metrics(self._metrics_cache[key])
+            elif key not in self._metrics_pending:
+                # The year-long download runs on the pool; the cards fill in when it lands
+                self._metrics_pending.add(key)
+                worker = PerformanceMetricsWorker(key, holdings)
+                worker.signals.metrics_ready.connect(self._on_performance_metrics)
+                worker.signals.error_signal.connect(self._on_performance_metrics_error)
+                self.pool.start(worker)
+                
+        except Exception as e:
+            self.log_audit_entry("ERROR", portfolio_name, "", f"Error updating performance metrics: {str(e)}")
+            print(f"Error updating performance metrics: {str(e)}")
+
+    def _on_performance_metrics(self, key: tuple, metrics: dict):
+        """Slot receiving PerformanceMetricsWorker results; only the latest request reaches the cards."""
+        self._metrics_pending.discard(key)
+        self._metrics_cache[key] = metrics
+        if key == self._metrics_key:
+            self._show_performance_metrics(metrics)
+
+    def _on_performance_metrics_error(self, key: tuple, message: str):
+        self._metrics_pending.discard(key)
+        self.log_audit_entry("ERROR", key[0], "", f"Error updating performance metrics: {message}")
+
+    def _show_performance_metrics(self, metrics: Dict[str, float]):
+        """Write metric values into the Performance tab's cards."""
+        for name, value in metrics.items():
+            label = self.performance_metric_labels.get(name)
+            if label is None:
+                continue
+            label.setText(f"{value:.2f}" if name in ('Sharpe Ratio', 'Beta') else f"{value * 100:.2f}%")
+            self.restyle(label, sign='gain' if value >= 0 else 'loss')
+
     def create_market_analysis(self):
         """Create the market analysis page"""
         page = QWidget()
@@ -1995,40 +2293,25 @@ class PortfolioTracker(QMainWindow):
         
         # Title
         title = QLabel("Market Analysis")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; color: #64B5F6;")
+        title.setProperty('role', 'market-title')
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
         # Create tab widget
         self.market_tabs = QTabWidget()
-        self.market_tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #333;
-                background: #1E1E1E;
-            }
-            QTabBar::tab {
-                background: #2D2D2D;
-                color: white;
-                padding: 8px 20px;
-                border: 1px solid #333;
-            }
-            QTabBar::tab:selected {
-                background: #64B5F6;
-                color: black;
-            }
-        """)
+        self.market_tabs.setProperty('role', 'market')
         
         # Portfolio selection
         portfolio_frame = QFrame()
         portfolio_frame.setFrameShape(QFrame.StyledPanel)
-        portfolio_frame.setStyleSheet("background-color: #1E1E1E; border-radius: 5px; padding: 10px;")
+        portfolio_frame.setProperty('role', 'market-bar')
         portfolio_layout = QHBoxLayout(portfolio_frame)
         
         portfolio_label = QLabel("Selected Portfolio:")
-        portfolio_label.setStyleSheet("font-size: 14px;")
+        portfolio_label.setProperty('role', 'market-label')
         self.market_portfolio_combo = QComboBox()
-        self.market_portfolio_combo.setStyleSheet("font-size: 14px; min-width: 200px;")
-        self.market_portfolio_combo.addItems(sorted(self.portfolios.keys()))
+        self.market_portfolio_combo.setProperty('role', 'market-combo')
+        self.market_portfolio_combo.addItems(self._sorted_portfolio_names)
         self.market_portfolio_combo.currentTextChanged.connect(self.refresh_market_data)
         
         portfolio_layout.addWidget(portfolio_label)
@@ -2044,25 +2327,7 @@ class PortfolioTracker(QMainWindow):
         
         # Summary metrics
         metrics_frame = QFrame()
-        metrics_frame.setStyleSheet("""
-            QFrame {
-                background-color: #2D2D2D;
-                border-radius: 5px;
-                padding: 15px;
-            }
-            QLabel {
-                color: white;
-                font-size: 14px;
-            }
-            QLabel[class="metric-label"] {
-                color: #888;
-                font-size: 12px;
-            }
-            QLabel[class="metric-value"] {
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
+        metrics_frame.setProperty('role', 'metrics')
         metrics_layout = QGridLayout()
         
         # Create metric labels
@@ -2092,11 +2357,11 @@ class PortfolioTracker(QMainWindow):
         
         # Holdings table
         holdings_frame = QFrame()
-        holdings_frame.setStyleSheet("background-color: #2D2D2D; border-radius: 5px;")
+        holdings_frame.setProperty('role', 'panel')
         holdings_layout = QVBoxLayout()
         
         holdings_label = QLabel("Current Holdings")
-        holdings_label.setStyleSheet("font-size: 16px; font-weight: bold; color: white;")
+        holdings_label.setProperty('role', 'panel-title')
         holdings_layout.addWidget(holdings_label)
         
         self.holdings_table = QTableWidget()
@@ -2106,20 +2371,7 @@ class PortfolioTracker(QMainWindow):
         ])
         self.holdings_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.holdings_table.verticalHeader().setVisible(False)
-        self.holdings_table.setStyleSheet("""
-            QTableWidget {
-                background-color: #1E1E1E;
-                color: white;
-                gridline-color: #333;
-                border: none;
-            }
-            QHeaderView::section {
-                background-color: #2D2D2D;
-                color: white;
-                padding: 5px;
-                border: 1px solid #333;
-            }
-        """)
+        self.holdings_table.setProperty('role', 'holdings')
         
         holdings_layout.addWidget(self.holdings_table)
         holdings_frame.setLayout(holdings_layout)
@@ -2134,11 +2386,11 @@ class PortfolioTracker(QMainWindow):
         
         # Performance chart
         chart_frame = QFrame()
-        chart_frame.setStyleSheet("background-color: #2D2D2D; border-radius: 5px;")
+        chart_frame.setProperty('role', 'panel')
         chart_layout = QVBoxLayout()
         
         chart_label = QLabel("Portfolio Performance")
-        chart_label.setStyleSheet("font-size: 16px; font-weight: bold; color: white;")
+        chart_label.setProperty('role', 'panel-title')
         chart_layout.addWidget(chart_label)
         
         self.performance_chart = FigureCanvas(Figure(figsize=(8, 4)))
@@ -2157,14 +2409,14 @@ class PortfolioTracker(QMainWindow):
         
         # Allocation charts
         charts_frame = QFrame()
-        charts_frame.setStyleSheet("background-color: #2D2D2D; border-radius: 5px;")
+        charts_frame.setProperty('role', 'panel')
         charts_layout = QHBoxLayout()
         
         # Asset type pie chart
         pie_frame = QFrame()
         pie_layout = QVBoxLayout()
         pie_label = QLabel("Asset Allocation")
-        pie_label.setStyleSheet("font-size: 16px; font-weight: bold; color: white;")
+        pie_label.setProperty('role', 'panel-title')
         pie_layout.addWidget(pie_label)
         
         self.asset_pie_chart = FigureCanvas(Figure(figsize=(4, 4)))
@@ -2178,7 +2430,7 @@ class PortfolioTracker(QMainWindow):
         sector_frame = QFrame()
         sector_layout = QVBoxLayout()
         sector_label = QLabel("Sector Allocation")
-        sector_label.setStyleSheet("font-size: 16px; font-weight: bold; color: white;")
+        sector_label.setProperty('role', 'panel-title')
         sector_layout.addWidget(sector_label)
         
         self.sector_pie_chart = FigureCanvas(Figure(figsize=(4, 4)))
@@ -2198,38 +2450,14 @@ class PortfolioTracker(QMainWindow):
         
         # Refresh button
         refresh_btn = QPushButton("Refresh Market Data")
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 3px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        refresh_btn.setProperty('role', 'refresh')
         refresh_btn.clicked.connect(self.refresh_market_data)
         layout.addWidget(refresh_btn)
         
         # Back button
         back_btn = QPushButton("Back to Main Menu")
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #757575;
-                color: white;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 3px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #616161;
-            }
-        """)
-        back_btn.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(0))
+        back_btn.setProperty('role', 'market-back')
+        back_btn.clicked.connect(self.show_main_menu)
         layout.addWidget(back_btn)
         
         page.setLayout(layout)
@@ -2248,30 +2476,12 @@ class PortfolioTracker(QMainWindow):
             header_layout = QHBoxLayout()
             
             back_button = QPushButton("← Back to Menu")
-            back_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #3daee9;
-                }
-            """)
+            back_button.setProperty('role', 'back')
             back_button.clicked.connect(self.show_main_menu)
             header_layout.addWidget(back_button)
             
             title_label = QLabel("Data Operations")
-            title_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 24px;
-                    font-weight: bold;
-                }
-            """)
+            title_label.setProperty('role', 'title')
             title_label.setAlignment(Qt.AlignCenter)
             header_layout.addWidget(title_label)
             
@@ -2285,96 +2495,31 @@ class PortfolioTracker(QMainWindow):
             
             # Export data button
             export_button = QPushButton("Export Portfolio Data")
-            export_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #27ae60;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 15px;
-                    font-size: 16px;
-                    min-width: 200px;
-                }
-                QPushButton:hover {
-                    background-color: #219a52;
-                }
-            """)
+            export_button.setProperty('role', 'export')
             export_button.clicked.connect(self.export_portfolio_data)
             operations_grid.addWidget(export_button, 0, 0)
             
             # Import data button
             import_button = QPushButton("Import Portfolio Data")
-            import_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2980b9;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 15px;
-                    font-size: 16px;
-                    min-width: 200px;
-                }
-                QPushButton:hover {
-                    background-color: #2471a3;
-                }
-            """)
+            import_button.setProperty('role', 'import')
             import_button.clicked.connect(self.import_portfolio_data)
             operations_grid.addWidget(import_button, 0, 1)
             
             # Create backup button
             backup_button = QPushButton("Create Backup")
-            backup_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #8e44ad;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 15px;
-                    font-size: 16px;
-                    min-width: 200px;
-                }
-                QPushButton:hover {
-                    background-color: #7d3c98;
-                }
-            """)
+            backup_button.setProperty('role', 'backup')
             backup_button.clicked.connect(self.create_backup)
             operations_grid.addWidget(backup_button, 1, 0)
             
             # Restore backup button
             restore_button = QPushButton("Restore from Backup")
-            restore_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #d35400;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 15px;
-                    font-size: 16px;
-                    min-width: 200px;
-                }
-                QPushButton:hover {
-                    background-color: #c0392b;
-                }
-            """)
+            restore_button.setProperty('role', 'restore')
             restore_button.clicked.connect(self.restore_from_backup)
             operations_grid.addWidget(restore_button, 1, 1)
             
             # Clear data button
             clear_button = QPushButton("Clear All Data")
-            clear_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #c0392b;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 15px;
-                    font-size: 16px;
-                    min-width: 200px;
-                }
-                QPushButton:hover {
-                    background-color: #a93226;
-                }
-            """)
+            clear_button.setProperty('role', 'clear')
             clear_button.clicked.connect(self.clear_all_data)
             operations_grid.addWidget(clear_button, 2, 0, 1, 2)
             
@@ -2382,14 +2527,7 @@ class PortfolioTracker(QMainWindow):
             
             # Add status label
             self.data_ops_status = QLabel("")
-            self.data_ops_status.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 14px;
-                    padding: 10px;
-                    border-radius: 5px;
-                }
-            """)
+            self.data_ops_status.setProperty('role', 'status')
             self.data_ops_status.setAlignment(Qt.AlignCenter)
             layout.addWidget(self.data_ops_status)
             
@@ -2403,8 +2541,8 @@ class PortfolioTracker(QMainWindow):
     def show_data_operations(self):
         """Show the data operations page."""
         try:
-            self.stacked_widget.setCurrentIndex(9)
-            self.data_ops_status.setText("")
+            if self.show_page('data_operations'):
+                self.data_ops_status.setText("")
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error showing data operations: {str(e)}")
             QMessageBox.warning(self, "Error", f"Failed to show data operations: {str(e)}")
@@ -2429,34 +2567,18 @@ class PortfolioTracker(QMainWindow):
                 shutil.copy2(file_path, backup_path)
                 
             # Export data
-            with open(file_path, 'w') as f:
-                json.dump(self.portfolios, f, indent=4)
+            with open(file_path, 'wb') as f:
+                f.write(dump_json(self.portfolios))
                 
             self.data_ops_status.setText("Portfolio data exported successfully")
-            self.data_ops_status.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    background-color: #27ae60;
-                    font-size: 14px;
-                    padding: 10px;
-                    border-radius: 5px;
-                }
-            """)
+            self.restyle(self.data_ops_status, status='ok')
             
             self.log_audit_entry("INFO", "", "", "Portfolio data exported successfully")
             
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error exporting portfolio data: {str(e)}")
             self.data_ops_status.setText(f"Error exporting portfolio data: {str(e)}")
-            self.data_ops_status.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    background-color: #c0392b;
-                    font-size: 14px;
-                    padding: 10px;
-                    border-radius: 5px;
-                }
-            """)
+            self.restyle(self.data_ops_status, status='error')
             QMessageBox.warning(self, "Error", f"Failed to export portfolio data: {str(e)}")
             
     def import_portfolio_data(self):
@@ -2491,8 +2613,8 @@ class PortfolioTracker(QMainWindow):
                 shutil.copy2("Portfolios.json", backup_path)
                 
             # Import data
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = load_json(f.read())
                 
             # Validate data structure
             if not isinstance(data, dict):
@@ -2500,38 +2622,25 @@ class PortfolioTracker(QMainWindow):
                 
             # Update portfolios
             self.portfolios = data
+            self._reset_portfolio_names()
+            self.mark_portfolios_dirty()
             
             # Save data
             self.save_data()
             
             self.data_ops_status.setText("Portfolio data imported successfully")
-            self.data_ops_status.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    background-color: #27ae60;
-                    font-size: 14px;
-                    padding: 10px;
-                    border-radius: 5px;
-                }
-            """)
+            self.restyle(self.data_ops_status, status='ok')
             
             self.log_audit_entry("INFO", "", "", "Portfolio data imported successfully")
             
             # Refresh UI
+            self.invalidate_quotes()
             self.refresh_all_tables()
             
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error importing portfolio data: {str(e)}")
             self.data_ops_status.setText(f"Error importing portfolio data: {str(e)}")
-            self.data_ops_status.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    background-color: #c0392b;
-                    font-size: 14px;
-                    padding: 10px;
-                    border-radius: 5px;
-                }
-            """)
+            self.restyle(self.data_ops_status, status='error')
             QMessageBox.warning(self, "Error", f"Failed to import portfolio data: {str(e)}")
             
     def create_backup(self):
@@ -2551,34 +2660,19 @@ class PortfolioTracker(QMainWindow):
             if not file_path:
                 return
                 
-            # Create backup
-            shutil.copy2("Portfolios.json", file_path)
+            # Create backup once pending edits have reached the data file
+            self.flush_saves()
+            shutil.copy2(self.data_file, file_path)
             
             self.data_ops_status.setText("Backup created successfully")
-            self.data_ops_status.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    background-color: #27ae60;
-                    font-size: 14px;
-                    padding: 10px;
-                    border-radius: 5px;
-                }
-            """)
+            self.restyle(self.data_ops_status, status='ok')
             
             self.log_audit_entry("INFO", "", "", f"Backup created: {file_path}")
             
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error creating backup: {str(e)}")
             self.data_ops_status.setText(f"Error creating backup: {str(e)}")
-            self.data_ops_status.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    background-color: #c0392b;
-                    font-size: 14px;
-                    padding: 10px;
-                    border-radius: 5px;
-                }
-            """)
+            self.restyle(self.data_ops_status, status='error')
             QMessageBox.warning(self, "Error", f"Failed to create backup: {str(e)}")
             
     def restore_from_backup(self):
@@ -2619,33 +2713,18 @@ class PortfolioTracker(QMainWindow):
             self.load_data()
             
             self.data_ops_status.setText("Portfolio data restored successfully")
-            self.data_ops_status.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    background-color: #27ae60;
-                    font-size: 14px;
-                    padding: 10px;
-                    border-radius: 5px;
-                }
-            """)
+            self.restyle(self.data_ops_status, status='ok')
             
             self.log_audit_entry("INFO", "", "", f"Portfolio data restored from: {file_path}")
             
             # Refresh UI
+            self.invalidate_quotes()
             self.refresh_all_tables()
             
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error restoring from backup: {str(e)}")
             self.data_ops_status.setText(f"Error restoring from backup: {str(e)}")
-            self.data_ops_status.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    background-color: #c0392b;
-                    font-size: 14px;
-                    padding: 10px;
-                    border-radius: 5px;
-                }
-            """)
+            self.restyle(self.data_ops_status, status='error')
             QMessageBox.warning(self, "Error", f"Failed to restore from backup: {str(e)}")
             
     def clear_all_data(self):
@@ -2671,45 +2750,36 @@ class PortfolioTracker(QMainWindow):
                 
             # Clear data
             self.portfolios = {}
+            self._reset_portfolio_names()
             self.save_data()
             
             self.data_ops_status.setText("All portfolio data cleared successfully")
-            self.data_ops_status.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    background-color: #27ae60;
-                    font-size: 14px;
-                    padding: 10px;
-                    border-radius: 5px;
-                }
-            """)
+            self.restyle(self.data_ops_status, status='ok')
             
             self.log_audit_entry("INFO", "", "", "All portfolio data cleared")
             
             # Refresh UI
+            self.invalidate_quotes()
             self.refresh_all_tables()
             
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error clearing portfolio data: {str(e)}")
             self.data_ops_status.setText(f"Error clearing portfolio data: {str(e)}")
-            self.data_ops_status.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    background-color: #c0392b;
-                    font-size: 14px;
-                    padding: 10px;
-                    border-radius: 5px;
-                }
-            """)
+            self.restyle(self.data_ops_status, status='error')
             QMessageBox.warning(self, "Error", f"Failed to clear portfolio data: {str(e)}")
             
     def refresh_all_tables(self):
         """Refresh all tables in the application."""
         try:
-            self.refresh_stock_table()
-            self.refresh_fund_table()
-            self.refresh_dashboard()
-            self.refresh_audit_log()
+            # Pages that have not been opened yet are built fresh on their first visit
+            if 'stock_operations' in self._page_indices:
+                self.refresh_stock_table()
+            if 'mutual_fund_operations' in self._page_indices:
+                self.refresh_fund_table()
+            if 'dashboard' in self._page_indices:
+                self.refresh_dashboard()
+            if 'audit_history' in self._page_indices:
+                self.refresh_audit_log()
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error refreshing tables: {str(e)}")
             print(f"Error refreshing tables: {str(e)}")
@@ -2727,30 +2797,12 @@ class PortfolioTracker(QMainWindow):
             header_layout = QHBoxLayout()
             
             back_button = QPushButton("← Back to Menu")
-            back_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #3daee9;
-                }
-            """)
+            back_button.setProperty('role', 'back')
             back_button.clicked.connect(self.show_main_menu)
             header_layout.addWidget(back_button)
             
             title_label = QLabel("Audit History")
-            title_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 24px;
-                    font-weight: bold;
-                }
-            """)
+            title_label.setProperty('role', 'title')
             title_label.setAlignment(Qt.AlignCenter)
             header_layout.addWidget(title_label)
             
@@ -2763,33 +2815,11 @@ class PortfolioTracker(QMainWindow):
             
             # Action type filter
             action_label = QLabel("Action Type:")
-            action_label.setStyleSheet("color: white; font-size: 14px;")
+            action_label.setProperty('role', 'field')
             filter_layout.addWidget(action_label)
             
             self.audit_action_combo = QComboBox()
-            self.audit_action_combo.setStyleSheet("""
-                QComboBox {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 5px;
-                    min-width: 150px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                }
-                QComboBox::down-arrow {
-                    image: url(down_arrow.png);
-                    width: 12px;
-                    height: 12px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #2b2b2b;
-                    color: white;
-                    selection-background-color: #3daee9;
-                }
-            """)
+            self.audit_action_combo.setProperty('role', 'filter')
             self.audit_action_combo.addItem("All Actions")
             self.audit_action_combo.addItems([
                 "ADD_STOCK", "MODIFY_STOCK", "DELETE_STOCK",
@@ -2803,89 +2833,33 @@ class PortfolioTracker(QMainWindow):
             
             # Portfolio filter
             portfolio_label = QLabel("Portfolio:")
-            portfolio_label.setStyleSheet("color: white; font-size: 14px;")
+            portfolio_label.setProperty('role', 'field')
             filter_layout.addWidget(portfolio_label)
             
             self.audit_portfolio_combo = QComboBox()
-            self.audit_portfolio_combo.setStyleSheet("""
-                QComboBox {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 5px;
-                    min-width: 150px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                }
-                QComboBox::down-arrow {
-                    image: url(down_arrow.png);
-                    width: 12px;
-                    height: 12px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #2b2b2b;
-                    color: white;
-                    selection-background-color: #3daee9;
-                }
-            """)
+            self.audit_portfolio_combo.setProperty('role', 'filter')
             self.audit_portfolio_combo.addItem("All Portfolios")
             self.audit_portfolio_combo.currentTextChanged.connect(self.refresh_audit_log)
             filter_layout.addWidget(self.audit_portfolio_combo)
             
             # Date range filter
             date_label = QLabel("Date Range:")
-            date_label.setStyleSheet("color: white; font-size: 14px;")
+            date_label.setProperty('role', 'field')
             filter_layout.addWidget(date_label)
             
             self.audit_date_from = QDateEdit()
-            self.audit_date_from.setStyleSheet("""
-                QDateEdit {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 5px;
-                    min-width: 120px;
-                }
-                QDateEdit::drop-down {
-                    border: none;
-                }
-                QDateEdit::down-arrow {
-                    image: url(down_arrow.png);
-                    width: 12px;
-                    height: 12px;
-                }
-            """)
+            self.audit_date_from.setProperty('role', 'filter')
             self.audit_date_from.setCalendarPopup(True)
             self.audit_date_from.setDate(QDate.currentDate().addDays(-30))
             self.audit_date_from.dateChanged.connect(self.refresh_audit_log)
             filter_layout.addWidget(self.audit_date_from)
             
             to_label = QLabel("to")
-            to_label.setStyleSheet("color: white; font-size: 14px;")
+            to_label.setProperty('role', 'field')
             filter_layout.addWidget(to_label)
             
             self.audit_date_to = QDateEdit()
-            self.audit_date_to.setStyleSheet("""
-                QDateEdit {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 5px;
-                    min-width: 120px;
-                }
-                QDateEdit::drop-down {
-                    border: none;
-                }
-                QDateEdit::down-arrow {
-                    image: url(down_arrow.png);
-                    width: 12px;
-                    height: 12px;
-                }
-            """)
+            self.audit_date_to.setProperty('role', 'filter')
             self.audit_date_to.setCalendarPopup(True)
             self.audit_date_to.setDate(QDate.currentDate())
             self.audit_date_to.dateChanged.connect(self.refresh_audit_log)
@@ -2893,53 +2867,18 @@ class PortfolioTracker(QMainWindow):
             
             # Clear filters button
             clear_button = QPushButton("Clear Filters")
-            clear_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2b2b2b;
-                    color: white;
-                    border: 2px solid #3daee9;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #3daee9;
-                }
-            """)
+            clear_button.setProperty('role', 'back')
             clear_button.clicked.connect(self.clear_audit_filter)
             filter_layout.addWidget(clear_button)
             
             layout.addLayout(filter_layout)
             
             # Create audit log table
-            self.audit_table = QTableWidget()
-            self.audit_table.setStyleSheet("""
-                QTableWidget {
-                    background-color: #2b2b2b;
-                    color: white;
-                    gridline-color: #3daee9;
-                    border: none;
-                }
-                QTableWidget::item {
-                    padding: 5px;
-                }
-                QTableWidget::item:selected {
-                    background-color: #3daee9;
-                }
-                QHeaderView::section {
-                    background-color: #2b2b2b;
-                    color: white;
-                    padding: 5px;
-                    border: 1px solid #3daee9;
-                }
-            """)
-            
-            # Set up table columns
-            columns = [
-                "Timestamp", "Action", "Portfolio", "Symbol/ISIN", "Details"
-            ]
-            self.audit_table.setColumnCount(len(columns))
-            self.audit_table.setHorizontalHeaderLabels(columns)
+            # Model-backed view: rows are parsed from the JSONL log only when painted
+            self.audit_model = AuditModel(parent=self)
+            self.audit_table = QTableView()
+            self.audit_table.setModel(self.audit_model)
+            self.audit_table.setProperty('role', 'table')
             
             # Set column widths
             self.audit_table.setColumnWidth(0, 150)  # Timestamp
@@ -2948,30 +2887,15 @@ class PortfolioTracker(QMainWindow):
             self.audit_table.setColumnWidth(3, 150)  # Symbol/ISIN
             self.audit_table.setColumnWidth(4, 400)  # Details
             
-            # Enable sorting
-            self.audit_table.setSortingEnabled(True)
-            
             # Enable selection
-            self.audit_table.setSelectionBehavior(QTableWidget.SelectRows)
-            self.audit_table.setSelectionMode(QTableWidget.SingleSelection)
+            self.audit_table.setSelectionBehavior(QTableView.SelectRows)
+            self.audit_table.setSelectionMode(QTableView.SingleSelection)
             
             layout.addWidget(self.audit_table)
             
             # Add export button
             export_button = QPushButton("Export Audit Log")
-            export_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #27ae60;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 8px 15px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #219a52;
-                }
-            """)
+            export_button.setProperty('role', 'add')
             export_button.clicked.connect(self.export_audit_log)
             layout.addWidget(export_button)
             
@@ -2988,8 +2912,8 @@ class PortfolioTracker(QMainWindow):
     def show_audit_history(self):
         """Show the audit history page."""
         try:
-            self.stacked_widget.setCurrentIndex(10)
-            self.refresh_audit_log()
+            if self.show_page('audit_history'):
+                self.refresh_audit_log()
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error showing audit history: {str(e)}")
             QMessageBox.warning(self, "Error", f"Failed to show audit history: {str(e)}")
@@ -3015,91 +2939,27 @@ class PortfolioTracker(QMainWindow):
             date_from = self.audit_date_from.date().toPyDate()
             date_to = self.audit_date_to.date().toPyDate()
             
-            # Clear table
-            self.audit_table.setRowCount(0)
-            
             # Update portfolio combo box
             self.audit_portfolio_combo.clear()
             self.audit_portfolio_combo.addItem("All Portfolios")
-            self.audit_portfolio_combo.addItems(sorted(self.portfolios.keys()))
+            self.audit_portfolio_combo.addItems(self._sorted_portfolio_names)
             if portfolio_filter != "All Portfolios":
                 self.audit_portfolio_combo.setCurrentText(portfolio_filter)
                 
-            # Load audit log
-            try:
-                with open("audit_log.json", 'r') as f:
-                    audit_log = json.load(f)
-            except FileNotFoundError:
-                audit_log = []
-            except json.JSONDecodeError:
-                self.log_audit_entry("ERROR", "", "", "Invalid audit log file format")
-                audit_log = []
+            # Timestamps are 'YYYY-MM-DD HH:MM:SS', so the date range compares as ISO strings
+            date_from_text = date_from.isoformat()
+            date_to_text = date_to.isoformat()
+            
+            def matches(entry):
+                if action_filter != "All Actions" and entry.get('action') != action_filter:
+                    return False
+                if portfolio_filter != "All Portfolios" and entry.get('portfolio') != portfolio_filter:
+                    return False
+                return date_from_text <= str(entry.get('timestamp', ''))[:10] <= date_to_text
                 
-            # Filter and sort entries
-            filtered_entries = []
-            for entry in audit_log:
-                try:
-                    # Parse timestamp
-                    timestamp = datetime.strptime(entry.get('timestamp', ''), '%Y-%m-%d %H:%M:%S')
-                    entry_date = timestamp.date()
-                    
-                    # Apply filters
-                    if action_filter != "All Actions" and entry.get('action') != action_filter:
-                        continue
-                    if portfolio_filter != "All Portfolios" and entry.get('portfolio') != portfolio_filter:
-                        continue
-                    if not (date_from <= entry_date <= date_to):
-                        continue
-                        
-                    filtered_entries.append(entry)
-                    
-                except ValueError as e:
-                    print(f"Error parsing timestamp in audit log: {str(e)}")
-                    continue
-                    
-            # Sort entries by timestamp (newest first)
-            filtered_entries.sort(
-                key=lambda x: datetime.strptime(x.get('timestamp', ''), '%Y-%m-%d %H:%M:%S'),
-                reverse=True
-            )
+            # Index matching lines newest first; the view parses rows as they scroll in
+            self.audit_model.reload(matches)
             
-            # Add entries to table
-            for entry in filtered_entries:
-                try:
-                    row = self.audit_table.rowCount()
-                    self.audit_table.insertRow(row)
-                    
-                    # Add items to the table
-                    items = [
-                        entry.get('timestamp', ''),
-                        entry.get('action', ''),
-                        entry.get('portfolio', ''),
-                        entry.get('symbol', ''),
-                        entry.get('details', '')
-                    ]
-                    
-                    for col, text in enumerate(items):
-                        item = QTableWidgetItem(text)
-                        item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                        
-                        # Color action types
-                        if col == 1:  # Action column
-                            action = text.upper()
-                            if action in ['ERROR', 'DELETE_STOCK', 'DELETE_FUND', 'DELETE_PORTFOLIO', 'CLEAR_DATA']:
-                                item.setForeground(QColor('#f44336'))  # Red
-                            elif action in ['WARNING', 'MODIFY_STOCK', 'MODIFY_FUND', 'MODIFY_PORTFOLIO']:
-                                item.setForeground(QColor('#FFC107'))  # Yellow
-                            elif action in ['INFO', 'ADD_STOCK', 'ADD_FUND', 'ADD_PORTFOLIO']:
-                                item.setForeground(QColor('#4CAF50'))  # Green
-                            else:
-                                item.setForeground(QColor('#2196F3'))  # Blue
-                                
-                        self.audit_table.setItem(row, col, item)
-                        
-                except Exception as e:
-                    print(f"Error adding audit entry to table: {str(e)}")
-                    continue
-                    
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error refreshing audit log: {str(e)}")
             QMessageBox.warning(self, "Error", f"Failed to refresh audit log: {str(e)}")
@@ -3124,15 +2984,8 @@ class PortfolioTracker(QMainWindow):
             date_from = self.audit_date_from.date().toPyDate()
             date_to = self.audit_date_to.date().toPyDate()
             
-            # Load audit log
-            try:
-                with open("audit_log.json", 'r') as f:
-                    audit_log = json.load(f)
-            except FileNotFoundError:
-                audit_log = []
-            except json.JSONDecodeError:
-                self.log_audit_entry("ERROR", "", "", "Invalid audit log file format")
-                audit_log = []
+            # Stream audit log entries line by line
+            audit_log = iter_audit_log()
                 
             # Filter entries
             filtered_entries = []
@@ -3279,13 +3132,12 @@ class PortfolioTracker(QMainWindow):
                 print(f"Error calculating fund value: {str(e)}")
                 
         # Calculate sector allocation (stocks only)
-        sector_values = {}
+        sector_values = defaultdict(float)
         for stock in portfolio.get('stocks', []):
             try:
                 if 'current_price' in stock and 'sector' in stock:
                     value = stock['current_price'] * stock['quantity']
-                    sector = stock['sector']
-                    sector_values[sector] = sector_values.get(sector, 0) + value
+                    sector_values[stock['sector']] += value
             except Exception as e:
                 print(f"Error calculating sector value: {str(e)}")
                 
@@ -3330,26 +3182,8 @@ class PortfolioTracker(QMainWindow):
     def show_market_analysis(self):
         """Show the market analysis page."""
         try:
-            # The market analysis page is added last before data operations and audit history, so its index is likely 6 (0-based)
-            # But to be robust, let's find it by looking for the QTabWidget with self.market_tabs
-            for i in range(self.stacked_widget.count()):
-                widget = self.stacked_widget.widget(i)
-                if hasattr(self, 'market_tabs') and hasattr(widget, 'layout'):
-                    layout = widget.layout()
-                    for j in range(layout.count()):
-                        item = layout.itemAt(j)
-                        if item and hasattr(item.widget(), 'objectName'):
-                            if item.widget() is self.market_tabs:
-                                self.stacked_widget.setCurrentIndex(i)
-                                self.refresh_market_data()
-                                return
-            # Fallback: just set to index 6 (if not found)
-            if self.stacked_widget.count() > 6:
-                self.stacked_widget.setCurrentIndex(6)
+            if self.show_page('market_analysis'):
                 self.refresh_market_data()
-            else:
-                self.log_audit_entry("ERROR", "", "", "Market analysis page not found in stacked widget")
-                QMessageBox.warning(self, "Error", "Failed to show market analysis: Page not found")
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error showing market analysis: {str(e)}")
             QMessageBox.warning(self, "Error", f"Failed to show market analysis: {str(e)}")
@@ -3357,56 +3191,11 @@ class PortfolioTracker(QMainWindow):
     def update_stock_table(self, portfolio_name):
         """Update the stock table with current portfolio data."""
         try:
-            self.stock_table.setRowCount(0)  # Clear existing rows
-            if portfolio_name not in self.portfolios:
+            portfolio = self.portfolios.get(portfolio_name)
+            if not isinstance(portfolio, dict) or 'stocks' not in portfolio:
+                self.stock_model.set_holdings([])
                 return
-
-            portfolio = self.portfolios[portfolio_name]
-            if 'stocks' not in portfolio:
-                return
-
-            for stock in portfolio['stocks']:
-                row_position = self.stock_table.rowCount()
-                self.stock_table.insertRow(row_position)
-
-                # Get values with proper error handling
-                name = stock.get('name', 'N/A')
-                ticker = stock.get('ticker', 'N/A')
-                quantity = float(stock.get('quantity', 0))
-                avg_price = float(stock.get('average_price', 0))
-                current_price = float(stock.get('current_price', 0))
-                current_value = float(stock.get('current_value', 0))
-                pl_amount = float(stock.get('pl_amount', 0))
-                pl_percent = float(stock.get('pl_percent', 0))
-
-                # Format numbers for display
-                quantity_str = f"{quantity:,.0f}"
-                avg_price_str = f"₹{avg_price:,.2f}"
-                current_price_str = f"₹{current_price:,.2f}"
-                current_value_str = f"₹{current_value:,.2f}"
-                pl_amount_str = f"₹{pl_amount:,.2f}"
-                pl_percent_str = f"{pl_percent:,.2f}%"
-
-                # Set items in the table
-                self.stock_table.setItem(row_position, 0, QTableWidgetItem(name))
-                self.stock_table.setItem(row_position, 1, QTableWidgetItem(ticker))
-                self.stock_table.setItem(row_position, 2, QTableWidgetItem(quantity_str))
-                self.stock_table.setItem(row_position, 3, QTableWidgetItem(avg_price_str))
-                self.stock_table.setItem(row_position, 4, QTableWidgetItem(current_price_str))
-                self.stock_table.setItem(row_position, 5, QTableWidgetItem(current_value_str))
-                self.stock_table.setItem(row_position, 6, QTableWidgetItem(pl_amount_str))
-                self.stock_table.setItem(row_position, 7, QTableWidgetItem(pl_percent_str))
-
-                # Color the P/L cells based on profit/loss
-                if pl_amount > 0:
-                    self.stock_table.item(row_position, 6).setForeground(QColor('green'))
-                    self.stock_table.item(row_position, 7).setForeground(QColor('green'))
-                elif pl_amount < 0:
-                    self.stock_table.item(row_position, 6).setForeground(QColor('red'))
-                    self.stock_table.item(row_position, 7).setForeground(QColor('red'))
-
-            # Resize columns to content
-            self.stock_table.resizeColumnsToContents()
+            self.load_holdings_table(self.stock_table, self.stock_model, portfolio['stocks'])
             
         except Exception as e:
             self.log_audit_entry("ERROR", "", "", f"Error updating stock table: {str(e)}")